@@ -0,0 +1,1270 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 09:31:17
+ * @modify date 2026-10-18 23:24:10
+ * @desc [
+    Benchmarks for the script's hot paths.
+
+    Run from the repository root:
+        python -m j_script.benchmarks [name ...]
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from .script_objects import DataFrame, Dict, List, Tuple
+from .tableinfo import TableInfo
+
+
+##########
+# Constants
+##########
+
+DIR_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_WORKBOOK = os.path.join(DIR_REPO, 'job_files', 'jobboard_info.xlsx')
+
+
+##########
+# Helpers
+##########
+
+def time_call(func: Callable, repeat: int = 5) -> float:
+    """Returns best wall-clock time of `repeat` calls to func, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def print_results(title: str, keys: Tuple[str], results: List[tuple]) -> None:
+    """Prints benchmark results as a table."""
+    print('>' * 3, title)
+    tbl = TableInfo(keys)
+    tbl.add_entries(results)
+    tbl.print_info(show_records_col= False)
+
+
+def make_location_keys() -> Dict[str, Dict[int, str]]:
+    """Returns {location column: {int: name}} for synthetic catalogs."""
+    from . import constants
+    sizes = {constants.COL_COUNTRY: 4, constants.COL_STATE: 51, constants.COL_CITY: 200}
+    return {
+        key: {i: (f"{key} {i}" if i else None) for i in range(size)}
+        for key, size in sizes.items()
+    }
+
+
+def make_location_columns(num_rows: int, location_keys: Dict[str, Dict[int, str]], seed: int = 0, num_distinct: int = 2_000) -> Dict[str, list]:
+    """Returns synthetic location columns: ints, & comma separated ints.
+
+    Rows are drawn from num_distinct (country, state, city) cells, as a
+    catalog repeats the same location combinations.
+    """
+    import random
+    rand = random.Random(seed)
+
+    def make_cell(size: int):
+        if rand.random() < 0.25:
+            return rand.randrange(size)
+        return ', '.join(str(rand.randrange(1, size)) for _ in range(rand.randint(1, 4)))
+
+    distinct = [
+        {key: make_cell(len(int_str)) for key, int_str in location_keys.items()}
+        for _ in range(num_distinct)
+    ]
+    rows = [rand.choice(distinct) for _ in range(num_rows)]
+    return {key: [row[key] for row in rows] for key in location_keys}
+
+
+def make_url_column(num_rows: int, seed: int = 0) -> List[str]:
+    """Returns synthetic url cells: 1-4 mixed case urls, with padding, per cell."""
+    import random
+    from . import constants
+    rand = random.Random(seed)
+    return [
+        constants.DELIMITER_URL.join(
+            f" HTTPS://www.Board{rand.randrange(10 ** 6)}.com/Jobs?q={rand.randrange(100)} "
+            for _ in range(rand.randint(1, 4)))
+        for _ in range(num_rows)
+    ]
+
+
+def make_jobboard_df(num_rows: int, seed: int = 0) -> DataFrame:
+    """Returns synthetic df of cleaned jobboards, indexed by id, as df_methods.get_df_jobboards()."""
+    import random
+    import pandas as pd
+    from . import constants, transform_col
+    rand = random.Random(seed)
+
+    df = pd.DataFrame({
+        constants.COL_NAME: [f"  board number {i} " for i in range(num_rows)],
+        constants.COL_URLS: transform_col.get_list_col(make_url_column(num_rows, seed)),
+        constants.COL_DESCRIPT: [f"remote data jobs at board {i}. " for i in range(num_rows)],
+        constants.COL_QUEUE_PRIORITY: [rand.randint(1, 4) for _ in range(num_rows)],
+        constants.COL_JOBBOARD: [rand.random() < 0.5 for _ in range(num_rows)],
+        constants.COL_ORG: [rand.random() < 0.5 for _ in range(num_rows)],
+        constants.COL_LOCATIONS: [(rand.randrange(100),) for _ in range(num_rows)],
+    }, index = pd.RangeIndex(1, num_rows + 1, name = constants.COL_ID))
+    return df
+
+
+##########
+# Benchmarks
+##########
+
+def bench_snapshot_cache(filename: str = BENCH_WORKBOOK, repeat: int = 5) -> None:
+    """Cold (Excel parse) vs warm (snapshot) loads of get_df_jobboards."""
+    from . import df_methods
+    from .snapshot_cache import SnapshotCache
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename_snapshot = os.path.join(tmp_dir, 'bench.snapshot')
+
+        def cold():
+            for tag in ('df_jobboards', 'df_jobboards_no_locations'):
+                if os.path.exists(SnapshotCache.get_filename(tag, filename_snapshot)):
+                    os.remove(SnapshotCache.get_filename(tag, filename_snapshot))
+            df_methods.get_df_jobboards(filename, filename_snapshot= filename_snapshot)
+
+        def warm():
+            df_methods.get_df_jobboards(filename, filename_snapshot= filename_snapshot)
+
+        def no_cache():
+            df_methods.get_df_jobboards(filename, use_snapshot= False)
+
+        results = [
+            ('no snapshot', round(time_call(no_cache, repeat), 2)),
+            ('cold', round(time_call(cold, repeat), 2)),
+            ('warm', round(time_call(warm, repeat), 2)),
+        ]
+    print_results("Snapshot cache: get_df_jobboards()", ('load', 'best_ms'), results)
+
+
+def bench_workbook_loader(filename: str = BENCH_WORKBOOK, repeat: int = 5) -> None:
+    """One read_excel per sheet vs one open workbook for all sheets."""
+    import pandas as pd
+    from . import constants, df_methods
+
+    def per_sheet():
+        tuple(pd.read_excel(filename, sheet, index_col = 0) for sheet in constants.SHEETNAMES)
+
+    def single_open():
+        df_methods.load_dataframes(filename, constants.SHEETNAMES)
+
+    def jobboards_only():
+        df_methods.load_dataframes(filename, (constants.SHEETNAME_JOBBOARDS,))
+
+    results = [
+        ('read_excel per sheet', round(time_call(per_sheet, repeat), 2)),
+        ('single open, all sheets', round(time_call(single_open, repeat), 2)),
+        ('single open, job_sites only', round(time_call(jobboards_only, repeat), 2)),
+    ]
+    print_results("Workbook loader: load_dataframes()", ('load', 'best_ms'), results)
+
+
+def bench_builtin_reader(filename: str = BENCH_WORKBOOK, repeat: int = 5) -> None:
+    """Interpreter startup + load, pandas vs the built-in xlsx reader. No snapshot."""
+    code_loads = (
+        ('pandas', 'from j_script import df_methods; '
+            f'df_methods.get_df_jobboards({filename!r}, use_snapshot= False)'),
+        ('built-in reader', 'from j_script import record_methods; '
+            f'record_methods.get_columns_jobboards({filename!r}, use_snapshot= False)'),
+        ('interpreter only', 'pass'),
+    )
+    results = []
+    for load, code in code_loads:
+        def run():
+            subprocess.run([sys.executable, '-c', code], cwd= DIR_REPO, check= True,
+                stdout= subprocess.DEVNULL)
+        results.append((load, round(time_call(run, repeat), 2)))
+    print_results("Startup + load: python -c <load>", ('load', 'best_ms'), results)
+
+
+def bench_locations(sizes: Tuple[int] = (1_000, 100_000), repeat: int = 3) -> None:
+    """Per-cell location parsing vs the column-wise locations.get_locations()."""
+    import pandas as pd
+    from . import constants, locations
+
+    location_keys = make_location_keys()
+    df_location_keys = tuple(
+        pd.DataFrame({key: pd.Series(location_keys[key])}) for key in constants.AUX_DF_KEYS)
+
+    def per_cell(df):
+        """Previous implementation: parse & map each cell in python."""
+        for df_key, key in zip(df_location_keys, constants.AUX_DF_KEYS):
+            int_str = df_key.to_dict()[key]
+            col = df[key]
+            df[key] = pd.Series([
+                int_str[val] if isinstance(val, int) else [
+                    int_str[int(v)] for v in val.replace(' ', '').split(constants.DELIMITER_LOC) if v != '']
+                for val in (col.iloc[i] for i in range(len(col)))
+            ], index = df.index)
+
+    results = []
+    for num_rows in sizes:
+        df = pd.DataFrame(
+            make_location_columns(num_rows, location_keys),
+            index = pd.RangeIndex(1, num_rows + 1, name = constants.COL_ID),
+        )
+        results.append((
+            num_rows,
+            round(time_call(lambda: per_cell(df.copy()), repeat), 2),
+            round(time_call(lambda: locations.get_locations(df.copy(), df_location_keys), repeat), 2),
+        ))
+    print_results("Locations: get_locations()", ('rows', 'per_cell_ms', 'columnwise_ms'), results)
+
+
+def bench_geo_index(sizes: Tuple[int] = (1_000, 100_000), repeat: int = 5) -> None:
+    """GeoIndex build time, load time from the snapshot, & lookup time vs result size."""
+    import pickle
+    from . import constants
+    from .geo_index import GeoIndex, get_location_table
+    from .record_methods import get_location_codes
+
+    location_keys = make_location_keys()
+    results = []
+    for num_rows in sizes:
+        columns = make_location_columns(num_rows, location_keys)
+        ids = list(range(1, num_rows + 1))
+        location_codes = [
+            get_location_codes(columns[key], location_keys[key], ids, key) for key in constants.AUX_DF_KEYS]
+        location_table, board_location_ids = get_location_table(
+            *location_codes, tuple(location_keys[key] for key in constants.AUX_DF_KEYS))
+
+        build_ms = time_call(lambda: GeoIndex(location_table, zip(ids, board_location_ids)), repeat)
+        geo_index = GeoIndex(location_table, zip(ids, board_location_ids))
+        data = pickle.dumps(geo_index, pickle.HIGHEST_PROTOCOL)
+        load_ms = time_call(lambda: pickle.loads(data), repeat)
+        for region in ('country 1', 'state 1', 'city 1', 'country 1/state 1/city 1'):
+            lookup_ms = time_call(lambda: geo_index.boards_in(region), repeat)
+            results.append((num_rows, round(build_ms, 2), round(load_ms, 2), region, len(geo_index.boards_in(region)),
+                round(lookup_ms * 1000, 2)))
+    print_results(
+        "Geo index: GeoIndex.boards_in()", ('boards', 'build_ms', 'load_ms', 'region', 'results', 'lookup_us'), results)
+
+
+def bench_url_col(sizes: Tuple[int] = (1_000, 100_000, 1_000_000), repeat: int = 3) -> None:
+    """Per-row .iloc loop vs pandas .str chain vs transform_col.transform_col_to_list_type()."""
+    import numpy as np
+    import pandas as pd
+    from . import constants, transform_col
+
+    delimiter = constants.DELIMITER_URL
+
+    def iloc_loop(df):
+        """Previous implementation."""
+        col = df[constants.COL_URLS]
+        df[constants.COL_URLS] = [
+            [x.strip().lower() for x in col.iloc[i].split(delimiter)] for i in range(len(col))]
+
+    def str_chain(df):
+        """Column-wise .str methods: split, explode, strip & lower, regroup by offsets."""
+        split_col = df[constants.COL_URLS].str.split(delimiter)
+        flat = split_col.explode().str.strip().str.lower().tolist()
+        offsets = np.cumsum(split_col.str.len().to_numpy()).tolist()
+        df[constants.COL_URLS] = [flat[a:b] for a, b in zip([0] + offsets[:-1], offsets)]
+
+    results = []
+    for num_rows in sizes:
+        df = pd.DataFrame({constants.COL_URLS: make_url_column(num_rows)})
+        expected = transform_col.transform_col_to_list_type(df.copy())[constants.COL_URLS].tolist()
+        for func in (iloc_loop, str_chain):
+            df_copy = df.copy()
+            func(df_copy)
+            assert df_copy[constants.COL_URLS].tolist() == expected, func.__name__
+
+        rep = repeat if num_rows < 1_000_000 else 1
+        results.append((
+            num_rows,
+            round(time_call(lambda: iloc_loop(df.copy()), rep), 2),
+            round(time_call(lambda: str_chain(df.copy()), rep), 2),
+            round(time_call(lambda: transform_col.transform_col_to_list_type(df.copy()), rep), 2),
+        ))
+    print_results("Url column: transform_col_to_list_type()", ('rows', 'iloc_loop_ms', 'str_chain_ms', 'single_pass_ms'), results)
+
+
+def bench_jobboard_instances(sizes: Tuple[int] = (1_000, 5_000, 20_000), repeat: int = 3) -> None:
+    """Per-row .iloc construction vs jobboard_list.create_jobboard_instances(), in boards/sec."""
+    from . import constants, jobboard_list
+    from .class_jobboard import JobBoard
+
+    def iloc_rows(df):
+        """Previous implementation."""
+        return [
+            JobBoard(
+                ident = df.index[i],
+                name = df[constants.COL_NAME].iloc[i].strip().title(),
+                urls = df[constants.COL_URLS].iloc[i],
+                description = df[constants.COL_DESCRIPT].iloc[i].capitalize().strip(),
+                Q_priority = df[constants.COL_QUEUE_PRIORITY].iloc[i],
+                jobboard = df[constants.COL_JOBBOARD].iloc[i],
+                organization = df[constants.COL_ORG].iloc[i],
+                locations = df[constants.COL_LOCATIONS].iloc[i],
+            )
+            for i in range(len(df))
+        ]
+
+    results = []
+    for num_rows in sizes:
+        df = make_jobboard_df(num_rows)
+        row = [num_rows]
+        for func in (iloc_rows, jobboard_list.create_jobboard_instances):
+            best_ms = time_call(lambda: func(df), repeat)
+            row += [round(best_ms, 2), round(num_rows / best_ms * 1000)]
+        results.append(tuple(row))
+    print_results("JobBoard instances: create_jobboard_instances()",
+        ('boards', 'iloc_ms', 'iloc_boards_s', 'columns_ms', 'columns_boards_s'), results)
+
+
+def bench_jobboard_memory(num_rows: int = 100_000) -> None:
+    """Bytes per JobBoard: the instance alone, & everything allocated to create it.
+
+    Columns are built beforehand, so shared values, e.g., url lists, aren't counted.
+    """
+    import gc
+    import tracemalloc
+    from . import constants, jobboard_list
+
+    df = make_jobboard_df(num_rows)
+    columns = {col: df[col].tolist() for col in jobboard_list.COLS_JOBBOARD if col != constants.COL_ID}
+    columns[constants.COL_ID] = df.index.tolist()
+
+    gc.collect()
+    tracemalloc.start()
+    all_jobboards = jobboard_list.create_jobboard_instances_from_columns(columns)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    jobboard = all_jobboards[0]
+    instance_bytes = sys.getsizeof(jobboard) + (sys.getsizeof(jobboard.__dict__) if hasattr(jobboard, '__dict__') else 0)
+    results = [(num_rows, instance_bytes, round(allocated / num_rows, 1))]
+    print_results("JobBoard memory: bytes per board", ('boards', 'instance', 'allocated'), results)
+
+
+def bench_job_queue(sizes: Tuple[int] = (1_000, 10_000, 100_000, 1_000_000), num_used: int = 1_000, max_list_size: int = 10_000) -> None:
+    """Queue bookkeeping of a run, list vs IndexedJobQueue.
+
+    Looks up every id's index (JobBoard.Q_index), sorts ids by index (main step 4),
+    then moves num_used ids to the back (QueueMethods.save_queue).
+    Lists are only timed up to max_list_size ids.
+    """
+    import random
+    from .indexed_queue import IndexedJobQueue
+
+    def list_queue(ids, used):
+        """Previous implementation."""
+        job_queue = list(ids)
+        for ident in ids:
+            for i in range(len(job_queue)):
+                if job_queue[i] == ident:
+                    break
+        sorted(ids, key = lambda x: job_queue.index(x))
+        indices_used = set()
+        for index, ident in used:
+            removed = sum(1 if (num < index) else 0 for num in indices_used)
+            del job_queue[index - removed]
+            indices_used.add(index)
+            job_queue.append(ident)
+        return job_queue
+
+    def indexed_queue(ids, used):
+        job_queue = IndexedJobQueue(ids)
+        for ident in ids:
+            job_queue.index(ident)
+        for _, ident in used:
+            job_queue.move_to_back(ident)
+        sorted(ids, key = job_queue.index)      # after moves, so lookups go through the tree
+        return job_queue.to_list()
+
+    results = []
+    for num_ids in sizes:
+        ids = list(range(1, num_ids + 1))
+        random.Random(0).shuffle(ids)
+        used = [(i, ids[i]) for i in sorted(random.Random(1).sample(range(num_ids), min(num_used, num_ids)))]
+
+        list_ms = '-'
+        if num_ids <= max_list_size:
+            assert list_queue(ids, used) == indexed_queue(ids, used)
+            list_ms = round(time_call(lambda: list_queue(ids, used), 1), 2)
+        results.append((num_ids, list_ms, round(time_call(lambda: indexed_queue(ids, used), 1), 2)))
+    print_results("Job queue: lookups, sort & move to back", ('ids', 'list_ms', 'indexed_ms'), results)
+
+
+def bench_clean_queue(sizes: Tuple[int] = (1_000, 10_000, 100_000, 1_000_000), frac_changed: float = 0.01, max_list_size: int = 10_000) -> None:
+    """Previous clean_queue vs QueueMethods.reconcile_queue(). frac_changed of ids are stale, & as many are new.
+
+    The previous clean_queue is only timed up to max_list_size ids.
+    """
+    import random
+    from .queue_methods import QueueMethods
+
+    def list_clean(job_queue, jobboard_ids):
+        """Previous implementation: bin_search & del per stale id, then a scan per board."""
+        def bin_search(arr, l, r, num):
+            if r < l: return -1
+            mid = (l + r) // 2
+            if arr[mid] == num: return mid
+            elif arr[mid] > num: return bin_search(arr, l, mid - 1, num)
+            return bin_search(arr, mid + 1, r, num)
+
+        job_queue = list(job_queue)
+        for ident in jobboard_ids:      # new ids were appended at construction
+            if ident not in job_queue:
+                job_queue.append(ident)
+        sorted_ids = sorted(jobboard_ids)
+        removed = 0
+        for i in range(len(job_queue)):
+            if bin_search(sorted_ids, 0, len(sorted_ids) - 1, job_queue[i - removed]) == -1:
+                del job_queue[i - removed]
+                removed += 1
+        for ident in jobboard_ids:
+            job_queue.index(ident)
+        return job_queue
+
+    def reconcile(job_queue, jobboard_ids):
+        job_queue, _, _ = QueueMethods.reconcile_queue(job_queue, jobboard_ids)
+        for ident in jobboard_ids:
+            job_queue.index(ident)
+        return job_queue.to_list()
+
+    results = []
+    for num_ids in sizes:
+        num_changed = int(num_ids * frac_changed)
+        job_queue = list(range(num_ids))
+        random.Random(0).shuffle(job_queue)
+        jobboard_ids = list(range(num_changed, num_ids + num_changed))
+
+        list_ms = '-'
+        if num_ids <= max_list_size:
+            assert list_clean(job_queue, jobboard_ids) == reconcile(job_queue, jobboard_ids)
+            list_ms = round(time_call(lambda: list_clean(job_queue, jobboard_ids), 1), 2)
+        results.append((num_ids, num_changed, list_ms, round(time_call(lambda: reconcile(job_queue, jobboard_ids), 3), 2)))
+    print_results("Clean queue: reconcile_queue()", ('ids', 'stale_&_new', 'list_ms', 'reconcile_ms'), results)
+
+
+def bench_save_queue(sizes: Tuple[int] = (1_000, 100_000, 1_000_000), num_used: int = 5, repeat: int = 5) -> None:
+    """Save cost per run: pickling the whole queue vs QueueMethods.save_queue() journaling used ids."""
+    import pickle
+    from .indexed_queue import IndexedJobQueue
+    from .queue_file import QueueFile
+    from .queue_journal import QueueJournal
+    from .queue_methods import QueueMethods
+
+    filenames = QueueFile.filename_queue, QueueJournal.filename_journal
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename_pickle = os.path.join(tmp_dir, 'bench.pkl')
+        QueueFile.filename_queue = os.path.join(tmp_dir, 'bench.bin')
+        QueueJournal.filename_journal = os.path.join(tmp_dir, 'bench.journal')
+        try:
+            for num_ids in sizes:
+                ids = list(range(num_ids))
+                job_queue = IndexedJobQueue(ids)
+                used_jobs = [(i, ids[i]) for i in range(num_used)]
+
+                def pickle_queue():
+                    """Previous implementation."""
+                    with open(filename_pickle, 'wb') as f:
+                        pickle.dump(job_queue.to_list(), f)
+
+                QueueMethods.compact_queue(job_queue)
+                results.append((
+                    num_ids,
+                    round(time_call(pickle_queue, repeat), 2),
+                    round(time_call(lambda: QueueMethods.save_queue(job_queue, used_jobs), repeat), 2),
+                    QueueJournal.get_size(),
+                ))
+        finally:
+            QueueFile.filename_queue, QueueJournal.filename_journal = filenames
+    print_results("Save queue: save_queue()", ('ids', 'pickle_ms', 'journal_ms', 'journal_bytes'), results)
+
+
+def bench_load_queue(sizes: Tuple[int] = (1_000, 100_000, 1_000_000), repeat: int = 5) -> None:
+    """Load cost: unpickling a list vs QueueFile.load(), & QueueMethods.load_queue() to an IndexedJobQueue."""
+    import pickle
+    from .queue_file import QueueFile
+    from .queue_journal import QueueJournal
+    from .queue_methods import QueueMethods
+
+    filenames = QueueFile.filename_queue, QueueJournal.filename_journal
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename_pickle = os.path.join(tmp_dir, 'bench.pkl')
+        QueueFile.filename_queue = os.path.join(tmp_dir, 'bench.bin')
+        QueueJournal.filename_journal = os.path.join(tmp_dir, 'bench.journal')
+        try:
+            for num_ids in sizes:
+                ids = list(range(num_ids))
+                with open(filename_pickle, 'wb') as f:
+                    pickle.dump(ids, f)
+                QueueFile.save(ids, 1)
+
+                def unpickle():
+                    """Previous implementation."""
+                    with open(filename_pickle, 'rb') as f:
+                        return pickle.load(f)
+
+                results.append((
+                    num_ids,
+                    round(time_call(unpickle, repeat), 2),
+                    round(time_call(QueueFile.load, repeat), 2),
+                    round(time_call(QueueMethods.load_queue, repeat), 2),
+                ))
+        finally:
+            QueueFile.filename_queue, QueueJournal.filename_journal = filenames
+    print_results("Load queue: QueueFile.load()", ('ids', 'unpickle_ms', 'queue_file_ms', 'load_queue_ms'), results)
+
+
+def bench_sqlite_store(num_rows: int = 500_000, repeat: int = 3) -> None:
+    """Run time, current path vs SQLiteStore, for a catalog of num_rows boards.
+
+    Current path: snapshot load, JobBoard instances, clean & sort queue, open loop, save queue.
+    SQLite: workbook key check, select boards in queue order, move them to the back.
+    Neither prints tables or writes markdown. Urls aren't opened.
+    """
+    import webbrowser
+    from . import constants, jobboard_list
+    from .class_jobboard import JobBoard
+    from .geo_index import LocationTable
+    from .queue_file import QueueFile
+    from .queue_journal import QueueJournal
+    from .queue_methods import QueueMethods
+    from .snapshot_cache import SnapshotCache
+    from .sqlite_store import SQLiteStore
+
+    df = make_jobboard_df(num_rows)
+    columns = jobboard_list.get_columns(df)
+    location_table = LocationTable([(f"country {i}", None, None) for i in range(100)])
+    workbook_key = SnapshotCache.get_key(BENCH_WORKBOOK)
+    options = {'boards': True, 'orgs': True}
+    option_jobboardattr = (("boards", "jobboard"), ("orgs", "organization"))
+
+    saved = (QueueFile.filename_queue, QueueJournal.filename_journal, webbrowser.open,
+        {attr: getattr(JobBoard, attr, None) for attr in ('job_queue', 'used_jobsites', 'sites_opened', 'boards', 'orgs')})
+    webbrowser.open = lambda url: None
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename_snapshot = os.path.join(tmp_dir, 'bench.snapshot')
+        QueueFile.filename_queue = os.path.join(tmp_dir, 'bench.bin')
+        QueueJournal.filename_journal = os.path.join(tmp_dir, 'bench.journal')
+        try:
+            SnapshotCache.save((columns, location_table), workbook_key, 'columns_jobboards', filename_snapshot)
+            QueueFile.save(columns[constants.COL_ID], 1)
+            JobBoard.boards = JobBoard.orgs = True
+
+            def current_run():
+                SnapshotCache.get_key(BENCH_WORKBOOK)
+                snapshot_columns, _ = SnapshotCache.load(workbook_key, 'columns_jobboards', filename_snapshot)
+                JobBoard.job_queue = QueueMethods.load_queue()
+                all_jobboards = jobboard_list.create_jobboard_instances_from_columns(snapshot_columns)
+                JobBoard.job_queue = QueueMethods.clean_queue(JobBoard.job_queue, all_jobboards)
+                all_jobboards.sort(key = lambda x: JobBoard.job_queue.index(x.ident))
+                JobBoard.sites_opened, JobBoard.used_jobsites = 0, list()
+                for jobboard in all_jobboards:
+                    jobboard.open_websites(option_jobboardattr)
+                QueueMethods.save_queue(JobBoard.job_queue, JobBoard.used_jobsites)
+
+            with SQLiteStore(os.path.join(tmp_dir, 'bench.sqlite3')) as store:
+                import_ms = time_call(lambda: store.import_columns(columns, location_table, workbook_key), 1)
+                reimport_ms = time_call(lambda: store.import_columns(columns, location_table, workbook_key), 1)
+
+                def sqlite_run():
+                    store.is_current(SnapshotCache.get_key(BENCH_WORKBOOK))
+                    selected = store.select_boards_to_open(constants.MAX_SITES_TO_OPEN, options)
+                    store.move_to_back([ident for ident, *_ in selected])
+
+                results = [
+                    ('current path, warm snapshot', round(time_call(current_run, repeat), 2)),
+                    ('sqlite, first import', round(import_ms, 2)),
+                    ('sqlite, re-import unchanged rows', round(reimport_ms, 2)),
+                    ('sqlite, run', round(time_call(sqlite_run, repeat), 2)),
+                ]
+        finally:
+            QueueFile.filename_queue, QueueJournal.filename_journal, webbrowser.open, attrs = saved
+            for attr, val in attrs.items():
+                setattr(JobBoard, attr, val)
+    print_results(f"SQLite store: run time, {num_rows} boards", ('path', 'best_ms'), results)
+
+
+def bench_catalog_delta(sizes: Tuple[int] = (10_000, 100_000, 500_000), frac_changed: float = 0.01, repeat: int = 3) -> None:
+    """Workbook changed: clean every row & reconcile the queue vs clean & apply only the delta.
+
+    frac_changed of rows have a changed url, as many are removed, & as many added.
+    Times exclude the Excel parse, which both paths need.
+    """
+    import random
+    from . import catalog_delta, constants, jobboard_list, record_methods
+    from .geo_index import LocationTable
+    from .indexed_queue import IndexedJobQueue
+    from .queue_methods import QueueMethods
+
+    def make_raw_columns(ids, seed):
+        location_cols = make_location_columns(len(ids), location_keys, seed)
+        rand = random.Random(seed)
+        return {
+            constants.COL_ID: list(ids),
+            constants.COL_NAME: [f"board number {i}" for i in ids],
+            constants.COL_URLS: make_url_column(len(ids), seed),
+            constants.COL_DESCRIPT: [f"remote data jobs at board {i}." for i in ids],
+            constants.COL_QUEUE_PRIORITY: [rand.randint(1, 4) for _ in ids],
+            constants.COL_JOBBOARD: [rand.random() < 0.5 for _ in ids],
+            constants.COL_ORG: [rand.random() < 0.5 for _ in ids],
+            **location_cols,
+        }
+
+    location_keys = make_location_keys()
+    location_columns = [
+        {constants.COL_ID: list(int_str), key: list(int_str.values())} for key, int_str in location_keys.items()]
+    results = []
+    for num_rows in sizes:
+        num_changed = int(num_rows * frac_changed)
+        previous_raw = make_raw_columns(range(num_rows), 0)
+        previous_columns = {col: list(vals) for col, vals in previous_raw.items()}
+        previous_table = record_methods.clean_columns(previous_columns, location_columns)
+        previous_hashes = catalog_delta.get_row_hashes(previous_raw)
+
+        ## Drop the first rows, change a url per stride, append new rows
+        raw = {col: vals[num_changed:] for col, vals in previous_raw.items()}
+        new_raw = make_raw_columns(range(num_rows, num_rows + num_changed), 1)
+        for col in raw:
+            raw[col] = raw[col] + new_raw[col]
+        urls = raw[constants.COL_URLS]
+        for row in range(0, len(urls), len(urls) // num_changed):
+            urls[row] = urls[row] + ', https://www.changed.com'
+
+        job_queue = list(range(num_rows))
+        random.Random(0).shuffle(job_queue)
+        columns = {col: list(vals) for col, vals in raw.items()}
+        record_methods.clean_columns(columns, location_columns)
+        all_jobboards = jobboard_list.create_jobboard_instances_from_columns(columns)
+
+        def full_path():
+            columns = {col: list(vals) for col, vals in raw.items()}
+            record_methods.clean_columns(columns, location_columns)
+            QueueMethods.clean_queue(IndexedJobQueue(job_queue), all_jobboards)
+
+        def delta_path():
+            columns = {col: list(vals) for col, vals in raw.items()}
+            delta = catalog_delta.get_delta(previous_hashes, catalog_delta.get_row_hashes(columns))
+            table = LocationTable(list(previous_table.locations))
+            record_methods.clean_changed_rows(columns, location_columns, previous_columns, table, delta)
+            QueueMethods.clean_queue(IndexedJobQueue(job_queue), all_jobboards, delta)
+
+        results.append((num_rows, num_changed, round(time_call(full_path, repeat), 2), round(time_call(delta_path, repeat), 2)))
+        QueueMethods.journal_records = list()
+    print_results("Catalog delta: clean columns & queue", ('rows', 'changed', 'full_ms', 'delta_ms'), results)
+
+
+def bench_markdown_table(sizes: Tuple[int] = (1_000, 10_000, 100_000), num_changed: int = 10, max_tableinfo_size: int = 10_000, repeat: int = 3) -> None:
+    """Markdown file for a catalog with num_changed descriptions changed: TableInfo vs MarkdownTable.
+
+    TableInfo sorts & renders every row; it's only timed up to max_tableinfo_size rows.
+    MarkdownTable is timed with same-length changes (patched in place), & with one board
+    added near the top (rows after it rewritten). Times include loading & saving its cache.
+    """
+    import itertools
+    import random
+    from .markdown_table import MarkdownTable
+    keys = ('name', 'url_nums', 'description')
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename_md = os.path.join(tmp_dir, 'bench.md')
+        for num_rows in sizes:
+            rand = random.Random(num_rows)
+            rows = {
+                ident: (f"Board {rand.randrange(10 ** 6):06}", f"[1](https://www.board{ident}.com/jobs)", f"jobs at board {ident:07}")
+                for ident in range(num_rows)
+            }
+            md_table = MarkdownTable(keys, filename_md)
+            md_table.update(rows.items())
+            md_table.write()
+
+            def write_tableinfo():
+                tbl_md = TableInfo(keys)
+                for ident in sorted(rows, key= lambda ident: rows[ident][0]):
+                    tbl_md.add_entry(rows[ident])
+                tbl_md.print_info(markdown= True, md_filename= os.path.join(tmp_dir, 'tableinfo.md'))
+
+            def write_cached(changes):
+                for ident, cells in changes():
+                    rows[ident] = cells
+                md_table = MarkdownTable.load(keys, filename_md)
+                md_table.update(rows.items())
+                return md_table.write()
+
+            def change_descriptions():
+                return [(ident, rows[ident][:2] + (f"jobs at board {rand.randrange(10 ** 7):07}",))
+                    for ident in rand.sample(range(num_rows), num_changed)]
+
+            new_names = (f"Board 0000{i % 100:02}" for i in itertools.count())
+
+            def add_board():
+                rows.pop(num_rows, None)
+                return [(num_rows, (next(new_names), '[1](https://www.new.com)', f"jobs at board {num_rows:07}"))]
+
+            tableinfo_ms = '-'
+            if num_rows <= max_tableinfo_size:
+                tableinfo_ms = round(time_call(write_tableinfo, 1), 2)
+            assert write_cached(change_descriptions) == write_cached(add_board) == 'patched'
+            results.append((
+                num_rows, tableinfo_ms,
+                round(time_call(lambda: write_cached(change_descriptions), repeat), 2),
+                round(time_call(lambda: write_cached(add_board), repeat), 2),
+            ))
+    print_results(f"Markdown file: {num_changed} rows changed", ('rows', 'tableinfo_ms', 'patch_ms', 'insert_ms'), results)
+
+
+def bench_url_opener(num_urls: int = 20, latency: float = 0.25, jitter: float = 0.1, configs: Tuple[Tuple[int, float]] = ((4, 0.0), (4, 0.1), (8, 0.05), (20, 0.0))) -> None:
+    """Serial opening vs UrlOpener, with a fake opener that blocks latency ± jitter seconds per url.
+
+    configs are (max_workers, spacing) pairs.
+    """
+    import random
+    from .url_opener import UrlOpener
+    urls = [f"https://www.board{i}.com/jobs" for i in range(num_urls)]
+
+    def fake_open(url):
+        time.sleep(latency + random.uniform(-jitter, jitter))
+        return True
+
+    def serial():
+        for url in urls:
+            fake_open(url)
+
+    results = [('serial', '-', '-', round(time_call(serial, 1), 1), '-')]
+    for max_workers, spacing in configs:
+        with UrlOpener(max_workers= max_workers, spacing= spacing, open_url= fake_open) as url_opener:
+            for url in urls:
+                url_opener.submit(url)
+        report = url_opener.report
+        mean_latency = sum(result.latency for result in report.results) / len(report.results)
+        results.append(('UrlOpener', max_workers, spacing, round(report.wall_time * 1000, 1), round(mean_latency * 1000, 1)))
+    print_results(f"Url opener: {num_urls} urls, {latency}s ± {jitter}s launch", ('opener', 'workers', 'spacing', 'wall_ms', 'mean_launch_ms'), results)
+
+
+def bench_launchpad(sizes: Tuple[int] = (5, 20, 50), latency: float = 0.25) -> None:
+    """Browser launches: serial, UrlOpener & Launchpad, with a fake opener that blocks latency seconds per call."""
+    from .launchpad import Launchpad
+    from .url_opener import UrlOpener
+    calls = []
+
+    def fake_open(url):
+        calls.append(url)
+        time.sleep(latency)
+        return True
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_urls in sizes:
+            boards = [(f"Board {i}", [f"https://www.board{i}.com/jobs"], f"jobs at board {i}") for i in range(num_urls)]
+            row = [num_urls]
+            for make_opener in (
+                lambda: UrlOpener(max_workers= 1, spacing= 0.0, open_url= fake_open),
+                lambda: UrlOpener(open_url= fake_open),
+                lambda: Launchpad(os.path.join(tmp_dir, 'launchpad.html'), open_url= fake_open),
+            ):
+                calls.clear()
+                with make_opener() as url_opener:
+                    for name, urls, description in boards:
+                        url_opener.submit_jobboard(name, urls, description)
+                row.extend((len(calls), round(url_opener.report.wall_time * 1000, 1)))
+            results.append(tuple(row))
+    print_results(f"Launchpad: {latency}s per browser call",
+        ('urls', 'serial_calls', 'serial_ms', 'pool_calls', 'pool_ms', 'launchpad_calls', 'launchpad_ms'), results)
+
+
+def bench_url_checker(num_urls: int = 400, num_hosts: int = 4, latency: float = 0.02, configs: Tuple[Tuple[int, int]] = ((1, 1), (4, 1), (16, 4), (64, 16))) -> None:
+    """UrlChecker throughput against local stand-in servers that answer after latency seconds."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from .url_checker import UrlChecker
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            time.sleep(latency)
+            self.send_response(404 if self.path.endswith('0') else 200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 128        # the default backlog of 5 drops connections, which retry after 1s
+
+    servers = [Server(('127.0.0.1', 0), Handler) for _ in range(num_hosts)]
+    for server in servers:
+        threading.Thread(target= server.serve_forever, daemon= True).start()
+    urls = [f"http://127.0.0.1:{servers[i % num_hosts].server_address[1]}/jobs/{i}" for i in range(num_urls)]
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename_cache = os.path.join(tmp_dir, 'url_cache.pkl')
+            for max_connections, per_host in configs:
+                url_checker = UrlChecker(max_connections, per_host, filename_cache= filename_cache)
+                report = url_checker.check(urls, use_cache= False)
+                dead = sum(status.dead for status in report.statuses)
+                results.append((max_connections, per_host, num_urls, dead, round(report.wall_time * 1000, 1), round(num_urls / report.wall_time)))
+            start = time.perf_counter()
+            url_checker = UrlChecker(filename_cache= filename_cache)
+            report = url_checker.check(urls)
+            results.append(('cached', '', num_urls, sum(status.dead for status in report.statuses),
+                round((time.perf_counter() - start) * 1000, 1), ''))
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    print_results(f"Url checker: {num_hosts} hosts, {latency}s per response",
+        ('connections', 'per_host', 'urls', 'dead', 'ms', 'urls_per_s'), results)
+
+
+def bench_page_watcher(num_pages: int = 200, page_size: int = 50_000, latency: float = 0.01) -> None:
+    """PageWatcher fetches of unchanged pages: first fetch, conditional refetch, & refetch from servers without validators."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from .page_watcher import PageWatcher
+    body = b'x' * page_size
+    sent = [0]
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            time.sleep(latency)
+            validators = not self.path.startswith('/plain')
+            if validators and self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            if validators:
+                self.send_header('ETag', '"v1"')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with lock:
+                sent[0] += len(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 128
+
+    server = Server(('127.0.0.1', 0), Handler)
+    threading.Thread(target= server.serve_forever, daemon= True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for label, path in (('etag', 'etag'), ('none', 'plain')):
+                urls = [f"{base}/{path}/{i}" for i in range(num_pages)]
+                page_watcher = PageWatcher(per_host= 16, filename_states= os.path.join(tmp_dir, f"{path}.pkl"))
+                for run in ('first', 'refetch'):
+                    sent[0] = 0
+                    report = page_watcher.fetch(urls)
+                    page_watcher.mark_visited(urls)
+                    results.append((label, run, num_pages, round(report.wall_time * 1000, 1),
+                        round(num_pages / report.wall_time), sent[0] // 1000,
+                        sum(page_watcher.has_changed([url]) for url in urls)))
+    finally:
+        server.shutdown()
+        server.server_close()
+    print_results(f"Page watcher: {num_pages} pages of {page_size // 1000} kB, {latency}s per response, 16 per host",
+        ('validators', 'run', 'pages', 'ms', 'pages_per_s', 'kB_sent', 'changed'), results)
+
+
+def bench_scheduler(sizes: Tuple[int] = (1_000, 10_000, 100_000, 1_000_000), max_sites: int = 5, num_runs: int = 20, max_loop_size: int = 100_000) -> None:
+    """Ms per run choosing max_sites urls: main's open_websites() loop over every board, & the scheduling policies.
+
+    Each run moves opened boards to the back of the queue. Heap policy runs include main's JobBoardRows
+    of the columns, update() with an empty delta & save() to the journal. load_ms is loading the stride
+    schedule & its journal.
+    """
+    import random
+    from . import constants
+    from .catalog_delta import CatalogDelta
+    from .class_jobboard import JobBoard
+    from .jobboard_list import JobBoardRows, create_jobboard_instances_from_columns
+    from .indexed_queue import IndexedJobQueue
+    from .queue_methods import QueueMethods
+    from .scheduler import DueScheduler, StrideScheduler, WindowScheduler
+    from .url_opener import UrlOpener
+    option_jobboardattr = (("boards", "jobboard"), ("orgs", "organization"))
+    class_attrs = {attr: getattr(JobBoard, attr, None) for attr in
+        ('job_queue', 'MAX_SITES_TO_OPEN', 'sites_opened', 'used_jobsites', 'url_opener', 'boards', 'orgs')}
+
+    results = []
+    try:
+        JobBoard.boards, JobBoard.orgs, JobBoard.MAX_SITES_TO_OPEN = True, True, max_sites
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for num_rows in sizes:
+                rng = random.Random(0)
+                columns = {
+                    constants.COL_ID: list(range(num_rows)),
+                    constants.COL_NAME: ['name'] * num_rows,
+                    constants.COL_URLS: [['url'] * rng.choice((1, 1, 2, 3)) for _ in range(num_rows)],
+                    constants.COL_DESCRIPT: [''] * num_rows,
+                    constants.COL_QUEUE_PRIORITY: [rng.randint(1, 5) for _ in range(num_rows)],
+                    constants.COL_JOBBOARD: [True] * num_rows,
+                    constants.COL_ORG: [False] * num_rows,
+                    constants.COL_LOCATIONS: [()] * num_rows,
+                }
+                jobboards = create_jobboard_instances_from_columns(columns)
+                boards = {jobboard.ident: jobboard for jobboard in jobboards}
+                row = [num_rows]
+
+                ## Reference: every board through open_websites()
+                if num_rows <= max_loop_size:
+                    JobBoard.job_queue = job_queue = IndexedJobQueue(range(num_rows))
+                    JobBoard.url_opener = UrlOpener(spacing= 0.0, open_url= lambda url: True)
+                    QueueMethods.set_Q_indices(job_queue, jobboards)
+                    start = time.perf_counter()
+                    for _ in range(num_runs):
+                        JobBoard.sites_opened, JobBoard.used_jobsites = 0, []
+                        for ident in job_queue:
+                            boards[ident].open_websites(option_jobboardattr)
+                        for _, ident in JobBoard.used_jobsites:
+                            job_queue.move_to_back(ident)
+                        QueueMethods.set_Q_indices(job_queue, jobboards)
+                    row.append(round((time.perf_counter() - start) / num_runs * 1000, 2))
+                    JobBoard.url_opener.wait()
+                else:
+                    QueueMethods.set_Q_indices(IndexedJobQueue(range(num_rows)), jobboards)
+                    row.append('')
+
+                job_queue = IndexedJobQueue(range(num_rows))
+                scheduler = WindowScheduler()
+                scheduler.update(job_queue, JobBoardRows(columns))
+                start = time.perf_counter()
+                for _ in range(num_runs):
+                    for jobboard in scheduler.select(max_sites, lambda jobboard: True):
+                        job_queue.move_to_back(jobboard.ident)
+                row.append(round((time.perf_counter() - start) / num_runs * 1000, 3))
+
+                for policy in (StrideScheduler, DueScheduler):
+                    filename_schedule = os.path.join(tmp_dir, f"{policy.name}_{num_rows}.pkl")
+                    scheduler = policy(filename_schedule)
+                    scheduler.update(job_queue, JobBoardRows(columns), CatalogDelta(base= 'key', key= 'key'))
+                    scheduler.save()
+                    start = time.perf_counter()
+                    for _ in range(num_runs):
+                        scheduler.update(job_queue, JobBoardRows(columns), CatalogDelta(base= 'key', key= 'key'))
+                        scheduler.select(max_sites, lambda jobboard: True)
+                        scheduler.save()
+                    row.append(round((time.perf_counter() - start) / num_runs * 1000, 3))
+                filename_schedule = os.path.join(tmp_dir, f"stride_{num_rows}.pkl")
+                row.append(round(time_call(lambda: StrideScheduler.load(filename_schedule), repeat= 3), 1))
+                results.append(tuple(row))
+    finally:
+        for attr, value in class_attrs.items():
+            setattr(JobBoard, attr, value)
+    print_results(f"Scheduler: ms per run opening {max_sites} urls",
+        ('boards', 'open_websites_ms', 'window_ms', 'stride_ms', 'due_ms', 'load_ms'), results)
+
+
+def bench_selection(sizes: Tuple[int] = (1_000, 10_000, 100_000, 1_000_000), max_sites: int = 5, repeat: int = 3) -> None:
+    """Selecting boards to open: open_websites() on every board vs select_boards() over arrays, & numpy's import."""
+    import random
+    from .class_jobboard import JobBoard
+    from .indexed_queue import IndexedJobQueue
+    from .queue_methods import QueueMethods
+    from .selection import BoardArrays, select_boards
+    from .url_opener import UrlOpener
+    option_jobboardattr = (("boards", "jobboard"), ("orgs", "organization"))
+    class_attrs = {attr: getattr(JobBoard, attr, None) for attr in
+        ('job_queue', 'MAX_SITES_TO_OPEN', 'sites_opened', 'used_jobsites', 'url_opener', 'boards', 'orgs')}
+
+    import_ms = subprocess.run(
+        [sys.executable, '-c', 'import time; t = time.perf_counter(); import numpy; print((time.perf_counter() - t) * 1000)'],
+        capture_output= True, text= True).stdout.strip()
+    results = []
+    try:
+        JobBoard.url_opener = UrlOpener(spacing= 0.0, open_url= lambda url: True)
+        JobBoard.MAX_SITES_TO_OPEN = max_sites
+        for num_rows in sizes:
+            rng = random.Random(0)
+            jobboards = [
+                JobBoard(ident, 'name', ['url'] * rng.choice((1, 1, 2, 3)), '', rng.randint(1, 5), ident % 4 != 0, ident % 4 == 0, ())
+                for ident in range(num_rows)
+            ]
+            JobBoard.job_queue = job_queue = IndexedJobQueue(range(num_rows))
+            QueueMethods.set_Q_indices(job_queue, jobboards)
+
+            for orgs in (True, False):
+                JobBoard.boards, JobBoard.orgs = True, orgs
+
+                def run_loop():
+                    JobBoard.sites_opened, JobBoard.used_jobsites = 0, []
+                    for jobboard in jobboards:
+                        jobboard.open_websites(option_jobboardattr)
+                loop_ms = time_call(run_loop, repeat)
+                expected = [ident for _, ident in JobBoard.used_jobsites]
+
+                arrays = BoardArrays.from_jobboards(jobboards)
+                build_ms = time_call(lambda: BoardArrays.from_jobboards(jobboards), repeat)
+                kwargs = dict(
+                    excluded= () if orgs else ('organization',),
+                    full_queue= JobBoard.is_queue_filtered(option_jobboardattr),
+                    is_allowed= lambda row: jobboards[row].is_allowed(option_jobboardattr),
+                )
+                select_ms = time_call(lambda: select_boards(arrays, max_sites, num_rows, **kwargs), repeat)
+                selection = select_boards(arrays, max_sites, num_rows, **kwargs)
+                assert arrays.ids[selection.opened].tolist() == expected
+
+                results.append((num_rows, 'all' if orgs else 'no orgs', round(loop_ms, 2),
+                    round(build_ms, 2), round(select_ms, 3), round(loop_ms / (build_ms + select_ms), 1)))
+        JobBoard.url_opener.wait()
+    finally:
+        for attr, value in class_attrs.items():
+            setattr(JobBoard, attr, value)
+    print_results(f"Selection: {max_sites} urls, numpy import {float(import_ms):.0f} ms",
+        ('boards', 'options', 'loop_ms', 'arrays_ms', 'select_ms', 'speedup'), results)
+
+
+def bench_knapsack(sizes: Tuple[int] = (10_000, 100_000, 1_000_000), budgets: Tuple[int] = (5, 20, 50), repeat: int = 3) -> None:
+    """Filling the url budget: first-fit select_boards() vs select_boards_knapsack(), time & budget used.
+
+    Catalogs: 'mixed' has mostly 1-3 urls per board, 'multi' 2-8 urls per board, &
+    'few' is 'multi' with a --region filter leaving 200 boards.
+    """
+    import numpy as np
+    from .selection import BoardArrays, get_values, select_boards, select_boards_knapsack
+    results = []
+    for num_rows in sizes:
+        rng = np.random.default_rng(0)
+        Q_priority = rng.integers(1, 11, num_rows)
+        region_boards = set(rng.choice(num_rows, 200, replace= False).tolist())
+        catalogs = (
+            ('mixed', np.minimum(rng.geometric(0.35, num_rows), 12), {}),
+            ('multi', rng.integers(2, 9, num_rows), {}),
+            ('few', rng.integers(2, 9, num_rows), dict(region_boards= region_boards, full_queue= True)),
+        )
+        for catalog, num_urls, kwargs in catalogs:
+            arrays = BoardArrays(
+                ids= np.arange(num_rows, dtype= np.int64),
+                Q_index= np.arange(num_rows, dtype= np.int64),
+                Q_priority= Q_priority,
+                num_urls= num_urls,
+                jobboard= np.ones(num_rows, dtype= bool),
+                organization= np.zeros(num_rows, dtype= bool),
+            )
+            values = get_values(arrays, num_rows, full_queue= bool(kwargs))
+            for max_sites in budgets:
+                greedy = select_boards(arrays, max_sites, num_rows, **kwargs)
+                knapsack = select_boards_knapsack(arrays, max_sites, num_rows, **kwargs)
+                greedy_ms = time_call(lambda: select_boards(arrays, max_sites, num_rows, **kwargs), repeat)
+                knapsack_ms = time_call(lambda: select_boards_knapsack(arrays, max_sites, num_rows, **kwargs), repeat)
+                results.append((num_rows, catalog, max_sites,
+                    round(greedy_ms, 2), f"{greedy.sites_opened / max_sites:.0%}", round(float(values[greedy.opened].sum()), 2),
+                    round(knapsack_ms, 2), f"{knapsack.sites_opened / max_sites:.0%}", round(float(values[knapsack.opened].sum()), 2)))
+    print_results("Knapsack: url budget filled by first-fit vs knapsack, value in overdue urls",
+        ('catalog_size', 'catalog', 'budget', 'fit_ms', 'fit_used', 'fit_value', 'knap_ms', 'knap_used', 'knap_value'), results)
+
+
+def bench_stream(sizes: Tuple[int] = (1_000, 10_000, 100_000, 1_000_000), max_sites: int = 5, repeat: int = 3) -> None:
+    """Time to first tab & to a spent url budget, from loaded columns & queue: every board created & sorted,
+    vs boards created lazily in queue order by jobboard_list.iter_jobboards_in_queue()."""
+    import random
+    from . import constants, jobboard_list
+    from .catalog_delta import CatalogDelta
+    from .class_jobboard import JobBoard
+    from .indexed_queue import IndexedJobQueue
+    from .queue_methods import QueueMethods
+    option_jobboardattr = (("boards", "jobboard"), ("orgs", "organization"))
+    class_attrs = {attr: getattr(JobBoard, attr, None) for attr in
+        ('job_queue', 'MAX_SITES_TO_OPEN', 'sites_opened', 'used_jobsites', 'url_opener', 'url_checker', 'page_watcher',
+         'boards', 'orgs', 'region_boards')}
+
+    class FirstTab(object):
+        """Url opener recording when the first board was submitted."""
+        def __init__(self):
+            self.first = None
+        def submit_jobboard(self, name, urls, description):
+            if self.first is None:
+                self.first = time.perf_counter()
+
+    def run(columns, job_queue, flag_stream):
+        """Returns (ms to first tab, ms to spent budget, boards created)."""
+        start = time.perf_counter()
+        JobBoard.url_opener = opener = FirstTab()
+        JobBoard.sites_opened, JobBoard.used_jobsites = 0, []
+        JobBoard.job_queue = QueueMethods.clean_queue_ids(job_queue, columns[constants.COL_ID], CatalogDelta())
+        if flag_stream:
+            all_jobboards = jobboard_list.iter_jobboards_in_queue(columns, JobBoard.job_queue)
+        else:
+            all_jobboards = jobboard_list.create_jobboard_instances_from_columns(columns)
+            QueueMethods.set_Q_indices(JobBoard.job_queue, all_jobboards)
+            all_jobboards = sorted(all_jobboards, key = lambda x: x.Q_index)
+        num_created = 0
+        for jobboard in all_jobboards:
+            num_created += 1
+            jobboard.open_websites(option_jobboardattr)
+            if flag_stream and JobBoard.sites_opened == JobBoard.MAX_SITES_TO_OPEN:
+                break
+        end = time.perf_counter()
+        return (opener.first - start) * 1000, (end - start) * 1000, num_created
+
+    results = []
+    try:
+        JobBoard.MAX_SITES_TO_OPEN, JobBoard.url_checker, JobBoard.page_watcher = max_sites, None, None
+        JobBoard.boards, JobBoard.orgs, JobBoard.region_boards = True, True, None
+        for num_rows in sizes:
+            rand = random.Random(0)
+            ids = list(range(1, num_rows + 1))
+            columns = {
+                constants.COL_ID: ids,
+                constants.COL_NAME: [f"  board number {i} " for i in ids],
+                constants.COL_URLS: [[f"https://www.board{i}.com/jobs?q={j}" for j in range(rand.choice((1, 1, 2, 3)))] for i in ids],
+                constants.COL_DESCRIPT: [f"remote data jobs at board {i}. " for i in ids],
+                constants.COL_QUEUE_PRIORITY: [rand.randint(1, 4) for _ in ids],
+                constants.COL_JOBBOARD: [rand.random() < 0.5 for _ in ids],
+                constants.COL_ORG: [rand.random() < 0.5 for _ in ids],
+                constants.COL_LOCATIONS: [()] * num_rows,
+            }
+            saved_queue = ids[:]
+            rand.shuffle(saved_queue)
+            job_queue = IndexedJobQueue(saved_queue)        # as from QueueMethods.load_queue(), before either pipeline
+
+            row = [num_rows]
+            for flag_stream in (False, True):
+                runs = [run(columns, job_queue, flag_stream) for _ in range(repeat)]
+                row += [round(min(r[0] for r in runs), 2), round(min(r[1] for r in runs), 2), runs[0][2]]
+            results.append(tuple(row))
+    finally:
+        for attr, value in class_attrs.items():
+            setattr(JobBoard, attr, value)
+    print_results(f"Stream: time to first tab & to {max_sites} urls, from loaded columns & queue",
+        ('catalog_size', 'eager_first_ms', 'eager_done_ms', 'eager_created', 'stream_first_ms', 'stream_done_ms', 'stream_created'), results)
+
+
+def bench_lazy_jobboard(sizes: Tuple[int] = (1_000, 100_000, 1_000_000), repeat: int = 3) -> None:
+    """Creating JobBoards with derived attributes set in __post_init__ vs computed on first read, in ns/board.
+
+    read_ms reads url_nums, description & Q_index of every board, as the markdown step does when the catalog changed.
+    """
+    import random
+    from . import constants, jobboard_list
+    from .class_jobboard import JobBoard
+    from .indexed_queue import IndexedJobQueue
+
+    class EagerJobBoard(JobBoard):
+        """Previous implementation: derived attributes set in __post_init__, & Q_index by QueueMethods.set_Q_indices()."""
+        __slots__ = ()
+
+        def __post_init__(self, description):
+            JobBoard.__post_init__(self, description)
+            self.url_nums = JobBoard.get_url_nums(self.urls)
+            self.description = description.replace("\n", "")
+
+    def create(cls, columns, job_queue):
+        jobboards = [
+            cls(ident, name, urls, description, Q_priority, jobboard, organization, locations)
+            for ident, name, urls, description, Q_priority, jobboard, organization, locations in zip(
+                *(columns[col] for col in jobboard_list.COLS_JOBBOARD))
+        ]
+        if cls is EagerJobBoard:
+            for jobboard in jobboards:
+                jobboard.Q_index = job_queue.index(jobboard.ident)
+        return jobboards
+
+    def read(jobboards):
+        for jobboard in jobboards:
+            jobboard.url_nums, jobboard.description, jobboard.Q_index
+
+    job_queue = JobBoard.job_queue
+    results = []
+    try:
+        for num_rows in sizes:
+            rand = random.Random(0)
+            ids = list(range(1, num_rows + 1))
+            columns = {
+                constants.COL_ID: ids,
+                constants.COL_NAME: [f"Board Number {i}" for i in ids],
+                constants.COL_URLS: [[f"https://www.board{i}.com/jobs?q={j}" for j in range(rand.choice((1, 1, 2, 3)))] for i in ids],
+                constants.COL_DESCRIPT: [f"Remote data jobs at board {i}." for i in ids],
+                constants.COL_QUEUE_PRIORITY: [rand.randint(1, 4) for _ in ids],
+                constants.COL_JOBBOARD: [rand.random() < 0.5 for _ in ids],
+                constants.COL_ORG: [rand.random() < 0.5 for _ in ids],
+                constants.COL_LOCATIONS: [()] * num_rows,
+            }
+            JobBoard.job_queue = IndexedJobQueue(rand.sample(ids, num_rows))
+
+            row = [num_rows]
+            for cls in (EagerJobBoard, JobBoard):
+                create_ms = time_call(lambda: create(cls, columns, JobBoard.job_queue), repeat)
+                read_ms = float('inf')
+                for _ in range(repeat):         # attributes are only computed on the first read of new boards
+                    jobboards = create(cls, columns, JobBoard.job_queue)
+                    start = time.perf_counter()
+                    read(jobboards)
+                    read_ms = min(read_ms, (time.perf_counter() - start) * 1000)
+                row += [round(create_ms, 2), round(create_ms * 1e6 / num_rows), round(read_ms, 2)]
+            assert [(jobboard.url_nums, jobboard.description, jobboard.Q_index) for jobboard in jobboards] == \
+                [(jobboard.url_nums, jobboard.description, jobboard.Q_index) for jobboard in create(EagerJobBoard, columns, JobBoard.job_queue)]
+            results.append(tuple(row))
+    finally:
+        JobBoard.job_queue = job_queue
+    print_results("Lazy JobBoard: derived attributes in __post_init__ vs on first read",
+        ('catalog_size', 'eager_ms', 'eager_ns_board', 'eager_read_ms', 'lazy_ms', 'lazy_ns_board', 'lazy_read_ms'), results)
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'snapshot': bench_snapshot_cache,
+    'workbook': bench_workbook_loader,
+    'reader': bench_builtin_reader,
+    'locations': bench_locations,
+    'geo': bench_geo_index,
+    'urls': bench_url_col,
+    'instances': bench_jobboard_instances,
+    'memory': bench_jobboard_memory,
+    'queue': bench_job_queue,
+    'clean': bench_clean_queue,
+    'save': bench_save_queue,
+    'load': bench_load_queue,
+    'sqlite': bench_sqlite_store,
+    'delta': bench_catalog_delta,
+    'markdown': bench_markdown_table,
+    'opener': bench_url_opener,
+    'launchpad': bench_launchpad,
+    'checker': bench_url_checker,
+    'watcher': bench_page_watcher,
+    'scheduler': bench_scheduler,
+    'selection': bench_selection,
+    'knapsack': bench_knapsack,
+    'stream': bench_stream,
+    'lazy': bench_lazy_jobboard,
+}
+
+
+##########
+# Main
+##########
+
+def main():
+    names = [a for a in sys.argv[1:] if a in BENCHMARKS] or list(BENCHMARKS.keys())
+    for name in names:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
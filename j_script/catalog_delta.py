@@ -0,0 +1,114 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 17:20:31
+ * @modify date 2026-10-18 21:35:09
+ * @desc [
+    Row-level change detection for the jobboard catalog.
+
+    Each row of the jobboards sheet is hashed from its raw cell values, and
+    the hashes are stored in the snapshot. When the workbook changes, the
+    new hashes are compared to the previous run's to find the boards that
+    were added, changed or removed. A delta records the snapshot keys it's
+    between, so state synced on an older run, e.g., a schedule, can tell
+    whether the delta covers all changes since.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import hashlib
+from dataclasses import dataclass, field
+
+from . import constants
+from .script_objects import Any, Columns, Dict, JobIDs, SnapshotKey, Union
+
+
+##########
+# Constants
+##########
+
+PICKLE_PROTOCOL = 4         # fixed, so hashes stay stable across Python versions
+DIGEST_SIZE = 16
+
+
+##########
+# Catalog Delta
+##########
+
+@dataclass
+class CatalogDelta(object):
+    """Jobboard ids added, changed & removed since the previous snapshot.
+
+    Args:
+        added (JobIDs): ids of new rows, in catalog order
+        changed (JobIDs): ids of rows with different values, in catalog order
+        removed (JobIDs): ids of rows no longer in the catalog
+        base (Union[SnapshotKey, None]): snapshot key of the catalog the delta is from, None if unknown
+        key (Union[SnapshotKey, None]): snapshot key of the catalog the delta is to, None if unknown
+    """
+    added: JobIDs = field(default_factory= list)
+    changed: JobIDs = field(default_factory= list)
+    removed: JobIDs = field(default_factory= list)
+    base: Union[SnapshotKey, None] = field(default= None, compare= False)
+    key: Union[SnapshotKey, None] = field(default= None, compare= False)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __str__(self) -> str:
+        return f"{len(self.added)} jobboards added, {len(self.changed)} changed, {len(self.removed)} removed"
+
+
+##########
+# Hashes
+##########
+
+def get_hash(values: Any) -> bytes:
+    """Returns digest of the pickled values. Cell values are ints, floats, strs, bools or None."""
+    import pickle
+    return hashlib.blake2b(pickle.dumps(values, PICKLE_PROTOCOL), digest_size= DIGEST_SIZE).digest()
+
+
+def get_row_hashes(columns: Columns) -> Dict[int, bytes]:
+    """Returns digest of each row's values, by row id.
+
+    Args:
+        columns (Columns): {column: values} of a sheet, including constants.COL_ID
+
+    Returns:
+        Dict[int, bytes]: {id: digest}
+    """
+    import pickle
+    cols = sorted(col for col in columns if col != constants.COL_ID)
+    rows = zip(*(columns[col] for col in cols))
+    blake2b, dumps = hashlib.blake2b, pickle.dumps
+    return {
+        ident: blake2b(dumps(row, PICKLE_PROTOCOL), digest_size= DIGEST_SIZE).digest()
+        for ident, row in zip(columns[constants.COL_ID], rows)
+    }
+
+
+def get_delta(previous_hashes: Dict[int, bytes], row_hashes: Dict[int, bytes]) -> CatalogDelta:
+    """Returns ids added, changed & removed from previous_hashes to row_hashes.
+
+    Args:
+        previous_hashes (Dict[int, bytes]): row hashes of the previous snapshot
+        row_hashes (Dict[int, bytes]): row hashes of the workbook
+
+    Returns:
+        CatalogDelta: changed ids
+    """
+    delta = CatalogDelta()
+    for ident, row_hash in row_hashes.items():
+        previous_hash = previous_hashes.get(ident)
+        if previous_hash is None:
+            delta.added.append(ident)
+        elif previous_hash != row_hash:
+            delta.changed.append(ident)
+    if len(row_hashes) - len(delta.added) != len(previous_hashes):
+        delta.removed = [ident for ident in previous_hashes if ident not in row_hashes]
+    return delta
@@ -2,7 +2,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-09-29 21:08:40
- * @modify date 2020-10-03 19:49:18
+ * @modify date 2026-10-18 20:41:07
  * @desc [
     Contains job site class to contain job information
 
@@ -17,12 +17,11 @@
 ##########
 
 import math
-import webbrowser
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass
 
 from . import constants
-from .queue_methods import QueueMethods
-from .script_objects import JobIDs, List, Tuple, all_jobboards
+from .indexed_queue import IndexedJobQueue
+from .script_objects import Any, JobIDs, List, Tuple, all_jobboards
 
 
 ##########
@@ -31,13 +30,17 @@ from .script_objects import JobIDs, List, Tuple, all_jobboards
 
 @dataclass
 class JobBoard(object):
-    job_queue = QueueMethods.load_queue()
+    job_queue = IndexedJobQueue()     # loaded by main with QueueMethods.load_queue()
     flag_cleaned_queue = False
     used_jobsites = list()
 
     MAX_SITES_TO_OPEN = constants.MAX_SITES_TO_OPEN
     sites_opened = 0
+    region_boards = None       # ids of boards in the --region filter, None if no filter
     flag_show_opened_max_sites = True
+    url_opener = None          # UrlOpener or Launchpad set by main; urls are opened serially without one
+    url_checker = None         # UrlChecker set by main; boards with all urls known dead aren't opened
+    page_watcher = None        # PageWatcher set by main; organizations unchanged since last opened aren't opened
 
     attrs_to_print = (
         'ident',
@@ -84,86 +87,106 @@ class JobBoard(object):
         Q_priority (int): (1/Q_priority) of queue to search.
         jobboard (bool): indicates if jobboard
         organization (bool): indicates if a specific org
-        country (str): country location
-        state (str): state location
-        city (str): city location
+        locations (Tuple[int]): location ids in the LocationTable
     """
+    ## Instance attributes are slots, not a __dict__, to keep large catalogs small.
+    ## Derived slots are left unset until first read, see __getattr__.
+    __slots__ = (
+        'ident', 'name', 'urls', 'raw_description', 'Q_priority', 'jobboard', 'organization', 'locations',
+        'description', 'Q_index', 'flag_opened', 'url_nums', 'checked_jobs_in_Q',
+    )
+
     ## Args
     ident : int     # identification
     name: str
     urls: List[str]
-    description: str
+    description: InitVar[str]       # kept as raw_description, cleaned on first read
     Q_priority: int
     jobboard: bool
     organization: bool
-    country: str
-    state: str
-    city: str
+    locations: Tuple[int]
 
 
     ## Custom methods
-    def __post_init__(self):
-        """Called at end of __init__ by dataclass."""
-        self.Q_index = self.get_Q_index()
-
+    def __post_init__(self, description: str):
+        """Called at end of __init__ by dataclass. Derived attributes are computed on first read."""
         ## Init flags
         self.flag_opened = False
 
-        ## For markdown
-        self.url_nums = ','.join([f"[{i + 1}]({self.urls[i]})" for i in range(len(self.urls))])
-        self.description = self.description.replace("\n", "")
+        self.raw_description = description
         return
 
 
-    ##########
-    # Instance methods
-    ##########
-    def get_Q_index(self) -> int:
-        """Returns index of jobsite instance in queue. If not in queue, adds to end.
+    def __getattr__(self, name: str) -> Any:
+        """Called for unset slots: computes derived attributes & caches them in their slots.
+
+            - description: raw_description without line breaks, for markdown
+            - url_nums: markdown links to urls
+            - Q_index: position in the shared JobBoard.job_queue, unless set, e.g., by QueueMethods.set_Q_indices()
 
-        Returns:
-            int: index in job queues
+        Raises:
+            AttributeError: name isn't a derived attribute
         """
-        for i in range(len(self.job_queue)):
-            if self.job_queue[i] == self.ident:
-                return i
-        
-        return self.create_new_index()
-    
+        if name == 'description':
+            value = self.raw_description.replace("\n", "")
+        elif name == 'url_nums':
+            value = JobBoard.get_url_nums(self.urls)
+        elif name == 'Q_index':
+            value = JobBoard.job_queue.index(self.ident)
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        setattr(self, name, value)
+        return value
 
-    def create_new_index(self) -> int:
-        """Creates new index in job_queue for jobboard.
 
-        Returns:
-            int: index of jobboard in queue.
-        """
-        index = len(self.job_queue)
-        self.job_queue.append(self.ident)
-        print(f"- Adding {self.name} ({self.ident}) to job queue at index {index}")
-        return index
+    @staticmethod
+    def get_url_nums(urls: List[str]) -> str:
+        """Returns markdown links to urls, numbered from 1."""
+        return ','.join([f"[{i + 1}]({urls[i]})" for i in range(len(urls))])
+
+
+    ##########
+    # Instance methods
+    ##########
+    @classmethod
+    def is_queue_filtered(cls, option_jobboardattr: Tuple[ Tuple[ str, str]]) -> bool:
+        """Returns True if an option or region filter is set, so the whole queue is searched."""
+        for option_set in option_jobboardattr:
+            c_attr, _ = option_set
+            if getattr(cls, c_attr) == False:
+                return True
+        return cls.region_boards is not None
 
 
     def set_checked_jobs_in_Q(self, option_jobboardattr: Tuple[ Tuple[ str, str]]) -> None:
         """sets how many items were checks first in queue for this JobBoard."""
-        for option_set in option_jobboardattr:  
-            c_attr, _ = option_set
-            if getattr(self, c_attr) == False:      # if an option is passed, search whole queue.
-                self.checked_jobs_in_Q = len( self.job_queue)
-                return
+        if JobBoard.is_queue_filtered(option_jobboardattr):      # if an option is passed, search whole queue.
+            self.checked_jobs_in_Q = len( self.job_queue)
+            return
 
         self.checked_jobs_in_Q = math.ceil(len( self.job_queue) / self.Q_priority)
         return
 
 
-    def set_flag_opened(self, option_jobboardattr: Tuple) -> bool:
-        """Returns self.flag_opened to determine if url should be opened.
-        """
-        flag_opened = True
-
+    def is_allowed(self, option_jobboardattr: Tuple[ Tuple[ str, str]]) -> bool:
+        """Returns False if the board is filtered out by an option or region, or its urls are known dead or unchanged."""
         for tup in option_jobboardattr:     # check if options were set for opening
             c_attr, i_attr = tup
             if getattr(self, c_attr) == False and getattr(self, i_attr):
-                flag_opened = False
+                return False
+        if JobBoard.region_boards is not None and self.ident not in JobBoard.region_boards:
+            return False
+        if JobBoard.url_checker is not None and JobBoard.url_checker.is_dead(self.urls):
+            return False
+        if JobBoard.page_watcher is not None and self.organization and not JobBoard.page_watcher.has_changed(self.urls):
+            return False
+        return True
+
+
+    def set_flag_opened(self, option_jobboardattr: Tuple) -> bool:
+        """Returns self.flag_opened to determine if url should be opened.
+        """
+        flag_opened = self.is_allowed(option_jobboardattr)
 
         if self.Q_index > self.checked_jobs_in_Q:
             flag_opened = False
@@ -195,11 +218,22 @@ class JobBoard(object):
         self.set_flag_opened(option_jobboardattr)
 
         if self.flag_opened:
-            for url in self.urls: 
-                    webbrowser.open(url)
-            
-        if self.flag_opened:
-            JobBoard.used_jobsites.append( (self.Q_index, self.ident))
+            self.open()
+        return None
+
+
+    def open(self) -> None:
+        """Opens the urls. Appends tuple of index & id to used_jobsites to move the board to the back of the queue."""
+        if JobBoard.url_opener is not None:
+            JobBoard.url_opener.submit_jobboard(self.name, self.urls, self.description)
+        else:
+            import webbrowser
+            for url in self.urls:
+                webbrowser.open(url)
+
+        JobBoard.used_jobsites.append( (self.Q_index, self.ident))
+        if JobBoard.page_watcher is not None:
+            JobBoard.page_watcher.mark_visited(self.urls)
         return None
     
 
@@ -2,7 +2,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-02 15:25:27
- * @modify date 2020-10-02 15:25:27
+ * @modify date 2026-10-18 19:45:38
  * @desc [
     Script constants
  ]
@@ -14,23 +14,41 @@
 FILENAME_JOBBOARDS = r"C:\Users\Jai\Documents\github\job_visitor\job_files\jobboard_info.xlsx"
 FILENAME_MD = r"C:\Users\Jai\Documents\github\job_visitor\job_files\Jobboards.md"
 FILENAME_PICKLE = r"C:\Users\Jai\Documents\github\job_visitor\job_files\job_queue.pkl"
+FILENAME_QUEUE = r"C:\Users\Jai\Documents\github\job_visitor\job_files\job_queue.bin"
+FILENAME_DB = r"C:\Users\Jai\Documents\github\job_visitor\job_files\jobboards.sqlite3"
+FILENAME_JOURNAL = r"C:\Users\Jai\Documents\github\job_visitor\job_files\job_queue.journal"
+FILENAME_SNAPSHOT = r"C:\Users\Jai\Documents\github\job_visitor\job_files\jobboard_info.snapshot"
+FILENAME_LAUNCHPAD = r"C:\Users\Jai\Documents\github\job_visitor\job_files\launchpad.html"
+FILENAME_URL_CACHE = r"C:\Users\Jai\Documents\github\job_visitor\job_files\url_cache.pkl"
+FILENAME_PAGE_STATES = r"C:\Users\Jai\Documents\github\job_visitor\job_files\page_states.pkl"
+FILENAME_SCHEDULE = r"C:\Users\Jai\Documents\github\job_visitor\job_files\schedule.pkl"
 
 
 ##########
 # JobSite 
 ##########
 MAX_SITES_TO_OPEN = 5
+OPEN_WORKERS = 4            # threads opening urls, see url_opener
+OPEN_SPACING = 0.1          # minimum seconds between url launches
+URL_CHECK_CONNECTIONS = 64  # open connections checking urls, see url_checker
+URL_CHECK_PER_HOST = 4      # open connections per host
+URL_CHECK_TIMEOUT = 10.0    # seconds per url probe
+URL_CACHE_TTL = 7 * 24 * 60 * 60    # seconds a url's status is cached
+SCHEDULE_INTERVAL = 24 * 60 * 60    # seconds per Q_priority between opens, see scheduler.DueScheduler
+SELECT_ARRAYS_MIN_BOARDS = 150_000   # boards before selection.select_boards() beats open_websites(), with numpy's import
+SELECT_ARRAYS_MIN_BOARDS_NUMPY = 1_000      # same, when numpy is already imported, e.g., by pandas
 
 
 ##########
 # CSV
 ##########
-SHEETNAMES = (
-	"job_sites",
+SHEETNAME_JOBBOARDS = "job_sites"
+SHEETNAMES_LOCATIONS = (
 	"country",
 	"state",
 	"city",
 )
+SHEETNAMES = (SHEETNAME_JOBBOARDS,) + SHEETNAMES_LOCATIONS
 
 DELIMITER_LOC = ','
 DELIMITER_URL = '\n'
@@ -49,6 +67,7 @@ COL_ORG = 'organization'
 COL_COUNTRY = 'country'
 COL_STATE = 'state'
 COL_CITY = 'city'
+COL_LOCATIONS = 'locations'     # NOTE: location ids, replaces country, state, & city
 
 
 ##########
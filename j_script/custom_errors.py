@@ -2,7 +2,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-02 15:24:06
- * @modify date 2020-10-02 15:24:06
+ * @modify date 2026-10-18 16:40:12
  * @desc [
     Defines custom errors in this script.
  ]
@@ -14,10 +14,10 @@
 ##########
 
 try:
-	from .script_objects import (Any, DataFrame, DataFrames, Iterator, Series,
-	                             Union)
+	from .script_objects import (Any, DataFrame, DataFrames, Iterator, List,
+	                             Series, Union)
 except:
-	from script_objects import Any, DataFrame, DataFrames, Iterator, Series, Union
+	from script_objects import Any, DataFrame, DataFrames, Iterator, List, Series, Union
 
 
 ##########
@@ -39,3 +39,57 @@ class IncompatibleData(Exception):
 		super().__init__(message)
 		return
 
+
+class IncompatibleDataList(IncompatibleData):
+	"""Class to show every incompatible value in a column."""
+	def __init__(self, vals: List[Any], ids: List[Any], column: str) -> None:
+		"""Displays Error message with each incompatible data location
+
+		Args:
+			vals (List[Any]): values that raised error
+			ids (List[Any]): row id of each value
+			column (str): Column of dataframe
+		"""
+		self.vals = vals
+		self.ids = ids
+		message = '\n'.join(
+			f"Invalid value: [{val}] in column: {column} with id {ident}" for val, ident in zip(vals, ids))
+		Exception.__init__(self, message)
+		return
+
+
+##########
+# Xlsx Format
+##########
+
+class XlsxFormatError(Exception):
+	"""Class to show workbook content the built-in xlsx reader can't parse."""
+	def __init__(self, filename: str, reason: Any) -> None:
+		"""Displays Error message with workbook & reason.
+
+		Args:
+			filename (str): workbook being read
+			reason (Any): error or description of unsupported content
+		"""
+		message = f"Cannot read {filename} with the built-in reader: {reason}"
+		super().__init__(message)
+		return
+
+
+##########
+# Queue File
+##########
+
+class QueueFileError(Exception):
+	"""Class to show a queue file that is corrupt or can't be read."""
+	def __init__(self, filename: str, reason: Any) -> None:
+		"""Displays Error message with queue file & reason.
+
+		Args:
+			filename (str): queue file being read
+			reason (Any): error or description of the corruption
+		"""
+		message = (f"Corrupt job queue {filename}: {reason}. "
+			"Restore it from a backup, or delete it to start a new queue.")
+		super().__init__(message)
+		return
@@ -2,7 +2,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-02 16:59:04
- * @modify date 2020-10-02 16:59:04
+ * @modify date 2026-10-18 14:06:12
  * @desc [
 	Contains methods to load script data frames.
  ]
@@ -14,13 +14,12 @@
 # Imports
 ##########
 
-import pandas as pd
-
 from . import constants
 from . import custom_errors
 from . import locations
 from . import transform_col
-from .class_jobboard import JobBoard
+from .geo_index import LocationTable
+from .snapshot_cache import SnapshotCache
 from .script_objects import all_jobboards, DataFrame, DataFrames, Tuple
 
 ##########
@@ -34,31 +33,60 @@ def load_dataframes(
 	"""Loads JobBoard data from xlsx file with `file_name`.
 
 	Args:
-		filename (str): csv to read.
+		filename (str): xlsx to read.
+		sheetnames (Tuple[str], optional): sheets to parse. Defaults to constants.SHEETNAMES.
 
 	Returns:
-		DataFrames: tuple of pandas data frames.
+		DataFrames: tuple of pandas data frames, in the order of sheetnames.
+	
+	NOTE:
+	The workbook is opened, and its shared strings parsed, once for all sheets.
 	"""
+	import pandas as pd
+	with pd.ExcelFile(filename) as workbook:
+		dataframes = tuple(workbook.parse(sheet, index_col = 0) for sheet in sheetnames)
+	return dataframes
 
-	df_JobBoards, df_countries, df_states, df_cities = (
-		pd.read_excel( filename, sheet, index_col = 0) for sheet in sheetnames
-		)
-	return (df_JobBoards, df_countries, df_states, df_cities)
 
+def get_df_jobboards(
+	filename: str = constants.FILENAME_JOBBOARDS,
+	flag_locations: bool = True,
+	use_snapshot: bool = True,
+	filename_snapshot: str = None,
+	) -> Tuple[DataFrame, LocationTable]:
+	"""Returns cleaned JobBoard dataframe & the location table
 
-def get_df_jobboards() -> DataFrame:
-	"""Returns cleaned JobBoard dataframe
+	Args:
+		filename (str, optional): workbook to read. Defaults to constants.FILENAME_JOBBOARDS.
+		flag_locations (bool, optional): load location sheets & location ids. Defaults to True.
+		use_snapshot (bool, optional): load from/save to the snapshot cache. Defaults to True.
+		filename_snapshot (str, optional): snapshot file. Defaults to constants.FILENAME_SNAPSHOT.
 
 	Returns:
-		DataFrame: Cleaned dataframe of JobBoard information
+		Tuple[DataFrame, LocationTable]: Cleaned dataframe of JobBoard information, & location table.
+		Without flag_locations, the table is empty & boards have no location ids.
 	"""
-	df_JobBoards, df_countries, df_states, df_cities = load_dataframes()
+	snapshot_tag = 'df_jobboards' if flag_locations else 'df_jobboards_no_locations'
+	if use_snapshot:
+		key = SnapshotCache.get_key(filename)
+		snapshot = SnapshotCache.load(key, tag= snapshot_tag, filename_snapshot= filename_snapshot)
+		if snapshot is not None:
+			return snapshot
+
+	if flag_locations:
+		df_JobBoards, *df_location_keys = load_dataframes(filename, constants.SHEETNAMES)
 
-	## Get countries
-	df_location_keys = (df_countries, df_states, df_cities)
-	df_JobBoards = locations.get_str_locations(df_JobBoards, df_location_keys)
+		## Get location ids
+		df_JobBoards, location_table = locations.get_locations(df_JobBoards, df_location_keys)
+	else:
+		df_JobBoards, = load_dataframes(filename, (constants.SHEETNAME_JOBBOARDS,))
+		df_JobBoards = df_JobBoards.drop(columns= list(constants.AUX_DF_KEYS))
+		df_JobBoards[constants.COL_LOCATIONS] = [()] * len(df_JobBoards)
+		location_table = LocationTable()
 
 	## Urls to lists
 	df_JobBoards = transform_col.transform_col_to_list_type(df_JobBoards)
 
-	return df_JobBoards
+	if use_snapshot:
+		SnapshotCache.save((df_JobBoards, location_table), key, tag= snapshot_tag, filename_snapshot= filename_snapshot)
+	return df_JobBoards, location_table
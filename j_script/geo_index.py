@@ -0,0 +1,203 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 13:41:09
+ * @modify date 2026-10-18 22:41:30
+ * @desc [
+    Relational location table & hierarchical geo index.
+
+    LocationTable: location id -> (country, state, city).
+    GeoIndex: country -> state -> city -> board ids, with the board ids of
+    every node's subtree stored on the node so region lookups don't walk
+    the tree. It's saved with the catalog snapshot & updated by the
+    catalog delta, see record_methods.
+
+    NOTE:
+    jobboard_info.xlsx doesn't record which state a city is in, so a board
+    listing several states & cities gets every (country, state, city)
+    combination. Lookups by a single region name are exact regardless.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, Set
+
+from .script_objects import Dict, List, Location, LocationKey, Tuple, Union
+
+
+##########
+# Location table
+##########
+
+@dataclass
+class LocationTable(object):
+    """Unique (country, state, city) rows. A location's id is its row number.
+
+    Args:
+        locations (List[Location]): (country, state, city) names; None if unspecified.
+    """
+    locations: List[Location] = field(default_factory= list)
+
+    def __post_init__(self):
+        """Called at end of __init__ by dataclass."""
+        self.location_ids = {location: i for i, location in enumerate(self.locations)}
+
+    def __getitem__(self, location_id: int) -> Location:
+        return self.locations[location_id]
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def get_id(self, location: Location) -> int:
+        """Returns id of location, adding a row if it's new."""
+        location_id = self.location_ids.get(location)
+        if location_id is None:
+            location_id = len(self.locations)
+            self.locations.append(location)
+            self.location_ids[location] = location_id
+        return location_id
+
+
+def get_location_table(
+    countries: List[Tuple[int]],
+    states: List[Tuple[int]],
+    cities: List[Tuple[int]],
+    location_names: Tuple[Dict[int, str]],
+    location_table: LocationTable = None,
+    ) -> Tuple[LocationTable, List[Tuple[int]]]:
+    """Returns location table & each board's location ids from its location ints.
+
+    Args:
+        countries (List[Tuple[int]]): country ints of each board
+        states (List[Tuple[int]]): state ints of each board
+        cities (List[Tuple[int]]): city ints of each board
+        location_names (Tuple[Dict[int, str]]): Respectively: country, state, and city names.
+        location_table (LocationTable, optional): table to add rows to. Defaults to a new table.
+
+    Returns:
+        Tuple[LocationTable, List[Tuple[int]]]: table, and location ids of each board.
+    """
+    country_names, state_names, city_names = location_names
+    if location_table is None:
+        location_table = LocationTable()
+    location_ids_cache = {}
+
+    board_location_ids = []
+    for board_codes in zip(countries, states, cities):
+        location_ids = location_ids_cache.get(board_codes)
+        if location_ids is None:
+            country_codes, state_codes, city_codes = (codes or (0,) for codes in board_codes)
+            location_ids = tuple(
+                location_table.get_id((country_names.get(c), state_names.get(s), city_names.get(t)))
+                for c in country_codes
+                for s in state_codes
+                for t in city_codes
+                if (c, s, t) != (0, 0, 0)
+            )
+            location_ids_cache[board_codes] = location_ids
+        board_location_ids.append(location_ids)
+    return location_table, board_location_ids
+
+
+##########
+# Geo index
+##########
+
+class GeoIndex(object):
+    """Hierarchical index: country -> state -> city -> board ids."""
+    path_sep = '/'
+
+    def __init__(self, location_table: LocationTable, board_locations: Iterable[Tuple[int, Tuple[int]]]):
+        """Builds the index.
+
+        Args:
+            location_table (LocationTable): location rows
+            board_locations (Iterable[Tuple[int, Tuple[int]]]): (board id, location ids) of each board
+        """
+        self.tree: Dict[str, Dict[str, Dict[str, Set[int]]]] = {}
+        self.node_boards: Dict[LocationKey, Set[int]] = {}
+        self.names: Dict[str, List[LocationKey]] = {}
+
+        for ident, location_ids in board_locations:
+            for location_id in location_ids:
+                self.add(ident, location_table[location_id])
+        return None
+
+
+    def add(self, ident: int, location: Location) -> None:
+        """Adds board to the node of its location & to every node above it."""
+        country, state, city = location
+        self.tree.setdefault(country, {}).setdefault(state, {}).setdefault(city, set()).add(ident)
+
+        for key in ((country,), (country, state), (country, state, city)):
+            boards = self.node_boards.get(key)
+            if boards is None:
+                boards = self.node_boards[key] = set()
+                if key[-1] is not None:
+                    self.names.setdefault(key[-1].lower(), []).append(key)
+            boards.add(ident)
+        return None
+
+
+    def remove(self, ident: int, locations: Iterable[Location]) -> None:
+        """Removes board from the nodes of all its locations & the nodes above them. Empty nodes are dropped."""
+        for country, state, city in locations:
+            states = self.tree.get(country, {})
+            cities = states.get(state, {})
+            boards = cities.get(city)
+            if boards is not None:
+                boards.discard(ident)
+                if not boards:
+                    del cities[city]
+                    if not cities:
+                        del states[state]
+                        if not states:
+                            del self.tree[country]
+
+            for key in ((country,), (country, state), (country, state, city)):
+                boards = self.node_boards.get(key)
+                if boards is None:
+                    continue
+                boards.discard(ident)
+                if not boards:
+                    del self.node_boards[key]
+                    if key[-1] is not None:
+                        self.names[key[-1].lower()].remove(key)
+                        if not self.names[key[-1].lower()]:
+                            del self.names[key[-1].lower()]
+        return None
+
+
+    ##########
+    # Lookups
+    ##########
+    def get_keys(self, region: str) -> List[LocationKey]:
+        """Returns keys of nodes matching region.
+
+        Args:
+            region (str): location name, e.g., "California", or path, e.g., "United States/California"
+        """
+        if self.path_sep in region:
+            key = tuple(part.strip() or None for part in region.split(self.path_sep))
+            return [key] if key in self.node_boards else []
+        return self.names.get(region.strip().lower(), [])
+
+
+    def boards_in(self, region: str) -> Union[Set[int], FrozenSet[int]]:
+        """Returns ids of boards covering region. Do not modify the returned set.
+
+        Args:
+            region (str): location name, or path of names separated by '/'
+
+        Returns:
+            Union[Set[int], FrozenSet[int]]: board ids
+        """
+        keys = self.get_keys(region)
+        if len(keys) == 1:
+            return self.node_boards[keys[0]]
+        return frozenset().union(*(self.node_boards[key] for key in keys))
@@ -0,0 +1,111 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 12:20:19
+ * @modify date 2026-10-18 12:20:19
+ * @desc [
+    Import-time profile of the script's startup, for `main.py --import-profile`.
+
+    Runs the import in a fresh interpreter with `-X importtime`, and drops
+    modules the bare interpreter already imports at startup.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import subprocess
+import sys
+
+from .script_objects import Dict, List, Tuple
+
+
+##########
+# Constants
+##########
+
+IMPORTTIME_PREFIX = 'import time:'
+
+
+##########
+# Parse -X importtime
+##########
+
+def get_import_times(code: str, cwd: str = None) -> List[Tuple[str, int, int, int]]:
+    """Runs code in a fresh interpreter & returns its import times.
+
+    Args:
+        code (str): python code to run, e.g., "import main"
+        cwd (str, optional): working directory. Defaults to None.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: (module, depth, self_us, cumulative_us) in import order.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd= cwd, stdout= subprocess.DEVNULL, stderr= subprocess.PIPE, text= True,
+    )
+    import_times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        self_us, cumulative_us, module = line[len(IMPORTTIME_PREFIX):].split('|')
+        if not self_us.strip().isdigit():
+            continue        # header line
+
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        import_times.append((module.strip(), depth, int(self_us), int(cumulative_us)))
+    return import_times
+
+
+def get_startup_import_times(code: str = 'import main', cwd: str = None) -> List[Tuple[str, int, int, int]]:
+    """Returns import times of code, without modules imported by the bare interpreter."""
+    baseline = {module for module, *_ in get_import_times('pass', cwd)}
+    return [entry for entry in get_import_times(code, cwd) if entry[0] not in baseline]
+
+
+##########
+# Report
+##########
+
+def print_import_profile(code: str = 'import main', cwd: str = None, limit: int = 25) -> None:
+    """Prints startup import cost per top-level package & the slowest modules.
+
+    Args:
+        code (str, optional): python code to profile. Defaults to 'import main'.
+        cwd (str, optional): working directory. Defaults to None.
+        limit (int, optional): number of modules to show. Defaults to 25.
+    """
+    from .tableinfo import TableInfo
+
+    import_times = get_startup_import_times(code, cwd)
+    total_us = sum(cumulative_us for _, depth, _, cumulative_us in import_times if depth == 0)
+
+    ## Per top-level package, from self times so nested imports aren't counted twice.
+    package_us: Dict[str, int] = {}
+    package_modules: Dict[str, int] = {}
+    for module, _, self_us, _ in import_times:
+        package = module.split('.')[0]
+        package_us[package] = package_us.get(package, 0) + self_us
+        package_modules[package] = package_modules.get(package, 0) + 1
+
+    print('>' * 3, f"Import profile: {code}")
+    print(f"\t- {len(import_times)} modules, {total_us / 1000:.1f} ms")
+
+    tbl_packages = TableInfo(('package', 'modules', 'self_ms', 'percent'))
+    for package, self_us in sorted(package_us.items(), key= lambda x: x[1], reverse= True)[:limit]:
+        tbl_packages.add_entry((
+            package,
+            package_modules[package],
+            round(self_us / 1000, 2),
+            round(100 * self_us / total_us, 1) if total_us else 0,
+        ))
+    tbl_packages.print_info(show_records_col= False)
+
+    tbl_modules = TableInfo(('module', 'self_ms', 'cumulative_ms'))
+    for module, _, self_us, cumulative_us in sorted(import_times, key= lambda x: x[3], reverse= True)[:limit]:
+        tbl_modules.add_entry((module, round(self_us / 1000, 2), round(cumulative_us / 1000, 2)))
+    tbl_modules.print_info(show_records_col= False)
+    return
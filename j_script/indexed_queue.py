@@ -0,0 +1,187 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 15:36:20
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Job queue with a position map.
+
+    Ids are stored in append-only slots. Moving an id to the back, or removing
+    it, leaves a hole in its old slot; a Fenwick tree over the live slots
+    gives an id's rank (queue index) in O(log n). Holes are compacted once
+    they outnumber live ids. Without holes, an id's slot is its rank, and
+    the tree isn't built.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+from typing import Iterable
+
+from .script_objects import Dict, Iterator, JobIDs, List
+
+
+##########
+# Indexed Job Queue
+##########
+
+class IndexedJobQueue(object):
+    """Queue of jobboard ids with position lookup & O(log n) move to back.
+
+    Args:
+        ids (Iterable[int], optional): ids in queue order. Repeated ids keep their first position.
+    """
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self.slots: List[int] = list(ids)       # id of each slot, None if a hole
+        self.positions: Dict[int, int] = dict(zip(self.slots, range(len(self.slots))))     # id -> slot
+        if len(self.positions) != len(self.slots):
+            self.positions = {}
+            for ident in self.slots:
+                self.positions.setdefault(ident, len(self.positions))
+            self.slots = list(self.positions)
+        self.tree = None        # built on first hole
+        self.capacity = 0
+        return None
+
+
+    ##########
+    # Fenwick tree of live slots
+    ##########
+    def build_tree(self) -> None:
+        """Builds Fenwick tree over slots in O(n), with room to append."""
+        capacity = max(16, 2 * len(self.slots))
+        tree = [0] * (capacity + 1)
+        for i, ident in enumerate(self.slots, start = 1):
+            if ident is not None:
+                tree[i] = 1
+        for i in range(1, capacity + 1):
+            parent = i + (i & -i)
+            if parent <= capacity:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.capacity = capacity
+        return None
+
+
+    def update_tree(self, slot: int, delta: int) -> None:
+        """Adds delta to slot's count."""
+        i = slot + 1
+        tree, capacity = self.tree, self.capacity
+        while i <= capacity:
+            tree[i] += delta
+            i += i & -i
+        return None
+
+
+    def count_before(self, slot: int) -> int:
+        """Returns number of live slots before slot."""
+        i = slot
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+    def compact(self) -> None:
+        """Removes holes from slots. Ranks don't change."""
+        if len(self.slots) == len(self.positions):
+            return None
+        self.slots = [ident for ident in self.slots if ident is not None]
+        self.positions = dict(zip(self.slots, range(len(self.slots))))
+        self.tree = None
+        return None
+
+
+    ##########
+    # Lookups
+    ##########
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+    def __contains__(self, ident: int) -> bool:
+        return ident in self.positions
+
+
+    def __iter__(self) -> Iterator[int]:
+        return (ident for ident in self.slots if ident is not None)
+
+
+    def __repr__(self) -> str:
+        return f"IndexedJobQueue({self.to_list()})"
+
+
+    def index(self, ident: int) -> int:
+        """Returns index of ident in queue. O(1) without holes, else O(log n).
+
+        Raises:
+            ValueError: ident not in queue, as list.index
+        """
+        slot = self.positions.get(ident)
+        if slot is None:
+            raise ValueError(f"{ident} is not in queue")
+        if len(self.slots) == len(self.positions):
+            return slot
+        return self.count_before(slot)
+
+
+    def holds(self, ids: JobIDs) -> bool:
+        """Returns True if the queue holds exactly ids, which are unique."""
+        return len(self.positions) == len(ids) and all(map(self.positions.__contains__, ids))
+
+
+    def to_list(self) -> JobIDs:
+        """Returns ids in queue order."""
+        return list(self)
+
+
+    ##########
+    # Updates
+    ##########
+    def append(self, ident: int) -> int:
+        """Adds ident to back of queue & returns its index.
+
+        Raises:
+            ValueError: ident already in queue
+        """
+        if ident in self.positions:
+            raise ValueError(f"{ident} is already in queue")
+        if self.tree is not None and len(self.slots) == self.capacity:
+            self.compact()
+        slot = len(self.slots)
+        self.slots.append(ident)
+        self.positions[ident] = slot
+        if self.tree is not None:
+            self.update_tree(slot, 1)
+        return len(self.positions) - 1
+
+
+    def remove(self, ident: int) -> None:
+        """Removes ident from queue.
+
+        Raises:
+            ValueError: ident not in queue, as list.remove
+        """
+        slot = self.positions.pop(ident, None)
+        if slot is None:
+            raise ValueError(f"{ident} is not in queue")
+        if self.tree is None:
+            self.build_tree()
+        self.slots[slot] = None
+        self.update_tree(slot, -1)
+        if len(self.slots) > 2 * len(self.positions) + 16:
+            self.compact()
+        return None
+
+
+    def move_to_back(self, ident: int) -> None:
+        """Moves ident to back of queue."""
+        self.remove(ident)
+        self.append(ident)
+        return None
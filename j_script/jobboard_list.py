@@ -2,9 +2,14 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-02 17:30:31
- * @modify date 2020-10-02 19:47:18
+ * @modify date 2026-10-18 23:04:27
  * @desc [
     Creates JobSite instances from df_jobsites.
+
+    iter_jobboards_in_queue() creates them one at a time in queue order, so
+    a run that stops once MAX_SITES_TO_OPEN urls are open only creates the
+    boards it looked at. JobBoardRows creates them by id, for the
+    scheduling policies, which only look at the boards they pop.
  ]
  */
 """
@@ -13,11 +18,19 @@
 # Imports
 ##########
 
-from .constants import (COL_CITY, COL_COUNTRY, COL_DESCRIPT, COL_ID,
-                       COL_JOBBOARD, COL_NAME, COL_ORG, COL_QUEUE_PRIORITY,
-                       COL_STATE, COL_URLS)
+from .constants import (COL_DESCRIPT, COL_ID, COL_JOBBOARD, COL_LOCATIONS,
+                       COL_NAME, COL_ORG, COL_QUEUE_PRIORITY, COL_URLS)
 from .class_jobboard import JobBoard
-from .script_objects import all_jobboards, DataFrame
+from .indexed_queue import IndexedJobQueue
+from .script_objects import all_jobboards, Columns, DataFrame, Dict, Iterator, Union
+
+
+##########
+# Constants
+##########
+
+COLS_JOBBOARD = (COL_ID, COL_NAME, COL_URLS, COL_DESCRIPT, COL_QUEUE_PRIORITY,
+                 COL_JOBBOARD, COL_ORG, COL_LOCATIONS)
 
 
 ##########
@@ -33,26 +46,128 @@ def create_jobboard_instances(df: DataFrame) -> all_jobboards:
     Returns:
         all_jobboards: List of all JobSite Instances
     """
-    jobboards_list: list = []
-
-    for i in range(len(df)):
-        jobsite = JobBoard(
-            ident = df.index[i],
-            name = df[COL_NAME].iloc[i].strip().title(),
-            urls = df[COL_URLS].iloc[i],
-            description = df[COL_DESCRIPT].iloc[i].capitalize().strip(),
-            Q_priority= df[COL_QUEUE_PRIORITY].iloc[i],
-            jobboard = df[COL_JOBBOARD].iloc[i],
-            organization = df[COL_JOBBOARD].iloc[i],
-            country = df[COL_COUNTRY].iloc[i],
-            state = df[COL_STATE].iloc[i],
-            city = df[COL_CITY].iloc[i],
+    return create_jobboard_instances_from_columns(get_columns(df))
+
+
+def get_columns(df: DataFrame) -> Columns:
+    """Returns {column: values} of df_jobsites, as read by record_methods."""
+    columns = {col: df[col].tolist() for col in COLS_JOBBOARD if col != COL_ID}
+    columns[COL_ID] = df.index.tolist()
+    return columns
+
+
+def create_jobboard_instances_from_columns(columns: Columns) -> all_jobboards:
+    """Creates list of All JobSites from columns read by record_methods.
+
+    Args:
+        columns (Columns): {column: values} to create JobSite instances
+
+    Returns:
+        all_jobboards: List of all JobSite Instances
+
+    NOTE:
+    Columns are normalized whole before instances are created, so the loop
+    only zips plain lists.
+    """
+    names = [name.strip().title() for name in columns[COL_NAME]]
+    descriptions = [description.capitalize().strip() for description in columns[COL_DESCRIPT]]
+
+    return [
+        JobBoard(
+            ident = ident,
+            name = name,
+            urls = urls,
+            description = description,
+            Q_priority = Q_priority,
+            jobboard = jobboard,
+            organization = organization,
+            locations = locations,
         )
-        jobboards_list.append(jobsite)
-    return jobboards_list
+        for ident, name, urls, description, Q_priority, jobboard, organization, locations in zip(
+            columns[COL_ID], names, columns[COL_URLS], descriptions,
+            columns[COL_QUEUE_PRIORITY], columns[COL_JOBBOARD], columns[COL_ORG],
+            columns[COL_LOCATIONS])
+    ]
+
+
+def create_jobboard(columns: Columns, row: int) -> JobBoard:
+    """Returns JobSite of row of columns, normalized as create_jobboard_instances_from_columns()."""
+    return JobBoard(
+        ident = columns[COL_ID][row],
+        name = columns[COL_NAME][row].strip().title(),
+        urls = columns[COL_URLS][row],
+        description = columns[COL_DESCRIPT][row].capitalize().strip(),
+        Q_priority = columns[COL_QUEUE_PRIORITY][row],
+        jobboard = columns[COL_JOBBOARD][row],
+        organization = columns[COL_ORG][row],
+        locations = columns[COL_LOCATIONS][row],
+    )
+
+
+def iter_jobboards_in_queue(columns: Columns, job_queue: IndexedJobQueue) -> Iterator[JobBoard]:
+    """Yields JobSites of columns in queue order, each created when it's needed, with its Q_index set.
+
+    Args:
+        columns (Columns): {column: values} to create JobSite instances
+        job_queue (IndexedJobQueue): queue holding the ids of columns, e.g., from QueueMethods.clean_queue_ids()
+
+    Yields:
+        Iterator[JobBoard]: JobSite instances
+    """
+    ids = columns[COL_ID]
+    rows = dict(zip(ids, range(len(ids))))
+    for Q_index, ident in enumerate(job_queue):
+        jobboard = create_jobboard(columns, rows[ident])
+        jobboard.Q_index = Q_index
+        yield jobboard
+
+
+class JobBoardRows(object):
+    """JobSites of columns by id, each created when it's first read.
+
+    Reads like a {id: JobSite} dict, so scheduling policies can be passed the
+    catalog without a JobSite being created for every row.
+
+    Args:
+        columns (Columns): {column: values} to create JobSite instances
+    """
+
+    def __init__(self, columns: Columns):
+        self.columns = columns
+        self.rows: Union[Dict[int, int], None] = None       # {id: row}, built on first lookup
+        self.jobboards: Dict[int, JobBoard] = {}
+        return None
+
+
+    def get_rows(self) -> Dict[int, int]:
+        """Returns {id: row} of columns."""
+        if self.rows is None:
+            ids = self.columns[COL_ID]
+            self.rows = dict(zip(ids, range(len(ids))))
+        return self.rows
+
 
+    def __len__(self) -> int:
+        return len(self.columns[COL_ID])
 
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.columns[COL_ID])
 
+    def __contains__(self, ident: int) -> bool:
+        return ident in self.get_rows()
 
+    def __getitem__(self, ident: int) -> JobBoard:
+        jobboard = self.jobboards.get(ident)
+        if jobboard is None:
+            jobboard = self.jobboards[ident] = create_jobboard(self.columns, self.get_rows()[ident])
+        return jobboard
 
+    def get(self, ident: int) -> Union[JobBoard, None]:
+        """Returns JobSite of ident, or None if it isn't in columns."""
+        if ident not in self.get_rows():
+            return None
+        return self[ident]
 
+    def get_Q_priority(self, ident: int) -> int:
+        """Returns Q_priority of ident, without creating its JobSite."""
+        return self.columns[COL_QUEUE_PRIORITY][self.get_rows()[ident]]
@@ -0,0 +1,154 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 18:20:44
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Launchpad opener: one local HTML page instead of a browser launch per url.
+
+    The selected jobboards' names, links & descriptions (the attributes of
+    JobBoard.attrs_for_md) are written to FILENAME_LAUNCHPAD, which is
+    opened with a single browser call. The page can open every link in a
+    tab itself, from its "Open all" button or, with auto_open, on load.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import html
+import json
+import os
+import time
+from typing import Callable
+
+from . import constants
+from .url_opener import OpenResult, OpenReport, UrlOpener
+from .script_objects import Any, List, Tuple
+
+
+##########
+# Page
+##########
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Jobboards</title>
+<style>
+body {{ font-family: sans-serif; max-width: 60em; margin: 2em auto; line-height: 1.4; }}
+li {{ margin-bottom: 0.8em; }}
+.description {{ color: #555; }}
+</style>
+</head>
+<body>
+<h1>Jobboards</h1>
+<p><button onclick="openAll()">Open all {num_urls} sites</button> <span id="status"></span></p>
+<ol>
+{items}
+</ol>
+<script>
+const URLS = {urls_json};
+function openAll() {{
+    let blocked = 0;
+    for (const url of URLS) {{
+        const tab = window.open(url, "_blank");     // "noopener" would make window.open() return null
+        if (tab) tab.opener = null;
+        else blocked++;
+    }}
+    if (blocked) document.getElementById("status").textContent =
+        blocked + " tabs were blocked; allow pop-ups for this page to open them all.";
+}}
+{auto_open}
+</script>
+</body>
+</html>
+"""
+
+ITEM_TEMPLATE = """<li><strong>{name}</strong> {links}<br><span class="description">{description}</span></li>"""
+
+
+def render_launchpad(entries: List[Tuple[str, List[str], str]], auto_open: bool = False) -> str:
+    """Returns launchpad html.
+
+    Args:
+        entries (List[Tuple[str, List[str], str]]): (name, urls, description) of each jobboard
+        auto_open (bool, optional): open every url when the page loads. Defaults to False.
+
+    Returns:
+        str: html page
+    """
+    items = []
+    for name, urls, description in entries:
+        links = ' '.join(
+            f'<a href="{html.escape(url)}" target="_blank" rel="noopener">[{i + 1}]</a>' for i, url in enumerate(urls))
+        items.append(ITEM_TEMPLATE.format(
+            name= html.escape(str(name)), links= links, description= html.escape(description or '')))
+
+    urls = [url for _, board_urls, _ in entries for url in board_urls]
+    return PAGE_TEMPLATE.format(
+        num_urls= len(urls),
+        items= '\n'.join(items),
+        urls_json= json.dumps(urls).replace('</', '<\\/'),
+        auto_open= 'window.addEventListener("load", openAll);' if auto_open else '',
+    )
+
+
+##########
+# Launchpad
+##########
+
+class Launchpad(UrlOpener):
+    """Collects submitted jobboards, then writes & opens the launchpad page on wait().
+
+    Args:
+        filename_launchpad (str, optional): html file. Defaults to constants.FILENAME_LAUNCHPAD.
+        auto_open (bool, optional): page opens every url when it loads. Defaults to False.
+        open_url (Callable[[str], Any], optional): opens the page's url. Defaults to webbrowser.open.
+    """
+
+    def __init__(self, filename_launchpad: str = None, auto_open: bool = False, open_url: Callable[[str], Any] = None):
+        super().__init__(max_workers= 1, spacing= 0.0, open_url= open_url)
+        self.filename_launchpad = filename_launchpad or constants.FILENAME_LAUNCHPAD
+        self.auto_open = auto_open
+        self.entries: List[Tuple[str, List[str], str]] = []
+        return None
+
+
+    def submit(self, url: str) -> None:
+        """Adds url to the page, under its own name."""
+        self.submit_jobboard(url, [url])
+        return None
+
+
+    def submit_jobboard(self, name: str, urls: List[str], description: str = None) -> None:
+        """Adds jobboard to the page."""
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        self.entries.append((name, list(urls), description))
+        return None
+
+
+    def wait(self) -> OpenReport:
+        """Writes the page & opens it, if jobboards were submitted. Returns the timing report."""
+        if not self.entries:
+            return self.report
+
+        from pathlib import Path
+        with open(self.filename_launchpad, 'w', encoding= 'utf-8') as f:
+            f.write(render_launchpad(self.entries, self.auto_open))
+        page_url = Path(os.path.abspath(self.filename_launchpad)).as_uri()
+
+        result = OpenResult(page_url, submitted= self.start_time)
+        self.open(result, launch= 0.0)
+        self.report.results.append(result)
+        self.report.wall_time = time.perf_counter() - self.start_time
+
+        num_urls = sum(len(urls) for _, urls, _ in self.entries)
+        print(f"- Launchpad of {len(self.entries)} jobboards & {num_urls} sites: {self.filename_launchpad}")
+        self.entries = []
+        self.start_time = None
+        return self.report
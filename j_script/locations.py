@@ -2,12 +2,12 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-02 15:23:28
- * @modify date 2020-10-02 16:58:38
+ * @modify date 2026-10-18 13:58:44
  * @desc [
-    Script to get string location data from data frame.
+    Script to get location ids & the location table from data frame.
 
-TODO:
-	 - module this better. It's confusing as is.
+    Location columns are parsed column-wise: factorize, split, explode &
+    validate, instead of parsing each cell in python.
  ]
  */
 """
@@ -16,107 +16,106 @@ TODO:
 # Imports
 ##########
 
-import pandas as pd
-
 from . import constants
 from . import custom_errors
-from .script_objects import DataFrame, DataFrames, List, Series, Union
+from .geo_index import LocationTable, get_location_table
+from .script_objects import Array, DataFrame, DataFrames, Index, Series, Tuple
 
 ##########
 # Get locations
 ##########
 
-def get_str_locations(df_jobsites: DataFrame, df_location_keys: DataFrames) -> DataFrame:
-	"""Returns df_jobsites with location columns transformed into strings.
+def get_locations(df_jobsites: DataFrame, df_location_keys: DataFrames) -> Tuple[DataFrame, LocationTable]:
+	"""Returns df_jobsites with location columns replaced by location ids, & the location table.
 
 	Args:
 		df_jobsite (Dataframe): master df to manipulate and return.
 		df_location_keys (DataFrames): Respectively: countries, states, and cities.
 
 	Returns:
-		DataFrame: jobsites, with locations as strings.
-	
+		Tuple[DataFrame, LocationTable]: jobsites with a COL_LOCATIONS column, & location table.
+
 	Auxiliary methods:
-		1. get_int_list() - returns list of int locations to get str locations
-		1. parse_val_for_strloc() - map over column to get string
+		1. get_location_code_col() - validates & splits one location column
+	"""
+	location_codes, location_names = [], []
+	for df, key in zip(df_location_keys, constants.AUX_DF_KEYS):
+		location_codes.append(get_location_code_col(df_jobsites[key], df.index, key).tolist())
+		location_names.append(df[key].astype(object).where(df[key].notna(), None).to_dict())
+
+	location_table, board_location_ids = get_location_table(*location_codes, location_names)
+
+	df_jobsites = df_jobsites.drop(columns= list(constants.AUX_DF_KEYS))
+	df_jobsites[constants.COL_LOCATIONS] = board_location_ids
+	return df_jobsites, location_table
+
+
+def get_location_code_col(location_col: Series, valid_codes: Index, column: str) -> Series:
+	"""Returns location column with each cell split into a tuple of location ints.
+
+	Int cells, e.g., 1, and string cells, e.g., "1, 2,", become (1,) and (1, 2).
+	Missing cells become ().
+
+	Args:
+		location_col (Series): column of ints or DELIMITER_LOC separated ints, indexed by id
+		valid_codes (Index): location ints in the location sheet
+		column (str): data column
+
+	Returns:
+		Series: tuple of location ints for each row, with location_col's index.
+
+	NOTE:
+	Cells are factorized first, so each distinct cell value is split &
+	validated once with column-wise string operations.
+
+	In the case that data is not properly input, raises an IncompatibleDataList Error
+	that lists every invalid value with its column and row_id.
 	"""
-	def parse_val_for_strloc(
-		location_value: Union[int, str, List[str]], 
-		int_str_key: dict,
-		id_series: Series,
-		column: str,
-		row: str,
-		) -> Union[str, List[str]]:
-		"""Parses the value(s) and transforms it to string location(s).
-
-		Args:
-			location_value (Union[str, List[str]]): representing location or multiple locations
-			int_str_key (dict): dict to convert int value to str
-			id_series (Series): row ids
-			column (str): data column
-			row (str): row used
-
-		Returns:
-			Union[str, List[str]]: Location, or list of locations.
-		
-		Auxiliary function:
-			get_int_list(): Returns List[int] from List[str].
-		"""
-		def get_int_list(
-			location_values: str, 
-			DELIMITER_LOC: str,
-			id_series: Series,
-			column: str,
-			row: int
-			) -> List[int]:
-			"""Returns list of integers from string of int locations
-
-			Args:
-				location_values (str): List of locations, represented as str integers
-				DELIMITER_LOC (str): string to separate locations ints by
-				id_series (Series): Identify row id
-				column (str): Column accessed
-				row (int): Row of data
-
-			Returns:
-				List[int]: List of integers that map to locations
-			
-			NOTE:
-			In the case that data is not properly input, raises an IncompatibleData Error 
-			that indicates the column and row_id.
-			"""
-			location_values = location_values.replace(' ', '').split(DELIMITER_LOC)
-			locations_ints = list()
-			for val in location_values:
-				try:
-					val = int(val)
-					locations_ints.append(val)
-				except ValueError:
-					if val == '':
-						continue
-					raise custom_errors.IncompatibleData(val, id_series, column, row)
-
-			return locations_ints
-
-
-		if isinstance(location_value, (int)):
-			return int_str_key[location_value]
-		
-		location_strs = [int_str_key[i] for i in 
-			get_int_list(location_value, constants.DELIMITER_LOC, id_series, column, row)] 
-		return location_strs
-
-
-	location_df_keys = (
-		(df_location_keys[0], constants.AUX_DF_KEYS[0]),     # Country
-		(df_location_keys[1], constants.AUX_DF_KEYS[1]),     # State
-		(df_location_keys[2], constants.AUX_DF_KEYS[2]),     # City
-	)
-	for df, key in location_df_keys:
-		# print(df.to_dict(), key, sep = "\n")
-		int_str_dict = df.to_dict()[key]
-		df_jobsites[key] = pd.Series([
-			parse_val_for_strloc(df_jobsites[key].iloc[i], int_str_dict, df_jobsites.index, key, i)
-				for i in range(len(df_jobsites[key]))])
-
-	return df_jobsites
+	import numpy as np
+	import pandas as pd
+
+	codes, uniques = pd.factorize(location_col)		# missing cells are -1
+	uniques = pd.Series(uniques, dtype= object)
+
+	## One row per location int, indexed by unique cell value
+	parts = (uniques.astype(str)
+		.str.replace(' ', '', regex= False)
+		.str.split(constants.DELIMITER_LOC)
+		.explode())
+	parts = parts[parts.notna() & (parts != '')]
+	ints = pd.to_numeric(parts, errors= 'coerce')
+
+	flag_bad = (ints.isna() | ~ints.isin(valid_codes)).to_numpy()
+	if flag_bad.any():
+		raise_incompatible_data(parts[flag_bad], codes, location_col.index, column)
+
+	## Back to one tuple per unique cell value
+	bounds = np.searchsorted(parts.index.to_numpy(), np.arange(1, len(uniques)))
+	code_tuples = np.empty(len(uniques) + 1, dtype= object)
+	code_tuples[-1] = ()
+	for i, unique_ints in enumerate(np.split(ints.to_numpy(dtype= np.int64), bounds)[:len(uniques)]):
+		code_tuples[i] = tuple(unique_ints.tolist())
+
+	return pd.Series(code_tuples[codes], index= location_col.index, name= location_col.name)
+
+
+def raise_incompatible_data(bad_parts: Series, codes: Array, ids: Index, column: str) -> None:
+	"""Raises IncompatibleDataList with every bad value & the id of each row using it.
+
+	Args:
+		bad_parts (Series): bad values, indexed by unique cell value
+		codes (Array): unique cell value of each row
+		ids (Index): row ids
+		column (str): data column
+	"""
+	import numpy as np
+
+	bad_vals = bad_parts.groupby(level= 0).agg(list).to_dict()
+	rows = np.flatnonzero(np.isin(codes, list(bad_vals.keys())))
+
+	vals, bad_ids = [], []
+	for row in rows:
+		for val in bad_vals[codes[row]]:
+			vals.append(val)
+			bad_ids.append(ids[row])
+	raise custom_errors.IncompatibleDataList(vals, bad_ids, column)
@@ -0,0 +1,350 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 17:41:06
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Incremental markdown table of jobboards.
+
+    Writes the same file as TableInfo.print_info(markdown= True), one line
+    per board sorted by name. Each board's rendered cells are cached next
+    to the markdown file, with the count of cells of each length per column
+    so column widths update without rescanning every row. On write:
+        - changed rows are patched in place,
+        - added, removed or renamed boards rewrite the file from the first
+          moved row, as record numbers after it shift,
+        - the whole file is rewritten if a column width or alignment
+          changed, or the file was changed by something else.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import bisect
+import locale
+import os
+from typing import Iterable, Set
+
+from . import constants
+from .tableinfo.tblinfo_aux import Aux_TblInfo
+from .script_objects import Dict, List, Tuple, Union
+
+
+##########
+# Markdown Table
+##########
+
+class MarkdownTable(object):
+    """Rows of the markdown table, & the layout of the written file.
+
+    Args:
+        keys (Tuple[str]): columns, e.g., JobBoard.attrs_for_md. Rows sort by the first column, then id.
+        filename_md (str, optional): markdown file. Defaults to constants.FILENAME_MD.
+    """
+
+    ##########
+    # Constants
+    ##########
+    version = 1
+    records_key = Aux_TblInfo.records_key
+    col_delim = ' ' * 3 + '|' + ' ' * 3         # TableInfo num_spaces & col_sep
+    md_aligns = Aux_TblInfo.md_aligns
+    align_l, align_r = Aux_TblInfo.align_l, Aux_TblInfo.align_r
+    min_width = max(len(chars) for chars in Aux_TblInfo.md_aligns.values())
+
+
+    def __init__(self, keys: Tuple[str], filename_md: str = None):
+        self.keys = tuple(keys)
+        self.filename_md = filename_md or constants.FILENAME_MD
+        self.filename_cache = self.filename_md + '.cache'
+
+        self.rows: Dict[int, Tuple[str]] = {}                   # id -> cells
+        self.order: List[Tuple[str, int]] = []                  # (first cell, id), sorted
+        self.lengths: List[Dict[int, int]] = [{} for _ in self.keys]    # per column: cell length -> count
+
+        ## Written file
+        self.layout = None                  # (widths, alignments)
+        self.header_size = 0                # bytes of header & alignment lines
+        self.line_sizes: List[int] = []     # bytes of each row line
+        self.file_stat = None               # (size, mtime_ns)
+
+        ## Changes since written
+        self.first_moved: Union[int, None] = None       # rows from here on are rewritten
+        self.changed_rows: Set[int] = set()             # rows patched in place
+        return None
+
+
+    ##########
+    # Cache
+    ##########
+    @staticmethod
+    def load(keys: Tuple[str], filename_md: str = None) -> 'MarkdownTable':
+        """Returns table cached with the markdown file, or an empty table if there's no matching cache.
+
+        Args:
+            keys (Tuple[str]): columns of the table
+            filename_md (str, optional): markdown file. Defaults to constants.FILENAME_MD.
+
+        Returns:
+            MarkdownTable: table as last written
+        """
+        import pickle
+        md_table = MarkdownTable(keys, filename_md)
+        try:
+            with open(md_table.filename_cache, 'rb') as f:
+                version, cached_keys, state = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return md_table
+        if (version, cached_keys) == (MarkdownTable.version, md_table.keys):
+            md_table.rows, md_table.order, md_table.lengths, md_table.layout, \
+                md_table.header_size, md_table.line_sizes, md_table.file_stat = state
+        return md_table
+
+
+    def save(self) -> None:
+        """Saves rows & file layout to the cache file."""
+        import pickle
+        state = (self.rows, self.order, self.lengths, self.layout, self.header_size, self.line_sizes, self.file_stat)
+        filename_tmp = self.filename_cache + '.tmp'
+        try:
+            with open(filename_tmp, 'wb') as f:
+                pickle.dump((MarkdownTable.version, self.keys, state), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(filename_tmp, self.filename_cache)
+        except OSError as e:
+            print(f"- Could not save markdown cache ({e})")
+        return
+
+
+    ##########
+    # Update rows
+    ##########
+    def update(self, rows: Iterable[Tuple[int, Tuple[object]]]) -> Tuple[int, int, int]:
+        """Replaces the table's rows with rows.
+
+        Args:
+            rows (Iterable[Tuple[int, Tuple[object]]]): (id, cells) of every row. Cells are
+                converted with str(), as TableInfo prints them.
+
+        Returns:
+            Tuple[int, int, int]: number of rows added, changed & removed
+        """
+        added = changed = 0
+        new_ids = set()
+        for ident, cells in rows:
+            cells = tuple(map(str, cells))
+            new_ids.add(ident)
+            old_cells = self.rows.get(ident)
+            if old_cells is None:
+                added += 1
+                self.add_row(ident, cells)
+            elif old_cells != cells:
+                changed += 1
+                self.change_row(ident, cells)
+
+        removed_ids = [ident for ident in self.rows if ident not in new_ids] if len(self.rows) != len(new_ids) else []
+        for ident in removed_ids:
+            self.remove_row(ident)
+        return added, changed, len(removed_ids)
+
+
+    def add_row(self, ident: int, cells: Tuple[str]) -> None:
+        """Inserts row in sorted position."""
+        self.rows[ident] = cells
+        self.count_lengths(cells, 1)
+        row = bisect.bisect_left(self.order, (cells[0], ident))
+        self.order.insert(row, (cells[0], ident))
+        self.mark_moved(row)
+        return None
+
+
+    def remove_row(self, ident: int) -> None:
+        """Removes row from its sorted position."""
+        cells = self.rows.pop(ident)
+        self.count_lengths(cells, -1)
+        row = bisect.bisect_left(self.order, (cells[0], ident))
+        del self.order[row]
+        self.mark_moved(row)
+        return None
+
+
+    def change_row(self, ident: int, cells: Tuple[str]) -> None:
+        """Replaces cells of row. The row keeps its position unless its first cell changed."""
+        old_cells = self.rows[ident]
+        if old_cells[0] != cells[0]:
+            self.remove_row(ident)
+            self.add_row(ident, cells)
+            return None
+
+        self.count_lengths(old_cells, -1)
+        self.count_lengths(cells, 1)
+        self.rows[ident] = cells
+        self.changed_rows.add(bisect.bisect_left(self.order, (cells[0], ident)))
+        return None
+
+
+    def count_lengths(self, cells: Tuple[str], delta: int) -> None:
+        """Adds delta to the count of each cell's length in its column."""
+        for lengths, cell in zip(self.lengths, cells):
+            count = lengths.get(len(cell), 0) + delta
+            if count:
+                lengths[len(cell)] = count
+            else:
+                del lengths[len(cell)]
+        return None
+
+
+    def mark_moved(self, row: int) -> None:
+        """Marks rows from row on to be rewritten. Rows before it keep their position."""
+        if self.first_moved is None or row < self.first_moved:
+            self.first_moved = row
+        return None
+
+
+    ##########
+    # Layout
+    ##########
+    def get_layout(self) -> Tuple[Tuple[int], Tuple[str]]:
+        """Returns width & alignment of each column, including the records column, as TableInfo sets them."""
+        widths = [max(len(str(len(self.order))), len(MarkdownTable.records_key), MarkdownTable.min_width)]
+        for key, lengths in zip(self.keys, self.lengths):
+            widths.append(max(len(key), max(lengths, default= 0), MarkdownTable.min_width))
+
+        alignments = [MarkdownTable.align_r]
+        for col in range(len(self.keys)):
+            alignments.append(self.get_alignment(self.rows[ident][col] for _, ident in self.order))
+        return tuple(widths), tuple(alignments)
+
+
+    @staticmethod
+    def get_alignment(values: Iterable[str]) -> str:
+        """Returns column alignment. Same checks as Aux_TblInfo._parse_data_for_alignment()."""
+        coltypes = (int, float, str)
+        check_type = 0
+        for val in values:
+            try:
+                coltypes[check_type](val)
+            except (ValueError, TypeError, OverflowError):
+                check_type += 1
+                if check_type == len(coltypes) - 1:
+                    break
+        return MarkdownTable.align_l if coltypes[check_type] is str else MarkdownTable.align_r
+
+
+    ##########
+    # Render
+    ##########
+    def render_line(self, cells: Tuple[str], widths: Tuple[int]) -> str:
+        """Returns line of a table row, with cells padded to widths."""
+        return MarkdownTable.col_delim.join(cell.ljust(width) for cell, width in zip(cells, widths)) + '\n'
+
+
+    def render_rows(self, start: int, stop: int, widths: Tuple[int]) -> Tuple[bytes, List[int]]:
+        """Returns encoded lines of rows start to stop in the sorted table, & the size of each line."""
+        line_format = MarkdownTable.col_delim.join(f"{{:<{width}}}" for width in widths) + '\n'
+        rows, order = self.rows, self.order
+        lines = [line_format.format(row + 1, *rows[order[row][1]]) for row in range(start, stop)]
+
+        text = ''.join(lines)
+        data = self.encode(text)
+        newline_extra = len(os.linesep) - 1
+        if len(data) == len(text) + newline_extra * len(lines):       # 1 byte per character
+            sizes = [len(line) + newline_extra for line in lines]
+        else:
+            sizes = [len(self.encode(line)) for line in lines]
+        return data, sizes
+
+
+    @staticmethod
+    def encode(text: str) -> bytes:
+        """Returns text as written by open(filename, 'w'): locale encoding & platform line endings."""
+        return text.replace('\n', os.linesep).encode(locale.getpreferredencoding(False))
+
+
+    ##########
+    # Write
+    ##########
+    def write(self) -> str:
+        """Writes changed rows to the markdown file, & saves the cache.
+
+        Returns:
+            str: 'unchanged', 'patched', or 'rewritten'
+        """
+        layout = self.get_layout()
+        if layout != self.layout or self.get_file_stat() != self.file_stat:
+            self.rewrite(layout)
+            result = 'rewritten'
+        elif self.first_moved is None and not self.changed_rows:
+            return 'unchanged'
+        else:
+            self.patch(layout)
+            result = 'patched'
+
+        self.first_moved = None
+        self.changed_rows = set()
+        self.file_stat = self.get_file_stat()
+        self.save()
+        return result
+
+
+    def rewrite(self, layout: Tuple[Tuple[int], Tuple[str]]) -> None:
+        """Writes the whole markdown file."""
+        widths, alignments = layout
+        header = (
+            self.render_line((MarkdownTable.records_key,) + self.keys, widths) +
+            self.render_line(tuple(MarkdownTable.md_aligns[align] for align in alignments), widths)
+        )
+        data, self.line_sizes = self.render_rows(0, len(self.order), widths)
+
+        self.header_size = len(self.encode(header))
+        self.layout = layout
+        with open(self.filename_md, 'wb') as f:
+            f.write(self.encode(header))
+            f.write(data)
+            f.write(self.encode('\n' * 2))
+        return None
+
+
+    def patch(self, layout: Tuple[Tuple[int], Tuple[str]]) -> None:
+        """Overwrites changed rows in place, & rewrites the file from the first moved row."""
+        import itertools
+        widths, _ = layout
+        first_moved = len(self.order) if self.first_moved is None else self.first_moved
+        line_sizes = self.line_sizes
+
+        patches = []
+        for row in sorted(self.changed_rows):
+            if row >= first_moved:
+                break
+            line, _ = self.render_rows(row, row + 1, widths)
+            if len(line) != line_sizes[row]:
+                first_moved = row       # different size, so the following rows move
+                break
+            patches.append((row, line))
+
+        offsets = list(itertools.accumulate(line_sizes[:first_moved], initial= self.header_size))
+        with open(self.filename_md, 'r+b') as f:
+            for row, line in patches:
+                f.seek(offsets[row])
+                f.write(line)
+
+            if first_moved < len(self.order) or len(line_sizes) != len(self.order):
+                data, sizes = self.render_rows(first_moved, len(self.order), widths)
+                del line_sizes[first_moved:]
+                line_sizes.extend(sizes)
+                f.seek(offsets[first_moved])
+                f.write(data)
+                f.write(self.encode('\n' * 2))
+                f.truncate()
+        return None
+
+
+    def get_file_stat(self) -> Union[Tuple[int, int], None]:
+        """Returns (size, mtime_ns) of the markdown file, None if it doesn't exist."""
+        try:
+            stat = os.stat(self.filename_md)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
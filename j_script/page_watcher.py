@@ -0,0 +1,239 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 19:02:53
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Change detection for career pages with conditional GETs.
+
+    The ETag, Last-Modified & a digest of the body of each page are kept in
+    FILENAME_PAGE_STATES, with the digest the page had when it was last
+    opened. Later fetches send If-None-Match & If-Modified-Since, so
+    unchanged pages answer 304 without a body; pages that answer 200 are
+    compared by digest, as many servers don't support conditional requests.
+
+    A page has changed if its digest differs from when it was last opened,
+    or it's unknown: never fetched, never opened, or its last fetch failed.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import asyncio
+import hashlib
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+from urllib.parse import urljoin
+
+from . import constants
+from .url_checker import (REQUEST_ERRORS, ConnectionPool, gather_by_host,
+                          get_error_kind, get_key, send_request)
+from .script_objects import Dict, List, Tuple, Union
+
+
+##########
+# Page State
+##########
+
+@dataclass
+class PageState(object):
+    """Validators & digests of a page.
+
+    Args:
+        url (str): page url
+        etag (Union[str, None]): ETag of the last 200 response
+        last_modified (Union[str, None]): Last-Modified of the last 200 response
+        digest (Union[bytes, None]): body digest of the last 200 response
+        visited_digest (Union[bytes, None]): digest when the page was last opened
+        fetched_at (float): time.time() of the last fetch
+        error (Union[str, None]): UrlChecker error kind or "status N", if the last fetch failed
+    """
+    url: str
+    etag: Union[str, None] = None
+    last_modified: Union[str, None] = None
+    digest: Union[bytes, None] = None
+    visited_digest: Union[bytes, None] = None
+    fetched_at: float = 0.0
+    error: Union[str, None] = None
+
+    @property
+    def changed(self) -> bool:
+        """False only if the page is known to be the same as when it was last opened."""
+        return self.error is not None or self.digest is None or self.digest != self.visited_digest
+
+
+@dataclass
+class FetchReport(object):
+    """Summary of a PageWatcher.fetch() call. outcomes counts PageWatcher's OUTCOME_ values."""
+    outcomes: Dict[str, int] = field(default_factory= dict)
+    wall_time: float = 0.0
+
+    def __str__(self) -> str:
+        num_fetched = sum(self.outcomes.values())
+        rate = num_fetched / self.wall_time if self.wall_time else 0.0
+        counts = ', '.join(f"{self.outcomes.get(outcome, 0)} {outcome}" for outcome in PageWatcher.outcomes)
+        return f"Fetched {num_fetched} pages in {self.wall_time:.2f}s ({rate:.0f} pages/s): {counts}"
+
+
+##########
+# Page Watcher
+##########
+
+class PageWatcher(object):
+    """Fetches pages with conditional GETs & tracks which changed since they were opened.
+
+    Args:
+        max_connections (int, optional): open connections. Defaults to constants.URL_CHECK_CONNECTIONS.
+        per_host (int, optional): open connections per host. Defaults to constants.URL_CHECK_PER_HOST.
+        timeout (float, optional): seconds per page. Defaults to constants.URL_CHECK_TIMEOUT.
+        filename_states (str, optional): states file. Defaults to constants.FILENAME_PAGE_STATES.
+    """
+
+    ##########
+    # Constants
+    ##########
+    version = 1
+    max_body = 1 << 22          # bytes of a page that are digested
+    max_redirects = 5
+    redirect_statuses = frozenset((301, 302, 303, 307, 308))
+    digest_size = 16
+
+    OUTCOME_NOT_MODIFIED = 'not modified'
+    OUTCOME_SAME = 'same'
+    OUTCOME_CHANGED = 'changed'
+    OUTCOME_FAILED = 'failed'
+    outcomes = (OUTCOME_NOT_MODIFIED, OUTCOME_SAME, OUTCOME_CHANGED, OUTCOME_FAILED)
+
+
+    def __init__(self, max_connections: int = None, per_host: int = None, timeout: float = None, filename_states: str = None):
+        self.max_connections = max_connections or constants.URL_CHECK_CONNECTIONS
+        self.per_host = per_host or constants.URL_CHECK_PER_HOST
+        self.timeout = timeout or constants.URL_CHECK_TIMEOUT
+        self.filename_states = filename_states or constants.FILENAME_PAGE_STATES
+        self.states: Union[Dict[str, PageState], None] = None      # loaded on first use
+        return None
+
+
+    ##########
+    # States
+    ##########
+    def get_states(self) -> Dict[str, PageState]:
+        """Returns page states, loading the states file on first use."""
+        if self.states is None:
+            import pickle
+            self.states = {}
+            try:
+                with open(self.filename_states, 'rb') as f:
+                    version, states = pickle.load(f)
+                if version == PageWatcher.version:
+                    self.states = states
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+                pass
+        return self.states
+
+
+    def save(self) -> None:
+        """Saves page states to the states file."""
+        import pickle
+        filename_tmp = self.filename_states + '.tmp'
+        try:
+            with open(filename_tmp, 'wb') as f:
+                pickle.dump((PageWatcher.version, self.get_states()), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(filename_tmp, self.filename_states)
+        except OSError as e:
+            print(f"- Could not save page states ({e})")
+        return
+
+
+    def has_changed(self, urls: List[str]) -> bool:
+        """Returns True unless every url is known to be unchanged since it was last opened."""
+        states = self.get_states()
+        return any(url not in states or states[url].changed for url in urls)
+
+
+    def mark_visited(self, urls: List[str]) -> None:
+        """Records the fetched content of urls as opened. Call save() to keep it."""
+        states = self.get_states()
+        for url in urls:
+            state = states.get(url)
+            if state is not None:
+                state.visited_digest = state.digest
+        return None
+
+
+    ##########
+    # Fetch
+    ##########
+    def fetch(self, urls: Iterable[str]) -> FetchReport:
+        """Fetches urls concurrently with conditional GETs, & saves their states.
+
+        Args:
+            urls (Iterable[str]): page urls. Repeated urls are fetched once.
+
+        Returns:
+            FetchReport: count of each outcome
+        """
+        urls = list(dict.fromkeys(urls))
+        self.get_states()
+        start = time.perf_counter()
+        report = FetchReport()
+        if urls:
+            outcomes = asyncio.run(gather_by_host(urls, self.fetch_page, self.max_connections, self.per_host))
+            for outcome in outcomes:
+                report.outcomes[outcome] = report.outcomes.get(outcome, 0) + 1
+            self.save()
+        report.wall_time = time.perf_counter() - start
+        return report
+
+
+    async def fetch_page(self, url: str, pool: ConnectionPool) -> str:
+        """Fetches url, following redirects, & updates its state. Returns the outcome."""
+        state = self.states.setdefault(url, PageState(url))
+        state.fetched_at = time.time()
+        try:
+            status, headers, body = await asyncio.wait_for(self.get(pool, url, state), self.timeout)
+        except REQUEST_ERRORS as e:
+            state.error = get_error_kind(e)
+            return PageWatcher.OUTCOME_FAILED
+
+        if status == 304:
+            state.error = None
+            return PageWatcher.OUTCOME_NOT_MODIFIED
+        elif status != 200:
+            state.error = f"status {status}"
+            return PageWatcher.OUTCOME_FAILED
+
+        digest = hashlib.blake2b(body, digest_size= PageWatcher.digest_size).digest()
+        outcome = PageWatcher.OUTCOME_SAME if digest == state.digest else PageWatcher.OUTCOME_CHANGED
+        state.etag = headers.get('etag')
+        state.last_modified = headers.get('last-modified')
+        state.digest = digest
+        state.error = None
+        return outcome
+
+
+    async def get(self, pool: ConnectionPool, url: str, state: PageState) -> Tuple[int, Dict[str, str], bytes]:
+        """Returns (status, headers, body) of a conditional GET of url, after redirects.
+
+        Raises:
+            ValueError: url, or a redirect, isn't http(s), or there are too many redirects
+        """
+        conditions = {}
+        if state.etag:
+            conditions['If-None-Match'] = state.etag
+        if state.last_modified:
+            conditions['If-Modified-Since'] = state.last_modified
+
+        for _ in range(PageWatcher.max_redirects + 1):
+            key, netloc, target = get_key(url)
+            status, headers, body = await send_request(
+                pool, key, 'GET', netloc, target, conditions, max_body= PageWatcher.max_body)
+            if status not in PageWatcher.redirect_statuses or 'location' not in headers:
+                return status, headers, body
+            url = urljoin(url, headers['location'])
+        raise ValueError("too many redirects")
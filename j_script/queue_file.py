@@ -0,0 +1,153 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 16:40:12
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Fixed-width binary queue file.
+
+    Layout: header (magic, version, generation, number of ids, crc32 of the
+    ids), then the ids as little-endian int64. The ids are read through mmap
+    & memoryview, and checked against the header before use.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import os
+import struct
+import sys
+import zlib
+from typing import Iterable
+
+from . import constants
+from . import custom_errors
+from .script_objects import JobIDs, Tuple
+
+
+##########
+# Queue File
+##########
+
+class QueueFile(object):
+    """Methods to read & write the binary queue file."""
+
+    ##########
+    # Constants
+    ##########
+    filename_queue = constants.FILENAME_QUEUE
+    magic = b'JBQ\x00'
+    version = 1
+    header = struct.Struct('<4sHQQI')       # magic, version, generation, number of ids, crc32 of ids
+    id_format = 'q'                         # int64
+    id_size = 8
+
+
+    ##########
+    # Read
+    ##########
+    @staticmethod
+    def load(filename_queue: str = None) -> Tuple[int, JobIDs]:
+        """Returns generation & ids of the queue file.
+
+        Args:
+            filename_queue (str, optional): queue file. Defaults to filename_queue.
+
+        Raises:
+            FileNotFoundError: no queue file
+            custom_errors.QueueFileError: queue file is corrupt or of an unknown version
+
+        Returns:
+            Tuple[int, JobIDs]: generation, & ids in queue order
+        """
+        import mmap
+        filename_queue = filename_queue or QueueFile.filename_queue
+
+        with open(filename_queue, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < QueueFile.header.size:
+                raise custom_errors.QueueFileError(filename_queue, f"{size} bytes is smaller than the header")
+
+            with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    magic, version, generation, num_ids, crc = QueueFile.header.unpack_from(view)
+                    if magic != QueueFile.magic:
+                        raise custom_errors.QueueFileError(filename_queue, "not a queue file")
+                    if version != QueueFile.version:
+                        raise custom_errors.QueueFileError(filename_queue, f"unknown version {version}")
+                    if size != QueueFile.header.size + num_ids * QueueFile.id_size:
+                        raise custom_errors.QueueFileError(
+                            filename_queue, f"{size} bytes doesn't match {num_ids} ids")
+
+                    with view[QueueFile.header.size:] as data:
+                        if zlib.crc32(data) != crc:
+                            raise custom_errors.QueueFileError(filename_queue, "crc32 doesn't match")
+                        if sys.byteorder == 'little':
+                            with data.cast(QueueFile.id_format) as ids_view:
+                                ids = ids_view.tolist()
+                        else:
+                            ids = list(struct.unpack_from(f'<{num_ids}{QueueFile.id_format}', data))
+        return generation, ids
+
+
+    ##########
+    # Write
+    ##########
+    @staticmethod
+    def save(ids: Iterable[int], generation: int, filename_queue: str = None) -> None:
+        """Writes ids to the queue file. Writes to a temp file & renames it.
+
+        Args:
+            ids (Iterable[int]): ids in queue order
+            generation (int): generation of the queue, see QueueJournal
+            filename_queue (str, optional): queue file. Defaults to filename_queue.
+        """
+        from array import array
+        filename_queue = filename_queue or QueueFile.filename_queue
+
+        data = array(QueueFile.id_format, ids)
+        if sys.byteorder != 'little':
+            data.byteswap()
+        header = QueueFile.header.pack(
+            QueueFile.magic, QueueFile.version, generation, len(data), zlib.crc32(data))
+
+        filename_tmp = filename_queue + '.tmp'
+        with open(filename_tmp, 'wb') as f:
+            f.write(header)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(filename_tmp, filename_queue)
+        return
+
+
+    ##########
+    # Migrate
+    ##########
+    @staticmethod
+    def migrate_pickle(filename_pickle: str, filename_queue: str = None) -> Tuple[int, JobIDs]:
+        """Writes the queue of a pickle file to the queue file. Non-int ids are dropped.
+
+        Args:
+            filename_pickle (str): pickled list of ids, or {'generation', 'job_queue'}
+            filename_queue (str, optional): queue file. Defaults to filename_queue.
+
+        Returns:
+            Tuple[int, JobIDs]: generation, & ids in queue order
+        """
+        import pickle
+        with open(filename_pickle, 'rb') as f:
+            saved_job_queue = pickle.load(f)
+
+        generation = 0
+        if isinstance(saved_job_queue, dict):
+            generation = saved_job_queue['generation']
+            saved_job_queue = saved_job_queue['job_queue']
+
+        ids = [ident for ident in saved_job_queue if isinstance(ident, int)]
+        QueueFile.save(ids, generation, filename_queue)
+        print(f"- Migrated {filename_pickle} to {filename_queue or QueueFile.filename_queue}")
+        return generation, ids
@@ -0,0 +1,167 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 16:24:05
+ * @modify date 2026-10-18 16:24:05
+ * @desc [
+    Append-only journal of job queue operations.
+
+    Each record is (generation, op, ids), framed by its length & crc32. A
+    record only applies to the saved queue of the same generation, so once
+    compaction saves a new queue, old records are ignored even if the journal
+    wasn't reset. A torn last record, e.g., from a crash mid-write, fails its
+    crc and is cut off when the journal is read.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import os
+import struct
+import zlib
+
+from . import constants
+from .indexed_queue import IndexedJobQueue
+from .script_objects import JobIDs, List, Tuple
+
+
+##########
+# Queue Journal
+##########
+
+class QueueJournal(object):
+    """Methods to append, read & apply journal records."""
+
+    ##########
+    # Constants
+    ##########
+    filename_journal = constants.FILENAME_JOURNAL
+    record_header = struct.Struct('<II')        # payload length, payload crc32
+
+    OP_MOVE = 'move'        # move ids to back, or append if not queued
+    OP_APPEND = 'append'
+    OP_REMOVE = 'remove'
+
+
+    ##########
+    # Write
+    ##########
+    @staticmethod
+    def append(records: List[Tuple[str, JobIDs]], generation: int, filename_journal: str = None) -> None:
+        """Appends (op, ids) records to the journal & syncs it to disk.
+
+        Args:
+            records (List[Tuple[str, JobIDs]]): (op, ids) to append
+            generation (int): generation of the saved queue the records apply to
+            filename_journal (str, optional): journal file. Defaults to filename_journal.
+        """
+        import pickle
+        filename_journal = filename_journal or QueueJournal.filename_journal
+
+        data = bytearray()
+        for op, ids in records:
+            payload = pickle.dumps((generation, op, list(ids)), pickle.HIGHEST_PROTOCOL)
+            data += QueueJournal.record_header.pack(len(payload), zlib.crc32(payload))
+            data += payload
+
+        with open(filename_journal, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return
+
+
+    @staticmethod
+    def reset(filename_journal: str = None) -> None:
+        """Removes the journal, after its records were compacted into the saved queue."""
+        filename_journal = filename_journal or QueueJournal.filename_journal
+        try:
+            os.remove(filename_journal)
+        except FileNotFoundError:
+            pass
+        return
+
+
+    @staticmethod
+    def get_size(filename_journal: str = None) -> int:
+        """Returns size of the journal in bytes, 0 if it doesn't exist."""
+        filename_journal = filename_journal or QueueJournal.filename_journal
+        try:
+            return os.path.getsize(filename_journal)
+        except OSError:
+            return 0
+
+
+    ##########
+    # Read
+    ##########
+    @staticmethod
+    def read(generation: int, filename_journal: str = None) -> List[Tuple[str, JobIDs]]:
+        """Returns (op, ids) records of generation. Cuts off a torn or corrupt tail.
+
+        Args:
+            generation (int): generation of the saved queue
+            filename_journal (str, optional): journal file. Defaults to filename_journal.
+
+        Returns:
+            List[Tuple[str, JobIDs]]: records in the order appended
+        """
+        import pickle
+        filename_journal = filename_journal or QueueJournal.filename_journal
+        try:
+            with open(filename_journal, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return []
+
+        header_size = QueueJournal.record_header.size
+        records = []
+        pos = 0
+        while pos + header_size <= len(data):
+            length, crc = QueueJournal.record_header.unpack_from(data, pos)
+            payload = data[pos + header_size: pos + header_size + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            try:
+                record_generation, op, ids = pickle.loads(payload)
+            except Exception:
+                break
+            if record_generation == generation:
+                records.append((op, ids))
+            pos += header_size + length
+
+        if pos != len(data):
+            print(f"- Cut {len(data) - pos} bytes of incomplete journal records")
+            with open(filename_journal, 'r+b') as f:
+                f.truncate(pos)
+        return records
+
+
+    ##########
+    # Replay
+    ##########
+    @staticmethod
+    def apply(job_queue: IndexedJobQueue, records: List[Tuple[str, JobIDs]]) -> IndexedJobQueue:
+        """Applies records to job_queue, in order.
+
+        Args:
+            job_queue (IndexedJobQueue): saved queue
+            records (List[Tuple[str, JobIDs]]): (op, ids) from read()
+
+        Returns:
+            IndexedJobQueue: job_queue, updated
+        """
+        for op, ids in records:
+            for ident in ids:
+                if op == QueueJournal.OP_REMOVE:
+                    if ident in job_queue:
+                        job_queue.remove(ident)
+                elif ident in job_queue:
+                    if op == QueueJournal.OP_MOVE:
+                        job_queue.move_to_back(ident)
+                else:
+                    job_queue.append(ident)
+        return job_queue
@@ -2,9 +2,14 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-09-29 20:37:50
- * @modify date 2020-10-06 17:03:43
+ * @modify date 2026-10-18 22:02:10
  * @desc [
     Class that contains pickle support methods for jobs
+
+    The queue file (see queue_file) holds the queue as of the last compaction.
+    Each run appends its changes to the queue journal (see queue_journal), and
+    the journal is compacted into the queue file once it outgrows it. A queue
+    pickled by earlier versions is migrated to the queue file once.
  ]
  */
 """
@@ -13,9 +18,14 @@
 # Imports 
 ##########
 
-import pickle
+import os
+from typing import Iterable
 
 from . import constants
+from .catalog_delta import CatalogDelta
+from .indexed_queue import IndexedJobQueue
+from .queue_file import QueueFile
+from .queue_journal import QueueJournal
 from .script_objects import JobIDs, List, Tuple, all_jobboards
 
 
@@ -29,120 +39,172 @@ class QueueMethods(object):
     ##########
     # Constants
     ##########
-    filename_pickle = constants.FILENAME_PICKLE
+    filename_pickle = constants.FILENAME_PICKLE     # only read to migrate to QueueFile
+    min_compact_size = 1 << 16      # bytes of journal before compacting
+
+    generation = 0                  # of the saved queue, see QueueJournal
+    journal_records = list()        # changes from clean_queue, saved by save_queue
 
 
     ##########
     # Load Queue
     ##########
     @staticmethod
-    def load_queue() -> object:
-        """Loads pickle file
+    def load_queue() -> IndexedJobQueue:
+        """Loads queue file & replays the queue journal on it.
+
+        Raises:
+            custom_errors.QueueFileError: queue file is corrupt
 
         Returns:
-            object: returns pickle file, dict
+            IndexedJobQueue: saved queue of jobboard ids
         """
-        try: 
-            saved_job_queue = pickle.load( open(QueueMethods.filename_pickle, 'rb'))  
-        except:
-            saved_job_queue = list()
-        
-        return saved_job_queue
+        try:
+            QueueMethods.generation, saved_job_queue = QueueFile.load()
+        except FileNotFoundError:
+            if os.path.exists(QueueMethods.filename_pickle):
+                QueueMethods.generation, saved_job_queue = QueueFile.migrate_pickle(QueueMethods.filename_pickle)
+            else:
+                QueueMethods.generation, saved_job_queue = 0, list()
+
+        job_queue = IndexedJobQueue(saved_job_queue)
+        return QueueJournal.apply(job_queue, QueueJournal.read(QueueMethods.generation))
 
     @staticmethod
-    def clean_queue(job_queue: list, all_jobboards: all_jobboards) -> None:
-        """Cleans job queue of objects that match instantiated JobSites.
+    def clean_queue(job_queue: IndexedJobQueue, all_jobboards: all_jobboards, delta: CatalogDelta = None) -> IndexedJobQueue:
+        """Returns job queue matching instantiated JobSites, & sets each JobSite's Q_index.
 
         Args:
-            job_queue (list): Job queue
+            job_queue (IndexedJobQueue): Job queue
             all_jobboards (all_jobboards): list of instantiated job sites
-        
-        Calls auxiliary bin_search function to locate un-used jobsites.
+            delta (CatalogDelta, optional): boards changed since the previous run. Defaults to None, unknown.
+
+        Returns:
+            IndexedJobQueue: reconciled job queue
         """
-        def bin_search(arr: list, l: int, r: int, num: int) -> int:
-            """Binary search in array to locate number
-
-            Args:
-                arr (list): items to search
-                l (int): left bound
-                r (int): right bound
-                num (int): num to find
-
-            Returns:
-                int: index of num, or -1 if number doesn't exist.
-            """
-            def helper(arr: list, l: int, r: int, num: int) -> int:
-                """Aux recursive function."""
-                mid = (l + r) // 2
-                if r < l: return -1
-                elif arr[mid] == num: return mid
-                elif arr[mid] > num: return helper(arr, l, mid - 1, num)
-                else: return helper(arr, mid + 1, r, num)
-            
-            try:
-                int(num)
-                return helper(arr, l, r, num)
-            except:
-                return -1   # delete non int values
-
-
-        ## Start Cleaning Queue
-        if len(job_queue) == len(all_jobboards):
-            return job_queue
-        
-        print("- Cleaning queue of non-existent jobs")
-        ## Sort job ids to look through
-        jobsite_ids = [jobboard.ident for jobboard in all_jobboards]
-        jobsite_ids.sort()
-
-        ## Remove unnecessary items from queue
-        removed = 0
-        for i in range(len(job_queue)):
-            binsearch_results = bin_search(jobsite_ids, 0, len(jobsite_ids) - 1, job_queue[i - removed])
-            if binsearch_results == -1:
-                print(f"\t- id ({job_queue[i - removed]=}) not located - removed")
-                del job_queue[i - removed]
-                removed += 1
-
-        ## Update queue indices
-        for job in all_jobboards:
-            job.Q_index = job.get_Q_index()
-        print("- Updated queue.")
+        job_queue = QueueMethods.clean_queue_ids(job_queue, [jobboard.ident for jobboard in all_jobboards], delta)
+        QueueMethods.set_Q_indices(job_queue, all_jobboards)
         return job_queue
 
 
-    ##########
-    # Save Job Queue
-    ##########
     @staticmethod
-    def save_queue(job_queue: List[int], used_jobs: List[Tuple[int, int]]) -> None:
-        """Saves dictionary to pickle file.
+    def clean_queue_ids(job_queue: IndexedJobQueue, jobboard_ids: JobIDs, delta: CatalogDelta = None) -> IndexedJobQueue:
+        """Returns job queue holding jobboard_ids, without creating JobSites.
+
+        With the catalog delta since the previous run, only its added & removed ids are
+        applied. If the queue then doesn't match the catalog, e.g., after an interrupted
+        run, the queue is reconciled in full.
+
+        Args:
+            job_queue (IndexedJobQueue): Job queue
+            jobboard_ids (JobIDs): ids of the catalog
+            delta (CatalogDelta, optional): boards changed since the previous run. Defaults to None, unknown.
+
+        Returns:
+            IndexedJobQueue: reconciled job queue
         """
-        new_job_queue = QueueMethods.get_new_queue(job_queue, used_jobs)
+        added, removed = [], []
+        if delta is not None:
+            removed = [ident for ident in delta.removed if ident in job_queue]
+            for ident in removed:
+                job_queue.remove(ident)
+            added = [ident for ident in delta.added if ident not in job_queue]
+            for ident in added:
+                job_queue.append(ident)
+            job_queue.compact()         # index() is O(1) without holes
+
+        if delta is None or not job_queue.holds(jobboard_ids):
+            job_queue, reconciled_added, reconciled_removed = QueueMethods.reconcile_queue(job_queue, jobboard_ids)
+            added += reconciled_added
+            removed += reconciled_removed
+
+        if added or removed:
+            print(f"- Updated queue: {len(added)} jobs added, {len(removed)} non-existent jobs removed")
+        if removed:
+            QueueMethods.journal_records.append((QueueJournal.OP_REMOVE, removed))
+        if added:
+            QueueMethods.journal_records.append((QueueJournal.OP_APPEND, added))
+        return job_queue
 
-        pickle.dump( new_job_queue, open(QueueMethods.filename_pickle, 'wb'))
-        return
+
+    @staticmethod
+    def set_Q_indices(job_queue: IndexedJobQueue, all_jobboards: all_jobboards) -> bool:
+        """Sets each JobSite's Q_index. Returns False if job_queue & JobSites don't hold the same ids."""
+        if len(job_queue) != len(all_jobboards):
+            return False
+        try:
+            for job in all_jobboards:
+                job.Q_index = job_queue.index(job.ident)
+        except ValueError:
+            return False
+        return True
 
 
     @staticmethod
-    def get_new_queue(
-        job_queue: list,
-        used_jobs: List[Tuple[int, int]],
-        ) -> JobIDs:
-        """Returns new queue to save in pickle file.
+    def reconcile_queue(job_queue: Iterable[int], jobboard_ids: JobIDs) -> Tuple[IndexedJobQueue, JobIDs, JobIDs]:
+        """Returns queue of jobboard_ids, in one pass over each.
+
+        Ids already queued keep their order; new ids follow in jobboard_ids order.
+
+        Args:
+            job_queue (Iterable[int]): saved queue of ids
+            jobboard_ids (JobIDs): ids of instantiated job sites
 
         Returns:
-            JobIDs: representing queue of jobsite IDs
+            Tuple[IndexedJobQueue, JobIDs, JobIDs]: new queue, added ids, & removed ids.
         """
-        indices_used = set()
-        for index, ident in used_jobs:
-            removed = sum(1 if (num < index) else 0 for num in indices_used)
-            del job_queue[index - removed]
-            indices_used.add(index)
+        catalog = set(jobboard_ids)
+        kept, removed = [], []
+        for ident in job_queue:
+            if ident in catalog:
+                kept.append(ident)
+            else:
+                removed.append(ident)
 
-            job_queue.append(ident)
-        return job_queue
+        queued = set(kept)
+        added = [ident for ident in jobboard_ids if ident not in queued]
+        return IndexedJobQueue(kept + added), added, removed
 
 
-    
+    ##########
+    # Save Job Queue
+    ##########
+    @staticmethod
+    def save_queue(job_queue: IndexedJobQueue, used_jobs: List[Tuple[int, int]]) -> None:
+        """Saves queue changes of this run to the journal. Used jobs move to the back, in order used.
 
+        Compacts the journal into the queue file once the journal is larger.
+        """
+        used_ids = [ident for _, ident in used_jobs]
+        for ident in used_ids:
+            job_queue.move_to_back(ident)
+
+        records = QueueMethods.journal_records
+        if used_ids:
+            records.append((QueueJournal.OP_MOVE, used_ids))
+        if records:
+            QueueJournal.append(records, QueueMethods.generation)
+            QueueMethods.journal_records = list()
+
+        try:
+            queue_size = os.path.getsize(QueueFile.filename_queue)
+        except OSError:
+            queue_size = 0
+        if not queue_size or QueueJournal.get_size() > max(queue_size, QueueMethods.min_compact_size):
+            QueueMethods.compact_queue(job_queue)
+        return
+
+
+    @staticmethod
+    def compact_queue(job_queue: IndexedJobQueue) -> None:
+        """Saves whole queue to the queue file as the next generation, & resets the journal.
+
+        The queue file is replaced atomically. If the journal isn't reset, e.g., after
+        a crash, its records are of the previous generation and are ignored on load.
+        """
+        generation = QueueMethods.generation + 1
+        QueueFile.save(job_queue, generation)
+
+        QueueMethods.generation = generation
+        QueueJournal.reset()
+        return
@@ -0,0 +1,315 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 11:05:48
+ * @modify date 2026-10-18 22:44:16
+ * @desc [
+	Pandas-free counterpart of df_methods.
+
+	Loads jobboard columns with the built-in XlsxReader. Raises
+	XlsxFormatError when the workbook can't be read, so callers can fall
+	back to df_methods.
+ ]
+ */
+"""
+
+
+##########
+# Imports
+##########
+
+from typing import Iterable
+
+from . import constants
+from . import custom_errors
+from . import transform_col
+from . import catalog_delta
+from .catalog_delta import CatalogDelta
+from .geo_index import GeoIndex, LocationTable, get_location_table
+from .snapshot_cache import SnapshotCache
+from .xlsx_reader import XlsxReader
+from .script_objects import Any, Columns, List, Snapshot, Tuple, Union
+
+
+##########
+# Load from Excel
+##########
+
+def load_columns(
+	filename: str = constants.FILENAME_JOBBOARDS,
+	sheetnames: Tuple[str] = constants.SHEETNAMES
+	) -> Tuple[Columns]:
+	"""Loads JobBoard data from xlsx file with `filename`.
+
+	Args:
+		filename (str): xlsx to read.
+		sheetnames (Tuple[str], optional): sheets to read. Defaults to constants.SHEETNAMES.
+
+	Returns:
+		Tuple[Columns]: {column: values} for each sheet, in the order of sheetnames.
+	"""
+	with XlsxReader(filename) as workbook:
+		return tuple(workbook.read_columns(sheet) for sheet in sheetnames)
+
+
+def get_columns_jobboards(
+	filename: str = constants.FILENAME_JOBBOARDS,
+	flag_locations: bool = True,
+	use_snapshot: bool = True,
+	filename_snapshot: str = None,
+	) -> Tuple[Columns, LocationTable, Union[CatalogDelta, None]]:
+	"""Returns cleaned JobBoard columns, the location table, & the boards changed since the previous snapshot.
+	Same cleaning as df_methods.get_df_jobboards(). The new snapshot is saved right away, see load_columns_jobboards().
+
+	Args:
+		filename (str, optional): workbook to read. Defaults to constants.FILENAME_JOBBOARDS.
+		flag_locations (bool, optional): load location sheets & location ids. Defaults to True.
+		use_snapshot (bool, optional): load from/save to the snapshot cache. Defaults to True.
+		filename_snapshot (str, optional): snapshot file. Defaults to constants.FILENAME_SNAPSHOT.
+
+	Returns:
+		Tuple[Columns, LocationTable, Union[CatalogDelta, None]]: see load_columns_jobboards()
+	"""
+	columns, location_table, _, delta, snapshot = load_columns_jobboards(
+		filename, flag_locations, use_snapshot, filename_snapshot)
+	save_snapshot(snapshot)
+	return columns, location_table, delta
+
+
+def load_columns_jobboards(
+	filename: str = constants.FILENAME_JOBBOARDS,
+	flag_locations: bool = True,
+	use_snapshot: bool = True,
+	filename_snapshot: str = None,
+	) -> Tuple[Columns, LocationTable, Union[GeoIndex, None], Union[CatalogDelta, None], Union[Snapshot, None]]:
+	"""Returns cleaned JobBoard columns, the location table & geo index, the boards changed since the previous
+	snapshot, & the new snapshot, to save with save_snapshot() once the run's outputs are saved.
+
+	The snapshot is the baseline the next run's delta is taken from, so main saves it after the
+	Markdown file & queue. If the run is interrupted before then, the next run still finds the changes.
+
+	Args:
+		filename (str, optional): workbook to read. Defaults to constants.FILENAME_JOBBOARDS.
+		flag_locations (bool, optional): load location sheets & location ids. Defaults to True.
+		use_snapshot (bool, optional): load from/save to the snapshot cache. Defaults to True.
+		filename_snapshot (str, optional): snapshot file. Defaults to constants.FILENAME_SNAPSHOT.
+
+	Returns:
+		Tuple[Columns, LocationTable, Union[GeoIndex, None], Union[CatalogDelta, None], Union[Snapshot, None]]:
+		{column: values} of JobBoard information, including constants.COL_ID, location table, & geo index of
+		the boards. Without flag_locations, the table is empty & the index is None. The delta is empty if the snapshot is current, & None if there's no previous
+		snapshot to compare to. It records the snapshot keys it's between, see CatalogDelta.
+		The snapshot is None if the saved one is current, or without use_snapshot.
+
+	NOTE:
+	Rows with the same hash as in the previous snapshot reuse its cleaned urls & location ids;
+	only added & changed rows are cleaned, & only their nodes of the previous geo index are updated.
+	If the location sheets changed, every row is cleaned.
+	"""
+	snapshot_tag = 'columns_jobboards' if flag_locations else 'columns_jobboards_no_locations'
+	if use_snapshot:
+		key = SnapshotCache.get_key(filename)
+		snapshot = SnapshotCache.load(key, tag= snapshot_tag, filename_snapshot= filename_snapshot)
+		if snapshot is not None:
+			columns, location_table, geo_index, _, _ = snapshot
+			return columns, location_table, geo_index, CatalogDelta(base= key, key= key), None
+
+	sheetnames = constants.SHEETNAMES if flag_locations else (constants.SHEETNAME_JOBBOARDS,)
+	columns, *location_columns = load_columns(filename, sheetnames)
+	row_hashes = catalog_delta.get_row_hashes(columns)
+	locations_hash = catalog_delta.get_hash(location_columns)
+
+	delta = None
+	previous = SnapshotCache.load_previous(snapshot_tag, filename_snapshot, with_key= True) if use_snapshot else None
+	if previous is not None:
+		previous_key, (previous_columns, previous_table, geo_index, previous_hashes, previous_locations_hash) = previous
+		if previous_locations_hash == locations_hash:
+			delta = catalog_delta.get_delta(previous_hashes, row_hashes)
+			delta.base, delta.key = previous_key, key
+
+	if delta is None:
+		location_table = clean_columns(columns, location_columns)
+		geo_index = GeoIndex(location_table, zip(columns[constants.COL_ID], columns[constants.COL_LOCATIONS])) \
+			if flag_locations else None
+	else:
+		location_table = clean_changed_rows(columns, location_columns, previous_columns, previous_table, delta)
+		if geo_index is not None:
+			update_geo_index(geo_index, location_table, previous_columns, columns, delta)
+
+	snapshot = None
+	if use_snapshot:
+		snapshot = ((columns, location_table, geo_index, row_hashes, locations_hash), key, snapshot_tag, filename_snapshot)
+	return columns, location_table, geo_index, delta, snapshot
+
+
+def save_snapshot(snapshot: Union[Snapshot, None]) -> None:
+	"""Saves snapshot returned by load_columns_jobboards(), if any."""
+	if snapshot is not None:
+		SnapshotCache.save(*snapshot)
+	return
+
+
+def update_geo_index(
+	geo_index: GeoIndex,
+	location_table: LocationTable,
+	previous_columns: Columns,
+	columns: Columns,
+	delta: CatalogDelta,
+	) -> None:
+	"""Updates geo index of previous_columns in place to columns. Only boards in delta are touched.
+
+	Args:
+		geo_index (GeoIndex): index of previous_columns
+		location_table (LocationTable): location table of both columns; location ids are only added
+		previous_columns (Columns): cleaned columns of the previous snapshot
+		columns (Columns): cleaned columns
+		delta (CatalogDelta): rows added, changed & removed since previous_columns
+	"""
+	removed_ids = set(delta.removed)
+	removed_ids.update(delta.changed)
+	for ident, location_ids in zip(previous_columns[constants.COL_ID], previous_columns[constants.COL_LOCATIONS]):
+		if ident in removed_ids:
+			geo_index.remove(ident, [location_table[location_id] for location_id in location_ids])
+
+	added_ids = set(delta.added)
+	added_ids.update(delta.changed)
+	for ident, location_ids in zip(columns[constants.COL_ID], columns[constants.COL_LOCATIONS]):
+		if ident in added_ids:
+			for location_id in location_ids:
+				geo_index.add(ident, location_table[location_id])
+	return
+
+
+##########
+# Clean columns
+##########
+
+def clean_columns(
+	columns: Columns,
+	location_columns: List[Columns],
+	location_table: LocationTable = None,
+	) -> LocationTable:
+	"""Cleans jobboard columns in place: location ints to location ids, & urls to lists.
+
+	Args:
+		columns (Columns): {column: values} of the jobboards sheet
+		location_columns (List[Columns]): country, state & city sheets. Empty to skip locations.
+		location_table (LocationTable, optional): table to add locations to. Defaults to a new table.
+
+	Returns:
+		LocationTable: location table of the location ids
+	"""
+	if location_columns:
+		location_codes, location_names = [], []
+		for key, location_col in zip(constants.AUX_DF_KEYS, location_columns):
+			int_str_dict = dict(zip(location_col[constants.COL_ID], location_col[key]))
+			location_codes.append(get_location_codes(columns[key], int_str_dict, columns[constants.COL_ID], key))
+			location_names.append(int_str_dict)
+		location_table, columns[constants.COL_LOCATIONS] = get_location_table(
+			*location_codes, location_names, location_table)
+	else:
+		columns[constants.COL_LOCATIONS] = [()] * len(columns[constants.COL_ID])
+		location_table = location_table or LocationTable()
+
+	for key in constants.AUX_DF_KEYS:
+		columns.pop(key, None)
+
+	## Urls to lists
+	columns[constants.COL_URLS] = transform_col.get_list_col(columns[constants.COL_URLS])
+	return location_table
+
+
+def clean_changed_rows(
+	columns: Columns,
+	location_columns: List[Columns],
+	previous_columns: Columns,
+	previous_table: LocationTable,
+	delta: CatalogDelta,
+	) -> LocationTable:
+	"""Cleans jobboard columns in place, reusing cleaned values of rows not in delta.
+
+	Args:
+		columns (Columns): {column: values} of the jobboards sheet
+		location_columns (List[Columns]): country, state & city sheets. Empty to skip locations.
+		previous_columns (Columns): cleaned columns of the previous snapshot
+		previous_table (LocationTable): location table of the previous snapshot
+		delta (CatalogDelta): rows added & changed since the previous snapshot
+
+	Returns:
+		LocationTable: previous_table, with locations of the changed rows added
+	"""
+	ids = columns[constants.COL_ID]
+	changed_ids = set(delta.added)
+	changed_ids.update(delta.changed)
+	changed_rows = [row for row, ident in enumerate(ids) if ident in changed_ids]
+
+	changed_columns = {col: [vals[row] for row in changed_rows] for col, vals in columns.items()}
+	location_table = clean_columns(changed_columns, location_columns, previous_table)
+
+	for key in constants.AUX_DF_KEYS:
+		columns.pop(key, None)
+
+	previous_rows = dict(zip(previous_columns[constants.COL_ID], range(len(previous_columns[constants.COL_ID]))))
+	for col in (constants.COL_URLS, constants.COL_LOCATIONS):
+		previous_vals = previous_columns[col]
+		vals = [previous_vals[previous_rows[ident]] if ident not in changed_ids else None for ident in ids]
+		for row, val in zip(changed_rows, changed_columns[col]):
+			vals[row] = val
+		columns[col] = vals
+	return location_table
+
+
+##########
+# Locations
+##########
+
+def get_location_codes(
+	location_values: List[Union[int, str]],
+	valid_codes: Iterable[int],
+	ids: List[int],
+	column: str,
+	) -> List[Tuple[int]]:
+	"""Returns location column with each cell split into a tuple of location ints.
+
+	Args:
+		location_values (List[Union[int, str]]): location ints, or comma separated ints
+		valid_codes (Iterable[int]): location ints in the location sheet
+		ids (List[int]): row ids
+		column (str): data column
+
+	Returns:
+		List[Tuple[int]]: location ints of each row. Missing cells are ().
+
+	NOTE:
+	In the case that data is not properly input, raises an IncompatibleDataList Error
+	that lists every invalid value with its column and row_id.
+	"""
+	valid_codes = set(valid_codes)
+	bad_vals, bad_ids = [], []
+
+	def get_code(val: Any, row: int) -> Union[int, None]:
+		try:
+			code = int(val)
+		except ValueError:
+			code = None
+		if code not in valid_codes:
+			bad_vals.append(val)
+			bad_ids.append(ids[row])
+		return code
+
+	location_codes = []
+	for row, location_value in enumerate(location_values):
+		if location_value is None:
+			location_codes.append(())
+		elif isinstance(location_value, int):
+			location_codes.append((get_code(location_value, row),))
+		else:
+			location_codes.append(tuple(
+				get_code(val, row)
+				for val in str(location_value).replace(' ', '').split(constants.DELIMITER_LOC)
+				if val != ''
+			))
+
+	if bad_vals:
+		raise custom_errors.IncompatibleDataList(bad_vals, bad_ids, column)
+	return location_codes
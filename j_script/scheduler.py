@@ -0,0 +1,477 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 19:24:16
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Scheduling policies: which boards to open in a run.
+
+    A policy is synced with the catalog by update(), then select() returns
+    the boards to open within the url budget & schedules them as opened.
+        - WindowScheduler: the reference policy, JobBoard.open_websites()'s
+          rules. Walks the whole queue, opening boards with
+          Q_index <= ceil(len(job_queue) / Q_priority). O(n) per run.
+        - StrideScheduler: stride scheduling. Each board has a pass value &
+          the board with the lowest pass opens next, then its pass advances
+          by its Q_priority, so boards open in proportion to 1 / Q_priority.
+        - DueScheduler: each board is due Q_priority * SCHEDULE_INTERVAL
+          seconds after it was opened. Only due boards open, earliest first.
+
+    The heap policies keep their boards in a min-heap that is saved between
+    runs, so a run pops the N boards it opens in O(N log n), plus the
+    boards it skips; only those boards are created, see
+    jobboard_list.JobBoardRows. With a CatalogDelta from the catalog the
+    schedule was last synced with, update() only touches the added, changed
+    & removed boards; after runs without the schedule, every board is
+    checked. save() appends the changed entries to a journal (see
+    queue_journal) until it outgrows the saved schedule. Each policy has
+    its own schedule file, so switching policies keeps both schedules.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import heapq
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from . import constants
+from .catalog_delta import CatalogDelta
+from .indexed_queue import IndexedJobQueue
+from .jobboard_list import JobBoardRows
+from .queue_journal import QueueJournal
+from .script_objects import Any, Dict, List, SnapshotKey, Tuple, Union
+
+
+##########
+# Scheduler
+##########
+
+class Scheduler(ABC):
+    """Interface of scheduling policies."""
+    name = None
+
+    @abstractmethod
+    def update(self, job_queue: IndexedJobQueue, boards: JobBoardRows, delta: CatalogDelta = None) -> None:
+        """Syncs the policy with the catalog.
+
+        Args:
+            job_queue (IndexedJobQueue): cleaned queue, matching boards
+            boards (JobBoardRows): JobBoards of the catalog by id, each created when it's first read
+            delta (CatalogDelta, optional): boards changed since the previous run. Defaults to None, unknown.
+        """
+
+
+    @abstractmethod
+    def select(self, max_sites: int, is_allowed: Callable[[Any], bool]) -> List[Any]:
+        """Returns boards to open, in order, & schedules them as opened.
+
+        Args:
+            max_sites (int): url budget, MAX_SITES_TO_OPEN
+            is_allowed (Callable[[Any], bool]): False for boards filtered out, e.g., JobBoard.is_allowed
+
+        Returns:
+            List[Any]: JobBoards to open
+        """
+
+
+    def save(self) -> None:
+        """Saves the policy's state for the next run."""
+        return None
+
+
+##########
+# Window Scheduler
+##########
+
+class WindowScheduler(Scheduler):
+    """Reference policy: JobBoard.open_websites()'s rules.
+
+    Args:
+        full_queue (bool, optional): search the whole queue, as with an option or region filter. Defaults to False.
+    """
+    name = 'window'
+
+    def __init__(self, full_queue: bool = False):
+        self.full_queue = full_queue
+        self.job_queue = IndexedJobQueue()
+        self.boards: Union[JobBoardRows, None] = None
+        return None
+
+
+    def update(self, job_queue: IndexedJobQueue, boards: JobBoardRows, delta: CatalogDelta = None) -> None:
+        self.job_queue, self.boards = job_queue, boards
+        return None
+
+
+    def select(self, max_sites: int, is_allowed: Callable[[Any], bool]) -> List[Any]:
+        num_queue = len(self.job_queue)
+        sites_opened = 0
+        selected = []
+        for Q_index, ident in enumerate(self.job_queue):
+            if sites_opened >= max_sites:
+                break
+            board = self.boards[ident]
+            if sites_opened + len(board.urls) > max_sites:
+                continue
+            if not self.full_queue and Q_index > math.ceil(num_queue / board.Q_priority):
+                continue
+            if not is_allowed(board):
+                continue
+            sites_opened += len(board.urls)
+            selected.append(board)
+        return selected
+
+
+##########
+# Heap Scheduler
+##########
+
+class HeapScheduler(Scheduler):
+    """Boards in a min-heap by key, saved between runs. Subclasses define the keys.
+
+    entries holds (time, Q_priority) of each board, & heap holds (key, id) items.
+    An item is stale once its key differs from its entry's key; stale items are
+    dropped when popped, & the heap is rebuilt when they outnumber the entries.
+    catalog_key is the snapshot key of the catalog the entries were synced with.
+
+    Args:
+        filename_schedule (str, optional): schedule file. Defaults to constants.FILENAME_SCHEDULE with the
+            policy's name added, e.g., schedule_stride.pkl, so each policy keeps its own schedule.
+    """
+    version = 2
+    min_rebuild_size = 1024         # stale items before the heap is rebuilt
+    min_compact_size = 1 << 16      # bytes of journal before compacting
+
+    OP_SET = 'set'          # (id, entry) pairs, entry None if removed
+    OP_CLOCK = 'clock'
+    OP_CATALOG = 'catalog'
+
+    def __init__(self, filename_schedule: str = None):
+        self.filename_schedule = filename_schedule or self.get_default_filename()
+        self.filename_journal = self.filename_schedule + '.journal'
+        self.entries: Dict[int, Tuple[float, int]] = {}
+        self.heap: List[Tuple[float, int]] = []
+        self.clock = 0.0
+        self.catalog_key: Union[SnapshotKey, None] = None
+        self.boards: Union[JobBoardRows, None] = None      # set by update()
+
+        ## Saved schedule
+        self.generation = 0
+        self.changes: Dict[int, Union[Tuple[float, int], None]] = {}      # entries changed since saved
+        self.saved_catalog_key: Union[SnapshotKey, None] = None
+        self.flag_compact = True
+        return None
+
+
+    ##########
+    # Keys, set by subclasses
+    ##########
+    @abstractmethod
+    def get_key(self, entry: Tuple[float, int]) -> float:
+        """Returns heap key of an entry."""
+
+    @abstractmethod
+    def get_initial_entry(self, Q_index: int, num_queue: int, Q_priority: int) -> Tuple[float, int]:
+        """Returns entry of a board at Q_index of the queue, when the schedule is created."""
+
+    @abstractmethod
+    def get_new_entry(self, Q_priority: int) -> Tuple[float, int]:
+        """Returns entry of a board added to the catalog."""
+
+    @abstractmethod
+    def get_opened_entry(self, entry: Tuple[float, int]) -> Tuple[float, int]:
+        """Returns entry of a board once opened."""
+
+    def is_due(self, key: float) -> bool:
+        """Returns False if boards from key on can't open this run."""
+        return True
+
+    def get_params(self) -> tuple:
+        """Returns parameters the keys depend on. A schedule saved with others has its heap rebuilt."""
+        return ()
+
+
+    ##########
+    # Cache
+    ##########
+    def get_default_filename(self) -> str:
+        """Returns constants.FILENAME_SCHEDULE with the policy's name added."""
+        root, ext = os.path.splitext(constants.FILENAME_SCHEDULE)
+        return f"{root}_{self.name}{ext}"
+
+
+    @classmethod
+    def load(cls, filename_schedule: str = None, **kwargs) -> 'HeapScheduler':
+        """Returns schedule saved by the same policy, with its journal applied, or an empty schedule.
+
+        Args:
+            filename_schedule (str, optional): schedule file. Defaults to the policy's, see get_default_filename().
+            **kwargs: other arguments of cls
+
+        Returns:
+            HeapScheduler: scheduler of policy cls
+        """
+        import pickle
+        scheduler = cls(filename_schedule, **kwargs)
+        try:
+            with open(scheduler.filename_schedule, 'rb') as f:
+                version, name, generation, params, state = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return scheduler
+        if (version, name) != (HeapScheduler.version, cls.name):
+            return scheduler
+
+        scheduler.entries, scheduler.heap, scheduler.clock, scheduler.catalog_key = state
+        scheduler.generation = generation
+        for op, items in QueueJournal.read(generation, scheduler.filename_journal):
+            if op == HeapScheduler.OP_CLOCK:
+                scheduler.clock = items[0]
+                continue
+            elif op == HeapScheduler.OP_CATALOG:
+                scheduler.catalog_key = items[0]
+                continue
+            for ident, entry in items:
+                if entry is None:
+                    scheduler.entries.pop(ident, None)
+                else:
+                    scheduler.set_entry(ident, entry)
+        if params != scheduler.get_params():
+            scheduler.rebuild()
+        scheduler.changes = {}
+        scheduler.saved_catalog_key = scheduler.catalog_key
+        scheduler.flag_compact = False
+        return scheduler
+
+
+    def save(self) -> None:
+        """Appends changed entries to the journal, or saves the whole schedule once the journal outgrows it."""
+        try:
+            schedule_size = os.path.getsize(self.filename_schedule)
+        except OSError:
+            schedule_size = 0
+        journal_size = QueueJournal.get_size(self.filename_journal)
+
+        try:
+            if self.flag_compact or not schedule_size or journal_size > max(schedule_size, HeapScheduler.min_compact_size):
+                self.compact()
+            elif self.changes or self.catalog_key != self.saved_catalog_key:
+                records = [
+                    (HeapScheduler.OP_SET, list(self.changes.items())),
+                    (HeapScheduler.OP_CLOCK, [self.clock]),
+                    (HeapScheduler.OP_CATALOG, [self.catalog_key]),
+                ]
+                QueueJournal.append(records, self.generation, self.filename_journal)
+        except OSError as e:
+            print(f"- Could not save schedule ({e})")
+            return
+        self.changes = {}
+        self.saved_catalog_key = self.catalog_key
+        return
+
+
+    def compact(self) -> None:
+        """Saves the whole schedule as the next generation, & resets the journal."""
+        import pickle
+        generation = self.generation + 1
+        state = (self.entries, self.heap, self.clock, self.catalog_key)
+        filename_tmp = self.filename_schedule + '.tmp'
+        with open(filename_tmp, 'wb') as f:
+            pickle.dump((HeapScheduler.version, self.name, generation, self.get_params(), state), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(filename_tmp, self.filename_schedule)
+
+        self.generation = generation
+        self.flag_compact = False
+        QueueJournal.reset(self.filename_journal)
+        return
+
+
+    ##########
+    # Update
+    ##########
+    def update(self, job_queue: IndexedJobQueue, boards: JobBoardRows, delta: CatalogDelta = None) -> None:
+        """Syncs entries with the catalog. A new schedule follows the queue order.
+        Boards are read by their Q_priority column, so no JobBoard is created.
+
+        The delta is only used if it's from the catalog the schedule was last synced with.
+        Otherwise, e.g., runs without the schedule moved the catalog snapshot on, or if the
+        schedule has a different number of boards, every board is checked.
+        """
+        self.boards = boards
+        catalog_key, self.catalog_key = self.catalog_key, None if delta is None else delta.key
+        if not self.entries:
+            num_queue = len(job_queue)
+            self.entries = {
+                ident: self.get_initial_entry(Q_index, num_queue, boards.get_Q_priority(ident))
+                for Q_index, ident in enumerate(job_queue)
+            }
+            self.rebuild()
+            self.flag_compact = True
+            return None
+
+        if (delta is None or delta.base is None or delta.base != catalog_key
+                or len(self.entries) - len(delta.removed) + len(delta.added) != len(boards)):
+            added = [ident for ident in boards if ident not in self.entries]
+            removed = [ident for ident in self.entries if ident not in boards]
+            changed = boards
+        else:
+            added, removed, changed = delta.added, delta.removed, delta.changed
+
+        for ident in removed:
+            if self.entries.pop(ident, None) is not None:
+                self.changes[ident] = None
+        for ident in added:
+            self.set_entry(ident, self.get_new_entry(boards.get_Q_priority(ident)))
+        for ident in changed:
+            entry = self.entries.get(ident)
+            if entry is not None and entry[1] != boards.get_Q_priority(ident):
+                self.set_entry(ident, (entry[0], boards.get_Q_priority(ident)))
+
+        if len(self.heap) > 2 * len(self.entries) + HeapScheduler.min_rebuild_size:
+            self.rebuild()
+        return None
+
+
+    def set_entry(self, ident: int, entry: Tuple[float, int]) -> None:
+        """Sets entry of ident, & pushes its item if its key changed."""
+        old_entry = self.entries.get(ident)
+        self.entries[ident] = entry
+        self.changes[ident] = entry
+        key = self.get_key(entry)
+        if old_entry is None or self.get_key(old_entry) != key:
+            heapq.heappush(self.heap, (key, ident))
+        return None
+
+
+    def rebuild(self) -> None:
+        """Rebuilds heap from entries, dropping stale items."""
+        self.heap = [(self.get_key(entry), ident) for ident, entry in self.entries.items()]
+        heapq.heapify(self.heap)
+        return None
+
+
+    ##########
+    # Select
+    ##########
+    def select(self, max_sites: int, is_allowed: Callable[[Any], bool]) -> List[Any]:
+        """Pops boards by key until the url budget is spent or no board is due.
+
+        Only the popped boards are created. Boards that don't fit the remaining budget or aren't
+        allowed keep their key.
+        """
+        heap, entries = self.heap, self.entries
+        sites_opened = 0
+        selected, kept = [], []
+        while heap and sites_opened < max_sites:
+            key, ident = heapq.heappop(heap)
+            entry = entries.get(ident)
+            if entry is None or self.get_key(entry) != key:       # stale
+                continue
+            board = self.boards.get(ident)
+            if board is None:       # removed from catalog
+                del entries[ident]
+                self.changes[ident] = None
+                continue
+            if not self.is_due(key):
+                kept.append((key, ident))
+                break
+            if sites_opened + len(board.urls) > max_sites or not is_allowed(board):
+                kept.append((key, ident))
+                continue
+
+            sites_opened += len(board.urls)
+            selected.append(board)
+            entries[ident] = self.changes[ident] = entry = self.get_opened_entry(entry)
+            kept.append((self.get_key(entry), ident))
+
+        for item in kept:
+            heapq.heappush(heap, item)
+        return selected
+
+
+##########
+# Stride Scheduler
+##########
+
+class StrideScheduler(HeapScheduler):
+    """Stride scheduling: the board with the lowest pass opens next, & its pass advances by Q_priority.
+
+    A board's entry is (pass, Q_priority). clock is the pass of the last board opened, which
+    new boards start at. A new schedule starts boards at Q_index * Q_priority / len(job_queue),
+    so boards in the reference window start with a pass of at most 1.
+    """
+    name = 'stride'
+
+    def get_key(self, entry: Tuple[float, int]) -> float:
+        return entry[0]
+
+    def get_initial_entry(self, Q_index: int, num_queue: int, Q_priority: int) -> Tuple[float, int]:
+        return (Q_index * Q_priority / num_queue, Q_priority)
+
+    def get_new_entry(self, Q_priority: int) -> Tuple[float, int]:
+        return (self.clock, Q_priority)
+
+    def get_opened_entry(self, entry: Tuple[float, int]) -> Tuple[float, int]:
+        pass_value, Q_priority = entry
+        self.clock = max(self.clock, pass_value)
+        return (pass_value + Q_priority, Q_priority)
+
+
+##########
+# Due Scheduler
+##########
+
+class DueScheduler(HeapScheduler):
+    """Boards are due Q_priority * interval seconds after they were opened. Only due boards open.
+
+    A board's entry is (time opened, Q_priority). New boards are due at once. A new schedule
+    makes boards in the reference window due, & the rest due in queue order.
+
+    Args:
+        filename_schedule (str, optional): schedule file. Defaults to constants.FILENAME_SCHEDULE with '_due' added.
+        interval (float, optional): seconds per Q_priority. Defaults to constants.SCHEDULE_INTERVAL.
+        now (Callable[[], float], optional): clock. Defaults to time.time.
+    """
+    name = 'due'
+
+    def __init__(self, filename_schedule: str = None, interval: float = None, now: Callable[[], float] = None):
+        super().__init__(filename_schedule)
+        self.interval = interval or constants.SCHEDULE_INTERVAL
+        self.now = now or time.time
+        self.run_time: Union[float, None] = None
+        return None
+
+    def get_key(self, entry: Tuple[float, int]) -> float:
+        opened_at, Q_priority = entry
+        return opened_at + Q_priority * self.interval
+
+    def get_initial_entry(self, Q_index: int, num_queue: int, Q_priority: int) -> Tuple[float, int]:
+        due = self.now() + (Q_index * Q_priority / num_queue - 1) * self.interval
+        return (due - Q_priority * self.interval, Q_priority)
+
+    def get_new_entry(self, Q_priority: int) -> Tuple[float, int]:
+        return (self.now() - Q_priority * self.interval, Q_priority)
+
+    def get_opened_entry(self, entry: Tuple[float, int]) -> Tuple[float, int]:
+        return (self.run_time, entry[1])
+
+    def is_due(self, key: float) -> bool:
+        return key <= self.run_time
+
+    def get_params(self) -> tuple:
+        return (self.interval,)
+
+    def select(self, max_sites: int, is_allowed: Callable[[Any], bool]) -> List[Any]:
+        self.run_time = self.now()
+        return super().select(max_sites, is_allowed)
+
+
+SCHEDULERS: Dict[str, type] = {
+    scheduler.name: scheduler for scheduler in (WindowScheduler, StrideScheduler, DueScheduler)
+}
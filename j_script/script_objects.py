@@ -2,7 +2,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-02 15:23:49
- * @modify date 2020-10-02 15:23:49
+ * @modify date 2026-10-18 22:26:03
  * @desc [
     Defines custom objects used in this script.
  ]
@@ -13,15 +13,18 @@
 # Imports
 ###########
 
-from typing import Any, List, Tuple, Union, Iterator
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 ###########
 # DataFrame
 ###########
 
 Series = object
+Index = object
 DataFrame = object
 DataFrames = Tuple[object]
+Columns = Dict[str, List[Any]]
+Array = object
 
 
 ###########
@@ -31,7 +34,22 @@ DataFrames = Tuple[object]
 all_jobboards = List[object]
 
 
+###########
+# Locations
+###########
+
+Location = Tuple[Union[str, None], Union[str, None], Union[str, None]]      # country, state, city
+LocationKey = Tuple[Union[str, None], ...]      # (country,), (country, state), or Location
+
+
 ###########
 # Queue
 ###########
 JobIDs = List[int]
+
+
+###########
+# Snapshot
+###########
+SnapshotKey = Tuple[int, int, str]
+Snapshot = Tuple[Any, SnapshotKey, str, Union[str, None]]      # SnapshotCache.save() arguments: data, key, tag, file
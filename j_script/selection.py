@@ -0,0 +1,286 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 19:45:38
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Vectorized selection of the boards to open.
+
+    Selects the same boards as calling JobBoard.open_websites() on every
+    board in queue order, from arrays of the boards' Q_index, Q_priority,
+    url counts & category flags:
+        - option, region & queue window filters are boolean masks,
+        - the url budget is first-fit: the prefix of candidates whose
+          cumulative url count fits is opened, the candidate that overflows
+          is skipped, & the rest are searched for boards that fit what's
+          left. Each pass opens at least one board, so there are at most
+          MAX_SITES_TO_OPEN passes.
+    Checks that aren't vectorized, e.g., dead urls, run only on the boards
+    that would otherwise open.
+
+    select_boards_knapsack() fills the budget as a 0/1 knapsack instead:
+    as many urls as fit, & of those, the most overdue or of highest priority.
+    At most
+    MAX_SITES_TO_OPEN // w boards with w urls fit, so only the most valuable
+    of each url count are kept (argpartition, O(n)), & a dynamic program
+    over the budget picks from those: O(budget^2 log budget) whatever the
+    catalog size.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Set
+
+import numpy as np
+
+from .script_objects import Array, Tuple, Union
+
+
+##########
+# Board Arrays
+##########
+
+@dataclass
+class BoardArrays(object):
+    """Typed arrays of boards, in queue order.
+
+    Args:
+        ids (Array): int64 board ids
+        Q_index (Array): int64 positions in the job queue
+        Q_priority (Array): int64 (1 / Q_priority) of queue to search
+        num_urls (Array): int64 urls of each board
+        jobboard (Array): bool, board is a jobboard
+        organization (Array): bool, board is an organization
+    """
+    ids: Array
+    Q_index: Array
+    Q_priority: Array
+    num_urls: Array
+    jobboard: Array
+    organization: Array
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def from_jobboards(jobboards: Iterable[object]) -> 'BoardArrays':
+        """Returns arrays of JobBoards, which must be sorted by Q_index."""
+        jobboards = list(jobboards)
+        num = len(jobboards)
+        return BoardArrays(
+            ids= np.fromiter((jobboard.ident for jobboard in jobboards), np.int64, num),
+            Q_index= np.fromiter((jobboard.Q_index for jobboard in jobboards), np.int64, num),
+            Q_priority= np.fromiter((jobboard.Q_priority for jobboard in jobboards), np.int64, num),
+            num_urls= np.fromiter((len(jobboard.urls) for jobboard in jobboards), np.int64, num),
+            jobboard= np.fromiter((bool(jobboard.jobboard) for jobboard in jobboards), bool, num),
+            organization= np.fromiter((bool(jobboard.organization) for jobboard in jobboards), bool, num),
+        )
+
+
+@dataclass
+class Selection(object):
+    """Boards selected to open.
+
+    Args:
+        opened (Array): int64 rows of the opened boards, in queue order
+        flags (Array): bool flag_opened of every row
+        sites_opened (int): urls of the opened boards
+    """
+    opened: Array
+    flags: Array
+    sites_opened: int
+
+
+##########
+# Select
+##########
+
+def get_candidates(
+    arrays: BoardArrays,
+    num_queue: int,
+    excluded: Tuple[str] = (),
+    region_boards: Union[Set[int], None] = None,
+    full_queue: bool = False,
+    ) -> Array:
+    """Returns bool mask of the boards passing the option, region & queue window filters. Args as select_boards()."""
+    mask = np.ones(len(arrays), dtype= bool)
+    for category in excluded:
+        mask &= ~getattr(arrays, category)
+    if region_boards is not None:
+        mask &= np.isin(arrays.ids, np.fromiter(region_boards, np.int64, len(region_boards)))
+    if not full_queue:
+        mask &= arrays.Q_index <= get_window(arrays, num_queue)
+    return mask
+
+
+def get_window(arrays: BoardArrays, num_queue: int) -> Array:
+    """Returns ceil(num_queue / Q_priority): the queue window of each board."""
+    return -(-num_queue // arrays.Q_priority)
+
+
+def select_boards(
+    arrays: BoardArrays,
+    max_sites: int,
+    num_queue: int,
+    excluded: Tuple[str] = (),
+    region_boards: Union[Set[int], None] = None,
+    full_queue: bool = False,
+    is_allowed: Callable[[int], bool] = None,
+    ) -> Selection:
+    """Returns boards the JobBoard.open_websites() loop opens.
+
+    Args:
+        arrays (BoardArrays): boards in queue order
+        max_sites (int): url budget, MAX_SITES_TO_OPEN
+        num_queue (int): length of the job queue
+        excluded (Tuple[str], optional): category flags, e.g., 'organization', whose boards
+            aren't opened. Defaults to ().
+        region_boards (Union[Set[int], None], optional): ids in the --region filter. Defaults to None.
+        full_queue (bool, optional): search the whole queue, as with an option or region filter.
+            Defaults to False.
+        is_allowed (Callable[[int], bool], optional): other checks of a row, only run on rows that
+            would otherwise open. Defaults to None.
+
+    Returns:
+        Selection: opened rows & flags
+    """
+    candidates = np.flatnonzero(get_candidates(arrays, num_queue, excluded, region_boards, full_queue))
+    counts = arrays.num_urls[candidates]
+    opened = []
+    remaining = max_sites
+    pos = 0
+    while remaining > 0 and pos < len(candidates):
+        fits = np.flatnonzero(counts[pos:] <= remaining) + pos
+        if not len(fits):
+            break
+        num_fit = int(np.searchsorted(np.cumsum(counts[fits]), remaining, side= 'right'))
+
+        next_pos = fits[num_fit] + 1 if num_fit < len(fits) else len(candidates)       # fits[num_fit] overflows
+        for candidate in fits[:num_fit]:
+            row = int(candidates[candidate])
+            if is_allowed is not None and not is_allowed(row):
+                next_pos = candidate + 1        # boards after it fit what's left differently
+                break
+            opened.append(row)
+            remaining -= int(counts[candidate])
+        pos = next_pos
+
+    flags = np.zeros(len(arrays), dtype= bool)
+    opened = np.array(opened, dtype= np.int64)
+    flags[opened] = True
+    return Selection(opened, flags, max_sites - remaining)
+
+
+##########
+# Knapsack
+##########
+
+OBJECTIVE_OVERDUE = 'overdue'
+OBJECTIVE_PRIORITY = 'priority'
+OBJECTIVES = (OBJECTIVE_OVERDUE, OBJECTIVE_PRIORITY)
+
+
+def get_values(arrays: BoardArrays, num_queue: int, full_queue: bool = False, objective: str = OBJECTIVE_OVERDUE) -> Array:
+    """Returns value of opening each board: its urls times how much each is worth opening.
+
+    Weighting by urls keeps boards with several urls from being outbid forever by boards with one.
+
+    overdue: (window + 1 - Q_index) / (window + 1), from 1 at the front of the queue to
+        almost 0 at the end of the board's window.
+    priority: 1 / Q_priority, ties by overdue-ness.
+    """
+    window = num_queue if full_queue else get_window(arrays, num_queue)
+    worth = (window + 1 - arrays.Q_index) / (window + 1)
+    if objective == OBJECTIVE_PRIORITY:
+        worth = 1.0 / arrays.Q_priority + worth * 1e-6
+    return worth * arrays.num_urls
+
+
+def select_boards_knapsack(
+    arrays: BoardArrays,
+    max_sites: int,
+    num_queue: int,
+    excluded: Tuple[str] = (),
+    region_boards: Union[Set[int], None] = None,
+    full_queue: bool = False,
+    is_allowed: Callable[[int], bool] = None,
+    objective: str = OBJECTIVE_OVERDUE,
+    ) -> Selection:
+    """Returns boards opening the most urls within the url budget, & of those the most value, from
+    the boards select_boards() considers.
+
+    Args:
+        arrays, max_sites, num_queue, excluded, region_boards, full_queue, is_allowed: as select_boards().
+            is_allowed runs on the chosen rows; if one isn't allowed, the budget is filled again without it.
+        objective (str, optional): one of OBJECTIVES. Defaults to OBJECTIVE_OVERDUE.
+
+    Returns:
+        Selection: opened rows, in queue order, & flags
+    """
+    mask = get_candidates(arrays, num_queue, excluded, region_boards, full_queue)
+    ## Values are at most ~1 per url, so a url more outweighs any difference in value
+    values = get_values(arrays, num_queue, full_queue, objective) + arrays.num_urls * 2.0 * (max_sites + 1)
+    allowed = set()
+    while True:
+        opened = get_knapsack_rows(np.flatnonzero(mask), arrays.num_urls, values, max_sites)
+        rejected = [row for row in opened.tolist() if is_allowed is not None and row not in allowed and not is_allowed(row)]
+        if not rejected:
+            break
+        allowed.update(opened.tolist())
+        allowed.difference_update(rejected)
+        mask[rejected] = False
+
+    flags = np.zeros(len(arrays), dtype= bool)
+    flags[opened] = True
+    return Selection(opened, flags, int(arrays.num_urls[opened].sum()))
+
+
+def get_knapsack_rows(candidates: Array, weights: Array, values: Array, capacity: int) -> Array:
+    """Returns sorted rows of candidates of most total value with total weight <= capacity.
+
+    Args:
+        candidates (Array): int64 rows to choose from
+        weights (Array): int64 weight of every row
+        values (Array): positive float value of every row
+        capacity (int): maximum total weight
+
+    Returns:
+        Array: int64 rows chosen
+    """
+    ## Only the capacity // w most valuable rows of weight w can be in the best choice
+    candidates = candidates[weights[candidates] <= capacity]
+    candidate_weights = weights[candidates].astype(np.int16 if capacity < (1 << 15) else np.int64)
+    order = np.argsort(candidate_weights, kind= 'stable')        # radix sort for int16
+    candidates, candidate_weights = candidates[order], candidate_weights[order]
+    bounds = np.searchsorted(candidate_weights, np.arange(capacity + 2), side= 'left')
+
+    free = candidates[:bounds[1]]         # no urls
+    items = []
+    for weight in range(1, capacity + 1):
+        group = candidates[bounds[weight]: bounds[weight + 1]]
+        num_fit = capacity // weight
+        if len(group) > num_fit:
+            group = group[np.argpartition(-values[group], num_fit - 1)[:num_fit]]
+        items.extend((int(row), weight) for row in group)
+
+    ## 0/1 knapsack: best[c] is the most value with total weight <= c
+    best = np.zeros(capacity + 1)
+    taken = np.zeros((len(items), capacity + 1), dtype= bool)
+    for i, (row, weight) in enumerate(items):
+        with_item = best[:capacity + 1 - weight] + values[row]
+        taken[i, weight:] = with_item > best[weight:]
+        best[weight:] = np.maximum(best[weight:], with_item)
+
+    chosen = []
+    remaining = capacity
+    for i in range(len(items) - 1, -1, -1):
+        if taken[i, remaining]:
+            row, weight = items[i]
+            chosen.append(row)
+            remaining -= weight
+    return np.sort(np.concatenate((free, np.array(chosen, dtype= np.int64))))
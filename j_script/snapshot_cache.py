@@ -0,0 +1,158 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 09:12:40
+ * @modify date 2026-10-18 22:46:02
+ * @desc [
+    Binary snapshot cache for the cleaned jobboard data.
+
+    The snapshot is keyed by the workbook's (mtime, size, content hash), so any
+    edit to jobboard_info.xlsx invalidates it automatically. A stale snapshot
+    is still read by load_previous(), to find what changed since. Each tag,
+    e.g., with & without locations, has its own file, so runs alternating
+    between them keep both snapshots.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import hashlib
+import os
+
+from . import constants
+from .script_objects import Any, SnapshotKey, Union
+
+
+##########
+# Snapshot Cache
+##########
+
+class SnapshotCache(object):
+    """Methods to load & save the workbook snapshot."""
+
+    ##########
+    # Constants
+    ##########
+    filename_snapshot = constants.FILENAME_SNAPSHOT
+    version = 4
+    chunk_size = 1 << 16
+
+
+    ##########
+    # Key
+    ##########
+    @staticmethod
+    def get_key(filename: str) -> SnapshotKey:
+        """Returns the snapshot key of the workbook.
+
+        Args:
+            filename (str): workbook to key
+
+        Returns:
+            SnapshotKey: (mtime_ns, size, sha256 hexdigest)
+        """
+        stat = os.stat(filename)
+        file_hash = hashlib.sha256()
+        with open(filename, 'rb') as f:
+            for chunk in iter(lambda: f.read(SnapshotCache.chunk_size), b''):
+                file_hash.update(chunk)
+
+        return (stat.st_mtime_ns, stat.st_size, file_hash.hexdigest())
+
+
+    @staticmethod
+    def get_filename(tag: str = '', filename_snapshot: str = None) -> str:
+        """Returns snapshot file of tag, filename_snapshot with the tag as a suffix."""
+        filename_snapshot = filename_snapshot or SnapshotCache.filename_snapshot
+        return f"{filename_snapshot}.{tag}" if tag else filename_snapshot
+
+
+    ##########
+    # Load Snapshot
+    ##########
+    @staticmethod
+    def load(key: SnapshotKey, tag: str = '', filename_snapshot: str = None) -> Union[Any, None]:
+        """Returns snapshot data if the stored key & tag match, else None.
+
+        Args:
+            key (SnapshotKey): key of the current workbook
+            tag (str, optional): identifies what was cached. Defaults to ''.
+            filename_snapshot (str, optional): snapshot file, before the tag suffix. Defaults to filename_snapshot.
+
+        Returns:
+            Union[Any, None]: cached data, or None if missing or stale.
+
+        NOTE:
+        The header is a separate pickle, so a stale snapshot is rejected without
+        unpickling its data.
+        """
+        import pickle
+        filename_snapshot = SnapshotCache.get_filename(tag, filename_snapshot)
+        try:
+            with open(filename_snapshot, 'rb') as f:
+                header = pickle.load(f)
+                if header != SnapshotCache.get_header(key, tag):
+                    return None
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+
+    @staticmethod
+    def load_previous(tag: str = '', filename_snapshot: str = None, with_key: bool = False) -> Union[Any, None]:
+        """Returns snapshot data of tag, whichever workbook it was read from, else None.
+
+        Args:
+            tag (str, optional): identifies what was cached. Defaults to ''.
+            filename_snapshot (str, optional): snapshot file, before the tag suffix. Defaults to filename_snapshot.
+            with_key (bool, optional): return (key of the snapshot's workbook, data). Defaults to False.
+
+        Returns:
+            Union[Any, None]: cached data of the previous run, or None if missing.
+        """
+        import pickle
+        filename_snapshot = SnapshotCache.get_filename(tag, filename_snapshot)
+        try:
+            with open(filename_snapshot, 'rb') as f:
+                header = pickle.load(f)
+                if header[:2] != (SnapshotCache.version, tag):
+                    return None
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, TypeError):
+            return None
+        return (header[2], data) if with_key else data
+
+
+    ##########
+    # Save Snapshot
+    ##########
+    @staticmethod
+    def save(data: Any, key: SnapshotKey, tag: str = '', filename_snapshot: str = None) -> None:
+        """Saves data to the snapshot file. Writes to a temp file & renames it.
+
+        Args:
+            data (Any): data to cache
+            key (SnapshotKey): key of the workbook the data was read from
+            tag (str, optional): identifies what was cached. Defaults to ''.
+            filename_snapshot (str, optional): snapshot file, before the tag suffix. Defaults to filename_snapshot.
+        """
+        import pickle
+        filename_snapshot = SnapshotCache.get_filename(tag, filename_snapshot)
+        filename_tmp = filename_snapshot + '.tmp'
+        try:
+            with open(filename_tmp, 'wb') as f:
+                pickle.dump(SnapshotCache.get_header(key, tag), f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(filename_tmp, filename_snapshot)
+        except OSError as e:
+            print(f"- Could not save snapshot ({e})")
+        return
+
+
+    @staticmethod
+    def get_header(key: SnapshotKey, tag: str) -> tuple:
+        """Returns header stored before snapshot data."""
+        return (SnapshotCache.version, tag, tuple(key))
@@ -0,0 +1,328 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 17:02:48
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Optional SQLite store of the catalog & job queue.
+
+    The workbook is imported incrementally: the store keeps the workbook's
+    snapshot key, so an unchanged workbook isn't read at all, and a row hash
+    per board, so only added, changed & removed boards are written.
+
+    Queue order is an indexed position per board. Moving a board to the back
+    gives it the next position, so ranks are the order of positions.
+    Boards to open are read in queue order from the position index, & reading
+    stops once MAX_SITES_TO_OPEN is reached.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import hashlib
+import math
+import sqlite3
+from typing import Iterable, Set
+
+from . import constants
+from .geo_index import LocationTable
+from .script_objects import Columns, Dict, JobIDs, List, SnapshotKey, Tuple, Union
+
+
+##########
+# SQLite Store
+##########
+
+class SQLiteStore(object):
+    """SQLite store of boards, urls, locations & queue positions.
+
+    Args:
+        filename_db (str, optional): database file. Defaults to constants.FILENAME_DB.
+    """
+    schema = (
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+        """CREATE TABLE IF NOT EXISTS boards (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            q_priority INTEGER NOT NULL,
+            jobboard INTEGER NOT NULL,
+            organization INTEGER NOT NULL,
+            num_urls INTEGER NOT NULL,
+            row_hash TEXT NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS urls (
+            board_id INTEGER NOT NULL,
+            pos INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            PRIMARY KEY (board_id, pos)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS locations (
+            id INTEGER PRIMARY KEY,
+            country TEXT COLLATE NOCASE,
+            state TEXT COLLATE NOCASE,
+            city TEXT COLLATE NOCASE
+        )""",
+        """CREATE TABLE IF NOT EXISTS board_locations (
+            board_id INTEGER NOT NULL,
+            location_id INTEGER NOT NULL,
+            PRIMARY KEY (board_id, location_id)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS queue (
+            board_id INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS queue_position ON queue (position)",
+        "CREATE INDEX IF NOT EXISTS boards_priority ON boards (q_priority)",
+        "CREATE INDEX IF NOT EXISTS boards_category ON boards (jobboard, organization)",
+        "CREATE INDEX IF NOT EXISTS board_locations_location ON board_locations (location_id)",
+        "CREATE INDEX IF NOT EXISTS locations_country ON locations (country, state, city)",
+        "CREATE INDEX IF NOT EXISTS locations_state ON locations (state)",
+        "CREATE INDEX IF NOT EXISTS locations_city ON locations (city)",
+    )
+    location_cols = ('country', 'state', 'city')
+
+
+    def __init__(self, filename_db: str = constants.FILENAME_DB):
+        self.filename_db = filename_db
+        self.conn = sqlite3.connect(filename_db)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            for statement in self.schema:
+                self.conn.execute(statement)
+        return None
+
+    def __enter__(self) -> 'SQLiteStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+    ##########
+    # Meta
+    ##########
+    def get_meta(self, key: str) -> Union[str, None]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+
+    def is_current(self, workbook_key: SnapshotKey) -> bool:
+        """Returns if the store was last imported from the workbook with workbook_key."""
+        return self.get_meta('workbook_key') == repr(tuple(workbook_key))
+
+
+    ##########
+    # Import
+    ##########
+    def import_columns(
+        self,
+        columns: Columns,
+        location_table: LocationTable,
+        workbook_key: SnapshotKey,
+        saved_queue: Iterable[int] = (),
+        ) -> Tuple[int, int, int]:
+        """Writes added & changed boards, & deletes removed boards, in one transaction.
+
+        New boards are appended to the queue in catalog order.
+
+        Args:
+            columns (Columns): cleaned columns from record_methods.get_columns_jobboards()
+            location_table (LocationTable): location rows of columns[COL_LOCATIONS]
+            workbook_key (SnapshotKey): key of the workbook columns were read from
+            saved_queue (Iterable[int], optional): queue order to start an empty queue with.
+
+        Returns:
+            Tuple[int, int, int]: number of boards added, changed & removed
+        """
+        rows = self.get_board_rows(columns, location_table)
+        old_hashes = dict(self.conn.execute("SELECT id, row_hash FROM boards"))
+        new_ids = {row[0] for row in rows}
+
+        changed = [row for row in rows if old_hashes.get(row[0]) != row[-1]]
+        removed = [(ident,) for ident in old_hashes if ident not in new_ids]
+        num_added = sum(1 for row in changed if row[0] not in old_hashes)
+
+        with self.conn:
+            cur = self.conn.cursor()
+            for table, col in (('boards', 'id'), ('urls', 'board_id'), ('board_locations', 'board_id'), ('queue', 'board_id')):
+                cur.executemany(f"DELETE FROM {table} WHERE {col} = ?", removed)
+            for table in ('urls', 'board_locations'):
+                cur.executemany(f"DELETE FROM {table} WHERE board_id = ?", ((row[0],) for row in changed))
+
+            cur.executemany(
+                "INSERT OR REPLACE INTO boards VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (row[:6] + (len(row[6]), row[-1]) for row in changed))
+            cur.executemany(
+                "INSERT INTO urls VALUES (?, ?, ?)",
+                ((row[0], pos, url) for row in changed for pos, url in enumerate(row[6])))
+
+            location_ids = self.get_location_ids({location for row in changed for location in row[7]})
+            cur.executemany(
+                "INSERT OR IGNORE INTO board_locations VALUES (?, ?)",
+                ((row[0], location_ids[location]) for row in changed for location in row[7]))
+
+            ## Queue: saved order if empty, then new boards in catalog order
+            queued = {ident for ident, in cur.execute("SELECT board_id FROM queue")}
+            queue_ids = [] if queued else [ident for ident in saved_queue if ident in new_ids]
+            queue_ids.extend(dict.fromkeys(row[0] for row in rows if row[0] not in queued))
+            self.append_to_queue(dict.fromkeys(queue_ids))
+
+            cur.execute("INSERT OR REPLACE INTO meta VALUES ('workbook_key', ?)", (repr(tuple(workbook_key)),))
+        return num_added, len(changed) - num_added, len(removed)
+
+
+    @staticmethod
+    def get_board_rows(columns: Columns, location_table: LocationTable) -> List[tuple]:
+        """Returns (id, name, description, Q_priority, jobboard, organization, urls, locations, row hash) of each board.
+
+        Names & descriptions are normalized as jobboard_list.create_jobboard_instances_from_columns().
+        """
+        rows = []
+        for ident, name, description, Q_priority, jobboard, organization, urls, location_ids in zip(
+            columns[constants.COL_ID], columns[constants.COL_NAME], columns[constants.COL_DESCRIPT],
+            columns[constants.COL_QUEUE_PRIORITY], columns[constants.COL_JOBBOARD], columns[constants.COL_ORG],
+            columns[constants.COL_URLS], columns[constants.COL_LOCATIONS]):
+
+            row = (
+                int(ident),
+                name.strip().title(),
+                description.capitalize().strip().replace("\n", ""),
+                int(Q_priority),
+                int(bool(jobboard)),
+                int(bool(organization)),
+                tuple(urls),
+                tuple(location_table[location_id] for location_id in location_ids),
+            )
+            row_hash = hashlib.blake2b(repr(row).encode(), digest_size = 16).hexdigest()
+            rows.append(row + (row_hash,))
+        return rows
+
+
+    def get_location_ids(self, locations: Set[tuple]) -> Dict[tuple, int]:
+        """Returns {(country, state, city): location id}, adding new locations."""
+        location_ids = {}
+        for location in locations:
+            row = self.conn.execute(
+                "SELECT id FROM locations WHERE country IS ? AND state IS ? AND city IS ?", location).fetchone()
+            if row is None:
+                location_ids[location] = self.conn.execute(
+                    "INSERT INTO locations (country, state, city) VALUES (?, ?, ?)", location).lastrowid
+            else:
+                location_ids[location] = row[0]
+        return location_ids
+
+
+    ##########
+    # Queue
+    ##########
+    def count_queue(self) -> int:
+        (count,), = self.conn.execute("SELECT COUNT(*) FROM queue")
+        return count
+
+
+    def get_queue(self) -> JobIDs:
+        """Returns board ids in queue order."""
+        return [ident for ident, in self.conn.execute("SELECT board_id FROM queue ORDER BY position")]
+
+
+    def append_to_queue(self, ids: Iterable[int]) -> None:
+        """Gives ids the next positions, in order. Moves ids already queued to the back."""
+        (last,), = self.conn.execute("SELECT COALESCE(MAX(position), -1) FROM queue")
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO queue VALUES (?, ?)",
+            ((ident, position) for position, ident in enumerate(ids, start = last + 1)))
+        return None
+
+
+    def move_to_back(self, ids: JobIDs) -> None:
+        """Moves ids to the back of the queue, in order."""
+        with self.conn:
+            self.append_to_queue(ids)
+        return None
+
+
+    ##########
+    # Select
+    ##########
+    def get_region_boards(self, region: str) -> Set[int]:
+        """Returns ids of boards in region, as GeoIndex.boards_in().
+
+        Args:
+            region (str): location name, or path of names separated by '/'
+        """
+        if '/' in region:
+            parts = [part.strip() or None for part in region.split('/')]
+            conditions = ' AND '.join(f"{col} IS ?" for col in self.location_cols[:len(parts)])
+            params = parts
+        else:
+            conditions = ' OR '.join(f"{col} = ?" for col in self.location_cols)
+            params = [region.strip()] * len(self.location_cols)
+        return {ident for ident, in self.conn.execute(
+            f"""SELECT DISTINCT board_id FROM board_locations WHERE location_id IN
+                (SELECT id FROM locations WHERE {conditions})""", params)}
+
+
+    def select_boards_to_open(
+        self,
+        max_sites: int,
+        options: Dict[str, bool],
+        region_boards: Union[Set[int], None] = None,
+        ) -> List[Tuple[int, str, int, List[str]]]:
+        """Returns boards to open, as the JobBoard.open_websites() loop would open them.
+
+        Boards are read in queue order & checked against the options, region, queue
+        window (Q_index <= ceil(queue length / Q_priority)) & remaining url budget.
+        Reading stops once max_sites urls are selected.
+
+        Args:
+            max_sites (int): MAX_SITES_TO_OPEN
+            options (Dict[str, bool]): {'boards': bool, 'orgs': bool}, as set on JobBoard by main
+            region_boards (Union[Set[int], None], optional): ids in the --region filter. Defaults to None.
+
+        Returns:
+            List[Tuple[int, str, int, List[str]]]: (id, name, Q_index, urls) of boards to open
+        """
+        num_queue = self.count_queue()
+        full_queue = not all(options.values()) or region_boards is not None
+        sites_opened = 0
+        selected = []
+
+        rows = self.conn.execute(
+            """SELECT b.id, b.name, b.q_priority, b.jobboard, b.organization, b.num_urls
+            FROM queue q JOIN boards b ON b.id = q.board_id
+            ORDER BY q.position""")
+        for Q_index, (ident, name, Q_priority, jobboard, organization, num_urls) in enumerate(rows):
+            if sites_opened >= max_sites:
+                break
+            if sites_opened + num_urls > max_sites:
+                continue
+            if (not options['boards'] and jobboard) or (not options['orgs'] and organization):
+                continue
+            if region_boards is not None and ident not in region_boards:
+                continue
+            if not full_queue and Q_index > math.ceil(num_queue / Q_priority):
+                continue
+
+            sites_opened += num_urls
+            selected.append((ident, name, Q_index, self.get_urls(ident)))
+        rows.close()
+        return selected
+
+
+    def get_urls(self, ident: int) -> List[str]:
+        return [url for url, in self.conn.execute("SELECT url FROM urls WHERE board_id = ? ORDER BY pos", (ident,))]
+
+
+    def iter_markdown_rows(self) -> Iterable[Tuple[str, List[str], str]]:
+        """Yields (name, urls, description) of each board, by name."""
+        boards = self.conn.execute("SELECT id, name, description FROM boards ORDER BY name")
+        for ident, name, description in boards:
+            yield name, self.get_urls(ident), description
@@ -2,7 +2,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-10-04 21:51:25
- * @modify date 2020-10-07 20:38:12
+ * @modify date 2026-10-18 09:40:26
  * @desc [
     Contains auxiliary methods for table class.
 
@@ -24,8 +24,8 @@
 ##########
 # Imports
 ##########
-import os
 import math
+import shutil
 
 try:
     from script_objects import Union, Tuple
@@ -159,7 +159,7 @@ class Aux_TblInfo():
 
 
         ## Allowed
-        allowed_width = os.get_terminal_size().columns * self.ALLOWED_TERM_WIDTH
+        allowed_width = shutil.get_terminal_size().columns * self.ALLOWED_TERM_WIDTH
         if (
         self.width_cols_total + self.non_col_space <= allowed_width
         or self.markdown
@@ -0,0 +1,1104 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 11:48:30
+ * @modify date 2026-10-18 23:20:41
+ * @desc [
+    Tests for j_script. Run from the repository root:
+        python -m pytest --import-mode=importlib j_script/tests.py
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import os
+
+from j_script import constants, custom_errors, record_methods
+from j_script.catalog_delta import CatalogDelta
+from j_script.geo_index import GeoIndex, LocationTable, get_location_table
+from j_script.indexed_queue import IndexedJobQueue
+from j_script.launchpad import Launchpad
+from j_script.markdown_table import MarkdownTable
+from j_script.page_watcher import PageWatcher
+from j_script.queue_file import QueueFile
+from j_script.queue_journal import QueueJournal
+from j_script.queue_methods import QueueMethods
+from j_script.scheduler import DueScheduler, HeapScheduler, Scheduler, StrideScheduler, WindowScheduler
+from j_script.selection import (OBJECTIVES, BoardArrays, get_candidates, get_values, select_boards,
+								select_boards_knapsack)
+from j_script.sqlite_store import SQLiteStore
+from j_script.url_checker import UrlChecker
+from j_script.url_opener import UrlOpener
+from j_script.xlsx_reader import XlsxReader
+
+
+##########
+# Constants
+##########
+
+DIR_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_WORKBOOK = os.path.join(DIR_REPO, 'job_files', 'jobboard_info.xlsx')
+
+
+##########
+# Test xlsx reader
+##########
+
+def test_xlsx_reader() -> None:
+	"""Tests XlsxReader reads sheets, headers & cell types."""
+	print_test_header("Test xlsx reader")
+	with XlsxReader(TEST_WORKBOOK) as workbook:
+		assert set(constants.SHEETNAMES) <= set(workbook.sheet_paths)
+
+		columns = workbook.read_columns(constants.SHEETNAME_JOBBOARDS)
+		for col in (constants.COL_ID, constants.COL_NAME, constants.COL_URLS, constants.COL_QUEUE_PRIORITY):
+			assert col in columns
+
+		ids = columns[constants.COL_ID]
+		assert len(ids) == len(set(ids)) > 0
+		assert all(isinstance(i, int) for i in ids)
+		assert all(isinstance(p, int) for p in columns[constants.COL_QUEUE_PRIORITY])
+
+		countries = workbook.read_columns(constants.COL_COUNTRY)
+		assert countries[constants.COL_ID][0] == 0
+		assert countries[constants.COL_COUNTRY][0] is None		# "NULL" is missing
+
+
+def test_get_columns_jobboards() -> None:
+	"""Tests record_methods cleans urls & locations."""
+	print_test_header("Test record_methods columns")
+	columns, location_table, delta = record_methods.get_columns_jobboards(TEST_WORKBOOK, use_snapshot= False)
+	assert delta is None
+
+	for urls in columns[constants.COL_URLS]:
+		assert isinstance(urls, list)
+		assert all(url == url.strip().lower() for url in urls)
+
+	for key in constants.AUX_DF_KEYS:
+		assert key not in columns
+	for location_ids in columns[constants.COL_LOCATIONS]:
+		assert all(0 <= location_id < len(location_table) for location_id in location_ids)
+
+
+def test_catalog_delta() -> None:
+	"""Tests only changed rows are detected & cleaned against the previous snapshot."""
+	print_test_header("Test catalog delta")
+	import shutil
+	import tempfile
+	load_columns = record_methods.load_columns
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename_snapshot = os.path.join(tmp_dir, 'test.snapshot')
+		filename = shutil.copy(TEST_WORKBOOK, tmp_dir)
+		try:
+			columns, _, delta = record_methods.get_columns_jobboards(filename, filename_snapshot= filename_snapshot)
+			assert delta is None
+			assert record_methods.get_columns_jobboards(filename, filename_snapshot= filename_snapshot)[2] == CatalogDelta()
+
+			## Change a row's urls & remove a row
+			def load_changed_columns(filename, sheetnames):
+				sheets = load_columns(filename, sheetnames)
+				jobboards = {col: vals[1:] for col, vals in sheets[0].items()}
+				jobboards[constants.COL_URLS][0] = 'https://www.Changed.com'
+				return (jobboards,) + sheets[1:]
+			record_methods.load_columns = load_changed_columns
+
+			os.utime(filename, ns= (0, 0))		# new snapshot key
+			changed_columns, location_table, delta = record_methods.get_columns_jobboards(
+				filename, filename_snapshot= filename_snapshot)
+			ids = columns[constants.COL_ID]
+			assert delta == CatalogDelta(added= [], changed= [ids[1]], removed= [ids[0]])
+			assert changed_columns[constants.COL_URLS][0] == ['https://www.changed.com']
+
+			full_columns, full_table, _ = record_methods.get_columns_jobboards(filename, use_snapshot= False)
+			changed_locations = changed_columns.pop(constants.COL_LOCATIONS)
+			full_locations = full_columns.pop(constants.COL_LOCATIONS)
+			assert changed_columns == full_columns
+			for changed_ids, full_ids in zip(changed_locations, full_locations):
+				assert [location_table[i] for i in changed_ids] == [full_table[i] for i in full_ids]
+
+			## Geo index: updated by the delta, & loaded with the current snapshot
+			_, _, geo_index, _, _ = record_methods.load_columns_jobboards(filename, filename_snapshot= filename_snapshot)
+			full_index = GeoIndex(full_table, zip(full_columns[constants.COL_ID], full_locations))
+			assert geo_index.node_boards == full_index.node_boards and geo_index.tree == full_index.tree
+			assert record_methods.load_columns_jobboards(filename, False, filename_snapshot= filename_snapshot)[2] is None
+		finally:
+			record_methods.load_columns = load_columns
+
+
+def test_interrupted_run() -> None:
+	"""Tests a run interrupted before saving its snapshot leaves the changes for the next run."""
+	print_test_header("Test interrupted run")
+	import shutil
+	import tempfile
+	load_columns = record_methods.load_columns
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename_snapshot = os.path.join(tmp_dir, 'test.snapshot')
+		filename = shutil.copy(TEST_WORKBOOK, tmp_dir)
+		try:
+			columns, _, _ = record_methods.get_columns_jobboards(filename, filename_snapshot= filename_snapshot)
+			ids = columns[constants.COL_ID]
+
+			def load_changed_columns(filename, sheetnames):
+				sheets = load_columns(filename, sheetnames)
+				sheets[0][constants.COL_URLS][0] = 'https://www.Changed.com'
+				return sheets
+			record_methods.load_columns = load_changed_columns
+			os.utime(filename, ns= (0, 0))		# new snapshot key
+
+			## Interrupted: the snapshot isn't saved, so the next run finds the same changes
+			for _ in range(2):
+				_, _, _, delta, snapshot = record_methods.load_columns_jobboards(filename, filename_snapshot= filename_snapshot)
+				assert delta == CatalogDelta(changed= [ids[0]]) and snapshot is not None
+
+			## Completed: the snapshot is saved last, & the next run finds nothing changed
+			record_methods.save_snapshot(snapshot)
+			_, _, _, delta, snapshot = record_methods.load_columns_jobboards(filename, filename_snapshot= filename_snapshot)
+			assert delta == CatalogDelta() and delta.key == delta.base and snapshot is None
+		finally:
+			record_methods.load_columns = load_columns
+
+
+def test_snapshot_tags() -> None:
+	"""Tests snapshots of different tags don't evict each other, so alternating runs stay warm."""
+	print_test_header("Test snapshot tags")
+	import shutil
+	import tempfile
+	from j_script.snapshot_cache import SnapshotCache
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename_snapshot = os.path.join(tmp_dir, 'test.snapshot')
+		filename = shutil.copy(TEST_WORKBOOK, tmp_dir)
+		key = SnapshotCache.get_key(filename)
+
+		SnapshotCache.save('a', key, 'tag_a', filename_snapshot)
+		SnapshotCache.save('b', key, 'tag_b', filename_snapshot)
+		assert SnapshotCache.load(key, 'tag_a', filename_snapshot) == 'a'
+		assert SnapshotCache.load(key, 'tag_b', filename_snapshot) == 'b'
+
+		## Runs with & without --region alternate between the two column snapshots
+		for flag_locations in (True, False):
+			assert record_methods.get_columns_jobboards(
+				filename, flag_locations, filename_snapshot= filename_snapshot)[2] is None		# cold
+		for _ in range(2):
+			for flag_locations in (True, False):
+				assert record_methods.get_columns_jobboards(
+					filename, flag_locations, filename_snapshot= filename_snapshot)[2] == CatalogDelta()
+
+
+def test_get_location_codes() -> None:
+	"""Tests location ints are split & bad values raise IncompatibleDataList."""
+	print_test_header("Test location codes")
+	valid_codes = (0, 1, 2)
+	ids = [10, 11, 12, 13]
+
+	results = record_methods.get_location_codes([1, '1, 2', '2,', None], valid_codes, ids, 'state')
+	assert results == [(1,), (1, 2), (2,), ()]
+
+	try:
+		record_methods.get_location_codes([1, 'x', '2, 7', 0], valid_codes, ids, 'state')
+	except custom_errors.IncompatibleDataList as e:
+		assert e.vals == ['x', '7']
+		assert e.ids == [11, 12]
+	else:
+		raise Exception("Expected IncompatibleDataList")
+
+
+def test_location_code_col() -> None:
+	"""Tests pandas location columns are split per cell & bad values raise IncompatibleDataList with their row ids."""
+	print_test_header("Test location code column")
+	import numpy as np
+	import pandas as pd
+	from j_script import locations
+	valid_codes = pd.Index([0, 1, 2, 3])
+
+	## Multi-code cells, repeated cells & missing cells
+	col = pd.Series([1, '1, 2', '3,2,', '1, 2', None, np.nan, '', ' , ', 0], index= range(10, 19), name= 'state')
+	results = locations.get_location_code_col(col, valid_codes, 'state')
+	assert results.tolist() == [(1,), (1, 2), (3, 2), (1, 2), (), (), (), (), (0,)]
+	assert results.index.tolist() == list(range(10, 19)) and results.name == 'state'
+	assert locations.get_location_code_col(pd.Series([None, np.nan], index= [5, 6]), valid_codes, 'state').tolist() == [(), ()]
+
+	## Every bad value, with the id of each row it's in, in row order
+	col = pd.Series(['1, x', 2, '7', np.nan, '1, x', '9, 8'], index= [20, 21, 22, 23, 24, 25])
+	try:
+		locations.get_location_code_col(col, valid_codes, 'state')
+	except custom_errors.IncompatibleDataList as e:
+		assert e.vals == ['x', '7', 'x', '9', '8']
+		assert e.ids == [20, 22, 24, 25, 25]
+		assert 'Invalid value: [7] in column: state with id 22' in str(e)
+	else:
+		raise Exception("Expected IncompatibleDataList")
+
+	## raise_incompatible_data: bad parts are indexed by unique cell value, codes give each row's unique value
+	bad_parts = pd.Series(['x', 'y', '7'], index= [0, 0, 2])
+	try:
+		locations.raise_incompatible_data(bad_parts, np.array([2, 1, 0, -1, 2]), pd.Index([30, 31, 32, 33, 34]), 'country')
+	except custom_errors.IncompatibleDataList as e:
+		assert e.vals == ['7', 'x', 'y', '7']
+		assert e.ids == [30, 32, 32, 34]
+	else:
+		raise Exception("Expected IncompatibleDataList")
+
+
+def test_geo_index() -> None:
+	"""Tests location table rows & region lookups."""
+	print_test_header("Test geo index")
+	location_names = (
+		{0: None, 1: 'United States', 2: 'United Kingdom'},
+		{0: None, 1: 'California', 2: 'New York'},
+		{0: None, 1: 'Oakland', 2: 'New York', 3: 'London'},
+	)
+	countries = [(1,), (1,), (1,), (2,), ()]
+	states = [(0,), (1,), (1, 2), (0,), ()]
+	cities = [(0,), (1,), (2,), (3,), ()]
+	location_table, board_location_ids = get_location_table(countries, states, cities, location_names)
+
+	assert location_table[board_location_ids[0][0]] == ('United States', None, None)
+	assert location_table[board_location_ids[1][0]] == ('United States', 'California', 'Oakland')
+	assert len(board_location_ids[2]) == 2
+	assert board_location_ids[4] == ()
+
+	geo_index = GeoIndex(location_table, zip((1, 2, 3, 4, 5), board_location_ids))
+	region_boards = (
+		('United States', {1, 2, 3}),
+		('california', {2, 3}),
+		('New York', {3}),				# state & city
+		('Oakland', {2}),
+		('United Kingdom/', {4}),
+		('United States/California/Oakland', {2}),
+		('Texas', set()),
+	)
+	for region, boards in region_boards:
+		assert set(geo_index.boards_in(region)) == boards, region
+
+	## Removing boards matches an index built without them, empty nodes included
+	for ident in (3, 4):
+		geo_index.remove(ident, [location_table[i] for i in board_location_ids[ident - 1]])
+	rebuilt = GeoIndex(location_table, zip((1, 2, 5), (board_location_ids[0], board_location_ids[1], board_location_ids[4])))
+	assert (geo_index.tree, geo_index.node_boards, geo_index.names) == (rebuilt.tree, rebuilt.node_boards, rebuilt.names)
+	assert set(geo_index.boards_in('United States')) == {1, 2} and not geo_index.get_keys('New York')
+
+
+##########
+# Test job queue
+##########
+
+def test_indexed_job_queue() -> None:
+	"""Tests IndexedJobQueue indices match a list through moves & removals."""
+	print_test_header("Test indexed job queue")
+	import random
+	rand = random.Random(0)
+	ids = list(range(100))
+	rand.shuffle(ids)
+	job_queue = IndexedJobQueue(ids + ids[:5])		# repeated ids keep first position
+	assert job_queue.to_list() == ids
+
+	for _ in range(500):
+		ident = rand.choice(ids)
+		if rand.random() < 0.8:
+			job_queue.move_to_back(ident)
+			ids.remove(ident)
+			ids.append(ident)
+		else:
+			job_queue.remove(ident)
+			ids.remove(ident)
+			assert job_queue.append(ident + 1000) == len(ids)
+			ids.append(ident + 1000)
+		assert len(job_queue) == len(ids)
+
+	assert job_queue.to_list() == ids
+	assert all(job_queue.index(ident) == i for i, ident in enumerate(ids))
+	assert 5000 not in job_queue
+
+
+def test_queue_journal() -> None:
+	"""Tests save_queue journals used jobs, compaction, & recovery from a torn journal."""
+	print_test_header("Test queue journal")
+	import tempfile
+	filenames = QueueMethods.filename_pickle, QueueFile.filename_queue, QueueJournal.filename_journal
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		QueueMethods.filename_pickle = os.path.join(tmp_dir, 'job_queue.pkl')
+		QueueFile.filename_queue = os.path.join(tmp_dir, 'job_queue.bin')
+		QueueJournal.filename_journal = os.path.join(tmp_dir, 'job_queue.journal')
+		try:
+			QueueMethods.compact_queue(IndexedJobQueue([5, 3, 9, 1, 7]))
+			job_queue = QueueMethods.load_queue()
+			QueueMethods.save_queue(job_queue, [(1, 3), (3, 1), (4, 7)])
+			assert os.path.getsize(QueueJournal.filename_journal) > 0
+			assert QueueMethods.load_queue().to_list() == [5, 9, 3, 1, 7]
+
+			## Torn record is cut off, earlier records kept
+			with open(QueueJournal.filename_journal, 'ab') as f:
+				f.write(b'\x20\x00\x00\x00torn')
+			job_queue = QueueMethods.load_queue()
+			assert job_queue.to_list() == [5, 9, 3, 1, 7]
+			QueueMethods.save_queue(job_queue, [(0, 5)])
+			assert QueueMethods.load_queue().to_list() == [9, 3, 1, 7, 5]
+
+			## Records of an older generation are ignored after compaction
+			QueueMethods.compact_queue(job_queue)
+			QueueJournal.append([(QueueJournal.OP_REMOVE, [9])], QueueMethods.generation - 1)
+			assert QueueMethods.load_queue().to_list() == [9, 3, 1, 7, 5]
+		finally:
+			QueueMethods.filename_pickle, QueueFile.filename_queue, QueueJournal.filename_journal = filenames
+
+
+def test_queue_file() -> None:
+	"""Tests queue file round trip, corruption errors, & migration from pickle."""
+	print_test_header("Test queue file")
+	import pickle
+	import tempfile
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename_queue = os.path.join(tmp_dir, 'job_queue.bin')
+		ids = [5, 3, 2 ** 40, 1]
+		QueueFile.save(ids, 7, filename_queue)
+		assert QueueFile.load(filename_queue) == (7, ids)
+
+		with open(filename_queue, 'r+b') as f:
+			f.seek(-1, os.SEEK_END)
+			f.write(b'\xff')
+		for truncate in (False, True):
+			if truncate:
+				with open(filename_queue, 'r+b') as f:
+					f.truncate(os.path.getsize(filename_queue) - 3)
+			try:
+				QueueFile.load(filename_queue)
+			except custom_errors.QueueFileError:
+				pass
+			else:
+				raise Exception("Expected QueueFileError")
+
+		filename_pickle = os.path.join(tmp_dir, 'job_queue.pkl')
+		with open(filename_pickle, 'wb') as f:
+			pickle.dump([4, 'x', 2], f)
+		assert QueueFile.migrate_pickle(filename_pickle, filename_queue) == (0, [4, 2])
+		assert QueueFile.load(filename_queue) == (0, [4, 2])
+
+
+def test_reconcile_queue() -> None:
+	"""Tests stale ids are dropped & new ids appended in catalog order."""
+	print_test_header("Test reconcile_queue")
+	job_queue, added, removed = QueueMethods.reconcile_queue([4, 'x', 2, 9, 1], [1, 2, 3, 4, 5])
+	assert job_queue.to_list() == [4, 2, 1, 3, 5]
+	assert added == [3, 5]
+	assert removed == ['x', 9]
+	assert job_queue.index(3) == 3
+
+
+def test_clean_queue_delta() -> None:
+	"""Tests clean_queue applies a catalog delta, & falls back to reconciling a queue out of sync."""
+	print_test_header("Test clean_queue with delta")
+	from j_script.class_jobboard import JobBoard
+	jobboards = [JobBoard(ident, 'name', ['url'], 'descript', 1, True, False, ()) for ident in (1, 2, 3, 4)]
+	try:
+		job_queue = QueueMethods.clean_queue(IndexedJobQueue([2, 9, 1, 3]), jobboards, CatalogDelta(added= [4], removed= [9]))
+		assert job_queue.to_list() == [2, 1, 3, 4]
+		assert [jobboard.Q_index for jobboard in jobboards] == [1, 0, 2, 3]
+
+		## 5 isn't in the delta, so the queue is reconciled
+		job_queue = QueueMethods.clean_queue(IndexedJobQueue([5, 2, 1, 3]), jobboards, CatalogDelta(added= [4]))
+		assert job_queue.to_list() == [2, 1, 3, 4]
+		assert QueueMethods.journal_records[-2:] == [(QueueJournal.OP_REMOVE, [5]), (QueueJournal.OP_APPEND, [4])]
+	finally:
+		QueueMethods.journal_records = list()
+
+
+def test_lazy_jobboard() -> None:
+	"""Tests JobBoard's derived attributes are computed on first read, cached, & can be set."""
+	print_test_header("Test lazy jobboard")
+	from j_script.class_jobboard import JobBoard
+	job_queue = JobBoard.job_queue
+	try:
+		JobBoard.job_queue = IndexedJobQueue([7, 3, 5])
+		jobboard = JobBoard(3, 'name', ['a', 'b'], 'line one\nline two', 1, True, False, ())
+		assert jobboard.raw_description == 'line one\nline two'
+		assert jobboard.description == 'line oneline two'
+		assert jobboard.url_nums == '[1](a),[2](b)'
+		assert jobboard.flag_opened == False
+
+		assert jobboard.Q_index == 1
+		JobBoard.job_queue = IndexedJobQueue([3])
+		assert jobboard.Q_index == 1            # cached for the run
+		jobboard.Q_index = 0
+		assert jobboard.Q_index == 0
+
+		try:
+			jobboard.checked_jobs_in_Q
+			raise AssertionError("unset attributes that aren't derived raise AttributeError")
+		except AttributeError:
+			pass
+	finally:
+		JobBoard.job_queue = job_queue
+
+
+def test_stream_jobboards() -> None:
+	"""Tests iter_jobboards_in_queue() yields the boards of create_jobboard_instances_from_columns() in queue order, lazily."""
+	print_test_header("Test stream jobboards")
+	from j_script import jobboard_list
+	from j_script.class_jobboard import JobBoard
+	columns = {
+		constants.COL_ID: [3, 1, 4, 2],
+		constants.COL_NAME: ["  board three", "one ", "four", "two"],
+		constants.COL_URLS: [['a'], ['b', 'c'], ['d'], ['e']],
+		constants.COL_DESCRIPT: ["three\njobs ", "one", "four", "two"],
+		constants.COL_QUEUE_PRIORITY: [1, 2, 3, 4],
+		constants.COL_JOBBOARD: [True, False, True, False],
+		constants.COL_ORG: [False, True, False, True],
+		constants.COL_LOCATIONS: [(), (1,), (2,), ()],
+	}
+	try:
+		job_queue = QueueMethods.clean_queue_ids(IndexedJobQueue([2, 9, 1, 3]), columns[constants.COL_ID], CatalogDelta(added= [4], removed= [9]))
+		assert job_queue.to_list() == [2, 1, 3, 4]
+		assert QueueMethods.journal_records == [(QueueJournal.OP_REMOVE, [9]), (QueueJournal.OP_APPEND, [4])]
+
+		jobboards = jobboard_list.create_jobboard_instances_from_columns(columns)
+		QueueMethods.set_Q_indices(job_queue, jobboards)
+		expected = sorted(jobboards, key= lambda jobboard: jobboard.Q_index)
+		attrs = JobBoard.__slots__[:-1]         # checked_jobs_in_Q is set when opening
+		streamed = list(jobboard_list.iter_jobboards_in_queue(columns, job_queue))
+		assert [[getattr(jobboard, attr) for attr in attrs] for jobboard in streamed] == \
+			[[getattr(jobboard, attr) for attr in attrs] for jobboard in expected]
+
+		## Boards are only created as they're reached: board 4 is last, & can't be created
+		columns[constants.COL_NAME][2] = None
+		stream = jobboard_list.iter_jobboards_in_queue(columns, job_queue)
+		assert [next(stream).ident for _ in range(3)] == [2, 1, 3]
+	finally:
+		QueueMethods.journal_records = list()
+
+
+##########
+# Test scheduler
+##########
+
+def test_window_selection() -> None:
+	"""Tests WindowScheduler & select_boards() select the boards the JobBoard.open_websites() loop opens."""
+	print_test_header("Test window selection")
+	import random
+	from j_script.class_jobboard import JobBoard
+	rng = random.Random(0)
+	jobboards = [
+		JobBoard(ident, f"board {ident}", ['url'] * rng.randint(1, 3), 'descript', rng.randint(1, 4), ident % 3 != 0, ident % 3 == 0, ())
+		for ident in range(200)
+	]
+	for jobboard in rng.sample(jobboards, 40):
+		jobboard.urls = ['dead'] * len(jobboard.urls)
+	job_queue = IndexedJobQueue(rng.sample(range(200), 200))
+	option_jobboardattr = (("boards", "jobboard"), ("orgs", "organization"))
+
+	class DeadUrls(object):
+		def is_dead(self, urls):
+			return urls[0] == 'dead'
+
+	class_attrs = {attr: getattr(JobBoard, attr, None) for attr in
+		('job_queue', 'MAX_SITES_TO_OPEN', 'sites_opened', 'used_jobsites', 'url_opener', 'boards', 'orgs', 'region_boards', 'url_checker')}
+	try:
+		JobBoard.job_queue = job_queue
+		JobBoard.url_opener = UrlOpener(spacing= 0.0, open_url= lambda url: True)
+		QueueMethods.set_Q_indices(job_queue, jobboards)
+		boards = {jobboard.ident: jobboard for jobboard in jobboards}
+		in_queue = sorted(jobboards, key= lambda jobboard: jobboard.Q_index)
+		arrays = BoardArrays.from_jobboards(in_queue)
+		configs = (
+			(5, True, None, None), (40, True, None, None), (40, False, None, None),
+			(40, True, set(range(0, 200, 2)), None), (12, True, None, DeadUrls()), (30, False, set(range(100)), DeadUrls()),
+		)
+		for max_sites, orgs, region_boards, url_checker in configs:
+			JobBoard.MAX_SITES_TO_OPEN, JobBoard.sites_opened, JobBoard.used_jobsites = max_sites, 0, []
+			JobBoard.boards, JobBoard.orgs = True, orgs
+			JobBoard.region_boards, JobBoard.url_checker = region_boards, url_checker
+			for jobboard in in_queue:
+				jobboard.flag_opened = False
+				jobboard.open_websites(option_jobboardattr)
+			expected = [ident for _, ident in JobBoard.used_jobsites]
+			flags = [jobboard.flag_opened for jobboard in in_queue]
+			full_queue = JobBoard.is_queue_filtered(option_jobboardattr)
+
+			scheduler = WindowScheduler(full_queue= full_queue)
+			scheduler.update(job_queue, boards)
+			selected = scheduler.select(max_sites, lambda jobboard: jobboard.is_allowed(option_jobboardattr))
+			assert [jobboard.ident for jobboard in selected] == expected and expected
+
+			selection = select_boards(
+				arrays, max_sites, len(job_queue),
+				excluded= () if orgs else ('organization',),
+				region_boards= region_boards,
+				full_queue= full_queue,
+				is_allowed= lambda row: in_queue[row].is_allowed(option_jobboardattr),
+			)
+			assert arrays.ids[selection.opened].tolist() == expected
+			assert selection.flags.tolist() == flags
+			assert selection.sites_opened == JobBoard.sites_opened
+		JobBoard.url_opener.wait()
+	finally:
+		for attr, value in class_attrs.items():
+			setattr(JobBoard, attr, value)
+
+
+def test_knapsack_selection() -> None:
+	"""Tests select_boards_knapsack() opens the most urls within the url budget, & of those the most value, by brute force."""
+	print_test_header("Test knapsack selection")
+	import itertools
+	import numpy as np
+	rng = np.random.default_rng(0)
+	for trial in range(60):
+		num_boards = int(rng.integers(1, 25))
+		arrays = BoardArrays(
+			ids= np.arange(num_boards, dtype= np.int64) * 10,
+			Q_index= np.arange(num_boards, dtype= np.int64),
+			Q_priority= rng.integers(1, 5, num_boards),
+			num_urls= rng.integers(0, 6, num_boards),
+			jobboard= rng.random(num_boards) < 0.6,
+			organization= rng.random(num_boards) < 0.4,
+		)
+		max_sites = int(rng.integers(0, 12))
+		excluded = ('organization',) if trial % 3 == 0 else ()
+		region_boards = set(arrays.ids[::2].tolist()) if trial % 4 == 0 else None
+		full_queue = region_boards is not None
+		objective = OBJECTIVES[trial % len(OBJECTIVES)]
+		rejected = set(rng.choice(num_boards, num_boards // 5, replace= False).tolist())
+		is_allowed = lambda row: row not in rejected
+
+		selection = select_boards_knapsack(arrays, max_sites, num_boards, excluded, region_boards, full_queue, is_allowed, objective)
+		values = get_values(arrays, num_boards, full_queue, objective)
+		mask = get_candidates(arrays, num_boards, excluded, region_boards, full_queue)
+		rows = [row for row in np.flatnonzero(mask).tolist() if row not in rejected]
+		assert set(selection.opened.tolist()) <= set(rows)
+		assert selection.opened.tolist() == sorted(selection.opened.tolist())
+		assert selection.sites_opened == arrays.num_urls[selection.opened].sum() <= max_sites
+		assert selection.flags.sum() == len(selection.opened)
+
+		## Boards without urls are free; brute force the rest
+		free = [row for row in rows if arrays.num_urls[row] == 0]
+		paid = [row for row in rows if arrays.num_urls[row]][:13]
+		num_urls, value = max(
+			(arrays.num_urls[list(combo)].sum(), values[list(combo)].sum())
+			for num in range(len(paid) + 1) for combo in itertools.combinations(paid, num)
+			if arrays.num_urls[list(combo)].sum() <= max_sites
+		)
+		if len(rows) - len(free) <= 12:
+			assert selection.sites_opened == num_urls
+			assert abs(values[selection.opened].sum() - value - values[free].sum()) < 1e-9
+
+	## Fills the budget first-fit leaves unused
+	arrays = BoardArrays(
+		ids= np.arange(4, dtype= np.int64), Q_index= np.arange(4, dtype= np.int64), Q_priority= np.ones(4, dtype= np.int64),
+		num_urls= np.array([3, 4, 4, 5]), jobboard= np.ones(4, dtype= bool), organization= np.zeros(4, dtype= bool),
+	)
+	assert select_boards(arrays, 8, 4).sites_opened == 7
+	selection = select_boards_knapsack(arrays, 8, 4)
+	assert selection.sites_opened == 8 and selection.opened.tolist() == [1, 2]
+
+
+def test_heap_schedulers() -> None:
+	"""Tests stride & due schedulers: order, frequency by Q_priority, budget, deltas & persistence."""
+	print_test_header("Test heap schedulers")
+	import tempfile
+	from collections import Counter
+	from j_script import jobboard_list
+
+	def make_boards(Q_priorities, num_urls = {}):
+		ids = list(Q_priorities)
+		return jobboard_list.JobBoardRows({
+			constants.COL_ID: ids,
+			constants.COL_NAME: [f"board {ident}" for ident in ids],
+			constants.COL_URLS: [['url'] * num_urls.get(ident, 1) for ident in ids],
+			constants.COL_DESCRIPT: ['descript'] * len(ids),
+			constants.COL_QUEUE_PRIORITY: [Q_priorities[ident] for ident in ids],
+			constants.COL_JOBBOARD: [True] * len(ids),
+			constants.COL_ORG: [False] * len(ids),
+			constants.COL_LOCATIONS: [()] * len(ids),
+		})
+
+	## Interfaces can't be created without the methods policies define
+	for cls in (Scheduler, HeapScheduler):
+		try:
+			cls()
+		except TypeError:
+			pass
+		else:
+			raise Exception(f"Expected {cls.__name__} to be abstract")
+
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename_schedule = os.path.join(tmp_dir, 'schedule.pkl')
+
+		## Stride: new schedule follows the queue, then boards open in proportion to 1 / Q_priority
+		Q_priorities = {ident: 1 if ident < 4 else 2 for ident in range(8)}
+		boards = make_boards(Q_priorities)
+		job_queue = IndexedJobQueue(range(8))
+		scheduler = StrideScheduler.load(filename_schedule)
+		scheduler.update(job_queue, boards)
+		assert [jobboard.ident for jobboard in scheduler.select(3, lambda jobboard: True)] == [0, 1, 2]
+		assert sorted(boards.jobboards) == [0, 1, 2]		# only boards popped are created
+		opened = Counter()
+		for _ in range(60):
+			opened.update(jobboard.ident for jobboard in scheduler.select(3, lambda jobboard: True))
+		assert min(opened[ident] for ident in range(4)) > 1.8 * max(opened[ident] for ident in range(4, 8))
+
+		## Boards not allowed, or over the budget, keep their place
+		Q_priorities[8] = 1
+		boards = make_boards(Q_priorities, {8: 3})
+		scheduler.update(job_queue, boards, CatalogDelta(added= [8]))
+		selected = scheduler.select(2, lambda jobboard: jobboard.ident != 0)
+		assert len(selected) == 2 and 8 not in [jobboard.ident for jobboard in selected]
+
+		## Saved schedule selects the same boards
+		scheduler.save()
+		loaded = StrideScheduler.load(filename_schedule)
+		loaded_boards = make_boards(Q_priorities, {8: 3})
+		loaded.update(job_queue, loaded_boards, CatalogDelta())
+		assert [jobboard.ident for jobboard in loaded.select(4, lambda jobboard: True)] == \
+			[jobboard.ident for jobboard in scheduler.select(4, lambda jobboard: True)]
+		assert len(loaded_boards.jobboards) < len(loaded_boards)
+		assert DueScheduler.load(filename_schedule).entries == {}		# other policy's schedule
+		assert StrideScheduler().filename_schedule != DueScheduler().filename_schedule		# each keeps its own
+
+		## Later saves append changed entries to the journal
+		scheduler.save()
+		assert os.path.getsize(scheduler.filename_journal) > 0
+		loaded = StrideScheduler.load(filename_schedule)
+		assert (loaded.entries, loaded.clock, loaded.generation) == (scheduler.entries, scheduler.clock, 1)
+
+		## Removed & changed boards, from a delta
+		del Q_priorities[1]
+		Q_priorities[2] = 4
+		boards = make_boards(Q_priorities, {8: 3})
+		scheduler.update(job_queue, boards, CatalogDelta(changed= [2], removed= [1]))
+		assert 1 not in scheduler.entries and scheduler.entries[2][1] == 4
+
+		## A run without the schedule moves the catalog snapshot on, so the next delta doesn't cover its changes
+		filename_resync = os.path.join(tmp_dir, 'resync.pkl')
+		boards = make_boards({ident: 1 for ident in range(1, 7)})
+		scheduler = StrideScheduler.load(filename_resync)
+		scheduler.update(IndexedJobQueue(range(1, 7)), boards, CatalogDelta(base= 'k0', key= 'k1'))
+		scheduler.select(2, lambda jobboard: True)
+		scheduler.save()
+
+		boards = make_boards({1: 1, 2: 1, 3: 1, 4: 1, 6: 3, 200: 1})		# run without --scheduler, delta from k1 to k2
+		job_queue = IndexedJobQueue([1, 2, 3, 4, 6, 200])
+
+		loaded = StrideScheduler.load(filename_resync)
+		assert loaded.catalog_key == 'k1'
+		loaded.update(job_queue, boards, CatalogDelta(base= 'k2', key= 'k2'))		# snapshot current since
+		assert sorted(loaded.entries) == [1, 2, 3, 4, 6, 200] and loaded.entries[6][1] == 3
+		assert sorted(jobboard.ident for jobboard in loaded.select(20, lambda jobboard: True)) == [1, 2, 3, 4, 6, 200]
+		loaded.save()
+		assert StrideScheduler.load(filename_resync).catalog_key == 'k2'
+
+		## A delta from the synced catalog is applied as is
+		boards = make_boards({1: 2, 2: 1, 3: 1, 4: 1, 6: 2, 200: 1})
+		loaded.update(job_queue, boards, CatalogDelta(changed= [6], base= 'k2', key= 'k3'))
+		assert loaded.entries[6][1] == 2 and loaded.entries[1][1] == 1
+
+		## Due: only due boards open; opened boards are due Q_priority intervals later
+		now = [1000.0]
+		boards = make_boards({0: 1, 1: 1, 2: 2, 3: 2})
+		scheduler = DueScheduler(filename_schedule, interval= 10.0, now= lambda: now[0])
+		scheduler.update(IndexedJobQueue([0, 2, 1, 3]), boards)
+		assert [jobboard.ident for jobboard in scheduler.select(10, lambda jobboard: True)] == [0, 1, 2]	# 3 is outside the window
+		assert scheduler.select(10, lambda jobboard: True) == []
+		now[0] += 10.0
+		assert [jobboard.ident for jobboard in scheduler.select(10, lambda jobboard: True)] == [3, 0, 1]
+		now[0] += 10.0
+		assert [jobboard.ident for jobboard in scheduler.select(10, lambda jobboard: True)] == [0, 1, 2]	# 3 was opened later
+
+
+##########
+# Test SQLite store
+##########
+
+def test_sqlite_store() -> None:
+	"""Tests incremental import, region lookup, selection & moving boards to the back."""
+	print_test_header("Test SQLite store")
+	location_table = LocationTable([('United States', 'California', None), ('United Kingdom', None, 'London')])
+	columns = {
+		constants.COL_ID: [1, 2, 3, 4],
+		constants.COL_NAME: [' board one', 'board two', 'board three', 'board four'],
+		constants.COL_DESCRIPT: ['one', 'two', 'three', 'four'],
+		constants.COL_QUEUE_PRIORITY: [1, 1, 1, 1],
+		constants.COL_JOBBOARD: [True, False, True, True],
+		constants.COL_ORG: [False, True, False, False],
+		constants.COL_URLS: [['a', 'b'], ['c'], ['d', 'e', 'f'], ['g']],
+		constants.COL_LOCATIONS: [(0,), (), (0, 1), (1,)],
+	}
+	key = (1, 2, 'hash')
+	with SQLiteStore(':memory:') as store:
+		assert store.import_columns(columns, location_table, key, saved_queue= [3, 9, 1]) == (4, 0, 0)
+		assert store.get_queue() == [3, 1, 2, 4]
+		assert store.is_current(key)
+
+		columns[constants.COL_DESCRIPT] = ['one', 'two', 'three jobs', 'four']
+		columns = {col: vals[:3] for col, vals in columns.items()}
+		assert store.import_columns(columns, location_table, key) == (0, 1, 1)
+		assert store.get_queue() == [3, 1, 2]
+
+		assert store.get_region_boards('california') == {1, 3}
+		assert store.get_region_boards('United Kingdom/') == {3}
+
+		## Board 3 doesn't fit after board 1's urls; board 2 is skipped without orgs.
+		selected = store.select_boards_to_open(4, {'boards': True, 'orgs': True})
+		assert [(ident, Q_index, urls) for ident, _, Q_index, urls in selected] == [(3, 0, ['d', 'e', 'f']), (2, 2, ['c'])]
+		selected = store.select_boards_to_open(4, {'boards': True, 'orgs': False})
+		assert [ident for ident, *_ in selected] == [3]
+
+		store.move_to_back([3, 2])
+		assert store.get_queue() == [1, 3, 2]
+
+
+##########
+# Test markdown table
+##########
+
+def test_markdown_table() -> None:
+	"""Tests MarkdownTable writes the same file as TableInfo, patching rows where it can."""
+	print_test_header("Test markdown table")
+	import tempfile
+	from j_script.tableinfo import TableInfo
+	keys = ('name', 'url_nums', 'description')
+
+	def write_tableinfo(rows, filename):
+		tbl_md = TableInfo(keys)
+		for ident in sorted(rows, key= lambda ident: (rows[ident][0], ident)):
+			tbl_md.add_entry(rows[ident])
+		tbl_md.print_info(markdown= True, md_filename= filename)
+		with open(filename, 'rb') as f:
+			return f.read()
+
+	rows = {ident: (f"Board {ident}", f"[1](url{ident})", f"jobs at board {ident}") for ident in range(20)}
+	changes = (
+		('rewritten', lambda: None),
+		('unchanged', lambda: None),
+		('patched', lambda: rows.update({3: ('Board 3', '[1](url3)', 'jobs at board x')})),	# same width
+		('patched', lambda: rows.update({20: ('Board 0a', '[1](url20)', 'new board')})),		# shifts rows
+		('patched', lambda: rows.pop(5)),
+		('rewritten', lambda: rows.update({7: ('Board 7', '[1](url7)', 'a much longer description')})),
+	)
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename_md = os.path.join(tmp_dir, 'Jobboards.md')
+		for result, change in changes:
+			change()
+			md_table = MarkdownTable.load(keys, filename_md)
+			md_table.update(rows.items())
+			assert md_table.write() == result
+			with open(filename_md, 'rb') as f:
+				assert f.read() == write_tableinfo(rows, os.path.join(tmp_dir, 'tableinfo.md'))
+
+		## Edited by something else
+		with open(filename_md, 'a') as f:
+			f.write('edit')
+		assert MarkdownTable.load(keys, filename_md).write() == 'rewritten'
+
+
+##########
+# Test url opener
+##########
+
+def test_url_opener() -> None:
+	"""Tests UrlOpener bounds concurrency, spaces launches in order, & reports failures."""
+	print_test_header("Test url opener")
+	import threading
+	import time
+	lock = threading.Lock()
+	running, max_running, opened = [0], [0], []
+
+	def fake_open(url):
+		with lock:
+			running[0] += 1
+			max_running[0] = max(max_running[0], running[0])
+		time.sleep(0.02)
+		with lock:
+			running[0] -= 1
+			opened.append(url)
+		if url == 'error':
+			raise OSError("no browser")
+		return url != 'refused'
+
+	urls = ['a', 'b', 'error', 'c', 'refused', 'd']
+	spacing = 0.01
+	with UrlOpener(max_workers= 2, spacing= spacing, open_url= fake_open) as url_opener:
+		for url in urls:
+			url_opener.submit(url)
+	report = url_opener.report
+
+	assert sorted(opened) == sorted(urls)
+	assert max_running[0] <= 2
+	first = report.results[0].submitted
+	for i, result in enumerate(report.results):
+		assert result.started >= first + i * spacing - 1e-3
+	assert [(result.url, result.error) for result in report.errors] == [('error', 'OSError: no browser'), ('refused', 'not opened')]
+	assert report.wall_time >= (len(urls) - 1) * spacing
+
+
+def test_launchpad() -> None:
+	"""Tests Launchpad writes one escaped page of the jobboards & opens it once."""
+	print_test_header("Test launchpad")
+	import tempfile
+	opened = []
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		filename = os.path.join(tmp_dir, 'launchpad.html')
+		with Launchpad(filename, auto_open= True, open_url= opened.append) as launchpad:
+			launchpad.submit_jobboard('Board <One>', ['https://one.com/?a=1&b=2', 'https://one.com/2'], 'jobs & more')
+			launchpad.submit_jobboard('Board Two', ['https://two.com/</script>'])
+		with open(filename, encoding= 'utf-8') as f:
+			page = f.read()
+
+	assert len(opened) == 1 and opened[0].startswith('file:')
+	assert 'Board &lt;One&gt;' in page and 'jobs &amp; more' in page
+	assert 'href="https://one.com/?a=1&amp;b=2"' in page
+	assert '</script>"' not in page
+	assert 'Open all 3 sites' in page and 'addEventListener("load", openAll)' in page
+	assert 'window.open(url, "_blank")' in page and 'tab.opener = null' in page		# "noopener" returns null
+	assert Launchpad(filename, open_url= opened.append).wait().results == []		# nothing submitted
+
+
+def test_url_checker() -> None:
+	"""Tests UrlChecker against a local server: statuses, HEAD fallback, keep-alive, host limit, timeout & TTL cache."""
+	print_test_header("Test url checker")
+	import socket
+	import tempfile
+	import threading
+	import time
+	from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+	lock = threading.Lock()
+	running, max_running, ports = [0], [0], set()
+
+	class Handler(BaseHTTPRequestHandler):
+		protocol_version = 'HTTP/1.1'		# keep-alive
+
+		def respond(self, status, headers = ()):
+			with lock:
+				running[0] += 1
+				max_running[0] = max(max_running[0], running[0])
+				ports.add(self.client_address[1])
+			time.sleep(0.01)
+			if self.path == '/slow':
+				time.sleep(0.5)
+			self.send_response(status)
+			for header in headers:
+				self.send_header(*header)
+			self.send_header('Content-Length', '0')
+			self.end_headers()
+			with lock:
+				running[0] -= 1
+
+		def do_HEAD(self):
+			routes = {'/gone': (404,), '/moved': (301, [('Location', '/ok')]), '/no-head': (405,)}
+			self.respond(*routes.get(self.path.split('?')[0], (200,)))
+
+		def do_GET(self):
+			self.respond(200)
+
+		def log_message(self, *args):
+			pass
+
+	with socket.socket() as sock:		# port nothing listens on
+		sock.bind(('127.0.0.1', 0))
+		closed_port = sock.getsockname()[1]
+	server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+	threading.Thread(target= server.serve_forever, daemon= True).start()
+	base = f"http://127.0.0.1:{server.server_address[1]}"
+	try:
+		with tempfile.TemporaryDirectory() as tmp_dir:
+			filename_cache = os.path.join(tmp_dir, 'url_cache.pkl')
+			url_checker = UrlChecker(per_host= 2, timeout= 0.25, filename_cache= filename_cache)
+			urls = [f"{base}/ok?{i}" for i in range(10)] + [
+				f"{base}/gone", f"{base}/moved", f"{base}/no-head", f"{base}/slow",
+				f"http://127.0.0.1:{closed_port}/", "ftp://example.com/",
+			]
+			report = url_checker.check(urls + urls[:3])
+			statuses = {status.url: status for status in report.statuses}
+
+			assert [status.url for status in report.statuses] == urls and report.num_probed == len(urls)
+			assert all(statuses[url].status == 200 and statuses[url].alive for url in urls[:10])
+			assert statuses[f"{base}/gone"].status == 404 and statuses[f"{base}/gone"].dead
+			assert statuses[f"{base}/moved"].status == 301 and statuses[f"{base}/moved"].location == '/ok'
+			assert statuses[f"{base}/no-head"].status == 200
+			assert statuses[f"{base}/slow"].error == UrlChecker.ERROR_TIMEOUT and not statuses[f"{base}/slow"].dead
+			assert statuses[f"http://127.0.0.1:{closed_port}/"].dead
+			assert statuses["ftp://example.com/"].error == UrlChecker.ERROR_SCHEME
+			assert max_running[0] <= 2
+			assert len(ports) < len(urls)		# connections were reused
+
+			## Cache: fresh results aren't probed again, & are loaded by a new checker
+			assert url_checker.check(urls).num_probed == 0
+			url_checker = UrlChecker(filename_cache= filename_cache)
+			assert url_checker.is_dead([f"{base}/gone", f"http://127.0.0.1:{closed_port}/"])
+			assert not url_checker.is_dead([f"{base}/gone", f"{base}/ok?0"])
+			assert not url_checker.is_dead([f"{base}/gone", f"{base}/unchecked"])
+			assert not url_checker.is_dead([])
+
+			## TTL: expired results aren't used, & are probed again
+			url_checker = UrlChecker(ttl= 0.0, filename_cache= filename_cache)
+			assert not url_checker.is_dead([f"{base}/gone"])
+			assert url_checker.check([f"{base}/gone"]).num_probed == 1
+	finally:
+		server.shutdown()
+		server.server_close()
+
+
+def test_stale_connections() -> None:
+	"""Tests send_request retries a stale reused connection once, on a fresh connection, then raises."""
+	print_test_header("Test stale connections")
+	import asyncio
+	from j_script.url_checker import REQUEST_ERRORS, send_request
+
+	class StaleReader(object):
+		async def readuntil(self, separator):
+			raise asyncio.IncompleteReadError(b'', None)
+
+	class StaleWriter(object):
+		def write(self, data):
+			pass
+
+		async def drain(self):
+			pass
+
+		def close(self):
+			pass
+
+	class StalePool(object):
+		"""Every connection it hands out was already closed by the server."""
+		def __init__(self, reused):
+			self.reused, self.fresh = reused, []
+
+		async def acquire(self, key, fresh = False):
+			self.fresh.append(fresh)
+			return StaleReader(), StaleWriter(), self.reused and not fresh
+
+	for reused, tries in ((True, [False, True]), (False, [False])):
+		pool = StalePool(reused)
+		try:
+			asyncio.run(send_request(pool, ('http', 'example.com', 80), 'HEAD', 'example.com', '/'))
+		except REQUEST_ERRORS as e:
+			assert isinstance(e, asyncio.IncompleteReadError)
+		else:
+			raise AssertionError("stale connection didn't raise")
+		assert pool.fresh == tries
+
+
+def test_page_watcher() -> None:
+	"""Tests PageWatcher against a local server: conditional GETs, digests, redirects, chunked bodies & visits."""
+	print_test_header("Test page watcher")
+	import tempfile
+	import threading
+	from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+	version, conditions = [1], []
+	last_modified = 'Wed, 01 Jan 2025 00:00:00 GMT'
+
+	class Handler(BaseHTTPRequestHandler):
+		protocol_version = 'HTTP/1.1'
+
+		def respond(self, status, body = b'', headers = ()):
+			self.send_response(status)
+			for header in headers:
+				self.send_header(*header)
+			if self.path == '/chunked':
+				self.send_header('Transfer-Encoding', 'chunked')
+				self.end_headers()
+				for chunk in (body[:5], body[5:], b''):
+					self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+				return
+			self.send_header('Content-Length', str(len(body)))
+			self.end_headers()
+			self.wfile.write(body)
+
+		def do_GET(self):
+			body = f"<html>jobs v{version[0]} at {self.path}</html>".encode()
+			if self.path == '/etag':
+				etag = f'"v{version[0]}"'
+				conditions.append(self.headers.get('If-None-Match'))
+				if self.headers.get('If-None-Match') == etag:
+					return self.respond(304)
+				return self.respond(200, body, [('ETag', etag)])
+			elif self.path == '/last-modified':
+				if self.headers.get('If-Modified-Since') == last_modified:
+					return self.respond(304)
+				return self.respond(200, b'static page', [('Last-Modified', last_modified)])
+			elif self.path == '/redirect':
+				return self.respond(302, headers= [('Location', '/plain')])
+			elif self.path == '/error':
+				return self.respond(500)
+			self.respond(200, body)
+
+		def log_message(self, *args):
+			pass
+
+	server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+	threading.Thread(target= server.serve_forever, daemon= True).start()
+	base = f"http://127.0.0.1:{server.server_address[1]}"
+	urls = [f"{base}{path}" for path in ('/etag', '/last-modified', '/plain', '/chunked', '/redirect')]
+	try:
+		with tempfile.TemporaryDirectory() as tmp_dir:
+			filename_states = os.path.join(tmp_dir, 'page_states.pkl')
+			page_watcher = PageWatcher(per_host= 2, filename_states= filename_states)
+			report = page_watcher.fetch(urls + [f"{base}/error"])
+			assert report.outcomes == {'changed': 5, 'failed': 1}
+			assert page_watcher.get_states()[f"{base}/error"].error == 'status 500'
+			assert all(page_watcher.has_changed([url]) for url in urls)		# never opened
+
+			## Opened pages are unchanged until their content changes
+			page_watcher.mark_visited(urls + [f"{base}/error"])
+			page_watcher.save()
+			page_watcher = PageWatcher(filename_states= filename_states)
+			assert not page_watcher.has_changed(urls)
+			assert page_watcher.has_changed([f"{base}/error"]) and page_watcher.has_changed([f"{base}/new"])
+
+			report = page_watcher.fetch(urls)
+			assert report.outcomes == {'not modified': 2, 'same': 3}
+			assert conditions[-1] == '"v1"'
+			assert not page_watcher.has_changed(urls)
+
+			version[0] = 2
+			report = page_watcher.fetch(urls)
+			assert report.outcomes == {'not modified': 1, 'changed': 4}
+			assert page_watcher.has_changed([f"{base}/etag"]) and page_watcher.has_changed(urls[-2:])
+			assert not page_watcher.has_changed([f"{base}/last-modified"])
+	finally:
+		server.shutdown()
+		server.server_close()
+
+
+def print_test_header(text: str):
+	header = '#' * 10
+	spacing = '\n'
+	print(spacing, header,spacing, header[0], text,spacing, header, spacing)
+
+
+##########
+# Main
+##########
+
+def main():
+	test_xlsx_reader()
+	test_get_columns_jobboards()
+	test_catalog_delta()
+	test_snapshot_tags()
+	test_interrupted_run()
+	test_get_location_codes()
+	test_location_code_col()
+	test_geo_index()
+	test_indexed_job_queue()
+	test_queue_journal()
+	test_queue_file()
+	test_reconcile_queue()
+	test_clean_queue_delta()
+	test_lazy_jobboard()
+	test_stream_jobboards()
+	test_window_selection()
+	test_knapsack_selection()
+	test_heap_schedulers()
+	test_sqlite_store()
+	test_markdown_table()
+	test_url_opener()
+	test_launchpad()
+	test_url_checker()
+	test_stale_connections()
+	test_page_watcher()
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,475 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 18:41:27
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Asyncio url liveness checker with a TTL result cache.
+
+    Urls are probed with HEAD, or GET if the server doesn't allow HEAD, over
+    HTTP/1.1 keep-alive connections pooled per host. A global & a per-host
+    semaphore bound open connections, and each probe has a timeout. Results
+    are cached on disk, & a url is only probed again once its result is
+    older than the TTL.
+
+    A url is dead if its host doesn't resolve, refuses connections, or
+    answers 404/410. Timeouts & other errors are unknown, so only urls known
+    to be gone are skipped.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import asyncio
+import os
+import socket
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+from urllib.parse import urlsplit
+
+from . import constants
+from .script_objects import Any, Dict, List, Tuple, Union
+
+
+##########
+# Url Status
+##########
+
+@dataclass
+class UrlStatus(object):
+    """Result of probing a url.
+
+    Args:
+        url (str): url probed
+        checked_at (float): time.time() of the probe
+        status (Union[int, None]): HTTP status, None if there was no response
+        error (Union[str, None]): one of UrlChecker's ERROR_ kinds, if there was no response
+        location (Union[str, None]): redirect target
+    """
+    url: str
+    checked_at: float
+    status: Union[int, None] = None
+    error: Union[str, None] = None
+    location: Union[str, None] = None
+
+    @property
+    def dead(self) -> bool:
+        return self.status in UrlChecker.dead_statuses or self.error in UrlChecker.dead_errors
+
+    @property
+    def alive(self) -> bool:
+        return self.status is not None and not self.dead
+
+
+@dataclass
+class CheckReport(object):
+    """Summary of a UrlChecker.check() call."""
+    statuses: List[UrlStatus]
+    num_probed: int
+    wall_time: float
+
+    def __str__(self) -> str:
+        alive = sum(status.alive for status in self.statuses)
+        dead = sum(status.dead for status in self.statuses)
+        rate = self.num_probed / self.wall_time if self.wall_time else 0.0
+        return (
+            f"Checked {self.num_probed} of {len(self.statuses)} urls in {self.wall_time:.2f}s ({rate:.0f} urls/s): "
+            f"{alive} alive, {dead} dead, {len(self.statuses) - alive - dead} unknown"
+        )
+
+
+##########
+# Connection Pool
+##########
+
+class ConnectionPool(object):
+    """Idle keep-alive connections, by (scheme, host, port)."""
+
+    def __init__(self, ssl_context: ssl.SSLContext = None):
+        self.idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self.ssl_context = ssl_context
+        self.num_opened = 0
+        return None
+
+
+    async def acquire(self, key: Tuple[str, str, int], fresh: bool = False) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """Returns an idle connection to key, or opens one. The bool is True if the connection was reused.
+
+        Args:
+            key (Tuple[str, str, int]): (scheme, host, port)
+            fresh (bool, optional): open a new connection, skipping idle ones. Defaults to False.
+        """
+        idle = None if fresh else self.idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        scheme, host, port = key
+        if scheme == 'https':
+            if self.ssl_context is None:
+                self.ssl_context = ssl.create_default_context()
+            reader, writer = await asyncio.open_connection(host, port, ssl= self.ssl_context, server_hostname= host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        self.num_opened += 1
+        return reader, writer, False
+
+
+    def release(self, key: Tuple[str, str, int], reader: asyncio.StreamReader, writer: asyncio.StreamWriter, reusable: bool) -> None:
+        """Returns connection to the pool if reusable, else closes it."""
+        if reusable and not writer.is_closing():
+            self.idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+        return None
+
+
+    def close(self) -> None:
+        """Closes idle connections."""
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle = {}
+        return None
+
+
+##########
+# HTTP
+##########
+
+USER_AGENT = 'jobboard-visitor-url-checker/1.0'
+MAX_HEADER_SIZE = 1 << 16
+
+
+def get_key(url: str) -> Tuple[Tuple[str, str, int], str, str]:
+    """Returns pool key (scheme, host, port), Host header & request target of url.
+
+    Raises:
+        ValueError: url isn't http(s), or has no host or an invalid port
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError(f"not an http(s) url: {url}")
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+    return (parts.scheme, parts.hostname, port), parts.netloc, target
+
+
+async def send_request(
+    pool: ConnectionPool,
+    key: Tuple[str, str, int],
+    method: str,
+    netloc: str,
+    target: str,
+    headers: Dict[str, str] = None,
+    max_body: int = None,
+    ) -> Tuple[int, Dict[str, str], Union[bytes, None]]:
+    """Sends one request on a pooled connection & reads the response.
+
+    A reused connection the server already closed is retried once on a new connection.
+    The connection returns to the pool if the whole response was read.
+
+    Args:
+        pool (ConnectionPool): connections
+        key (Tuple[str, str, int]): (scheme, host, port)
+        method (str): HTTP method
+        netloc (str): Host header
+        target (str): path & query
+        headers (Dict[str, str], optional): extra request headers. Defaults to None.
+        max_body (int, optional): bytes of body to read. Defaults to None, which doesn't read the body.
+
+    Returns:
+        Tuple[int, Dict[str, str], Union[bytes, None]]: status, headers with lowercase names, & body
+    """
+    request = (
+        f"{method} {target} HTTP/1.1\r\n"
+        f"Host: {netloc}\r\n"
+        f"User-Agent: {USER_AGENT}\r\n"
+        "Accept: */*\r\n"
+        + ''.join(f"{name}: {value}\r\n" for name, value in (headers or {}).items()) +
+        "Connection: keep-alive\r\n\r\n"
+    ).encode('latin-1', errors= 'replace')
+
+    for fresh in (False, True):
+        reader, writer, reused = await pool.acquire(key, fresh= fresh)
+        try:
+            writer.write(request)
+            await writer.drain()
+            head = await reader.readuntil(b'\r\n\r\n')
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            if reused and not fresh:
+                continue
+            raise
+        except BaseException:
+            writer.close()
+            raise
+        break
+
+    try:
+        if len(head) > MAX_HEADER_SIZE:
+            raise ValueError("response head too large")
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        version, status = status_line.split(' ', 2)[:2]
+        status = int(status)
+        response_headers = {}
+        for line in header_lines:
+            name, sep, value = line.partition(':')
+            if sep:
+                response_headers[name.strip().lower()] = value.strip()
+
+        if method == 'HEAD' or status < 200 or status in (204, 304):
+            body, complete = b'', True
+        elif max_body is None:
+            body, complete = None, False
+        else:
+            body, complete = await read_body(reader, response_headers, max_body)
+    except BaseException:
+        writer.close()
+        raise
+
+    reusable = complete and version == 'HTTP/1.1' and response_headers.get('connection', '').lower() != 'close'
+    pool.release(key, reader, writer, reusable)
+    return status, response_headers, body
+
+
+async def read_body(reader: asyncio.StreamReader, headers: Dict[str, str], max_body: int) -> Tuple[bytes, bool]:
+    """Returns up to max_body bytes of the response body, & True if the whole body was read."""
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        chunks, size = [], 0
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            chunk_size = int(line.split(b';', 1)[0].strip(), 16)
+            if chunk_size == 0:
+                while await reader.readuntil(b'\r\n') != b'\r\n':     # trailers
+                    pass
+                return b''.join(chunks), True
+            if size + chunk_size > max_body:
+                chunks.append(await reader.readexactly(max_body - size))
+                return b''.join(chunks), False
+            chunks.append(await reader.readexactly(chunk_size))
+            await reader.readexactly(2)
+            size += chunk_size
+
+    length = headers.get('content-length')
+    if length is not None:
+        length = int(length)
+        return await reader.readexactly(min(length, max_body)), length <= max_body
+
+    chunks, size = [], 0        # body ends when the server closes the connection
+    while size < max_body:
+        chunk = await reader.read(min(1 << 16, max_body - size))
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b''.join(chunks), False
+
+
+async def gather_by_host(urls: List[str], fetch: Callable, max_connections: int, per_host: int) -> List[Any]:
+    """Returns fetch(url, pool) of each url, run concurrently on a shared connection pool.
+
+    Args:
+        urls (List[str]): urls to fetch
+        fetch (Callable): coroutine function of (url, pool)
+        max_connections (int): concurrent fetches
+        per_host (int): concurrent fetches per host
+
+    Returns:
+        List[Any]: results, in the order of urls
+    """
+    pool = ConnectionPool()
+    connections = asyncio.Semaphore(max_connections)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def fetch_limited(url: str) -> Any:
+        host = urlsplit(url).netloc.lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+        async with host_limit, connections:
+            return await fetch(url, pool)
+
+    try:
+        return await asyncio.gather(*(fetch_limited(url) for url in urls))
+    finally:
+        pool.close()
+
+
+REQUEST_ERRORS = (asyncio.TimeoutError, OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError)
+
+
+def get_error_kind(e: BaseException) -> str:
+    """Returns UrlChecker error kind of an exception in REQUEST_ERRORS."""
+    if isinstance(e, asyncio.TimeoutError):
+        return UrlChecker.ERROR_TIMEOUT
+    elif isinstance(e, socket.gaierror):
+        return UrlChecker.ERROR_DNS
+    elif isinstance(e, ConnectionRefusedError):
+        return UrlChecker.ERROR_REFUSED
+    elif isinstance(e, ssl.SSLError):
+        return UrlChecker.ERROR_SSL
+    return UrlChecker.ERROR_PROTOCOL
+
+
+##########
+# Url Checker
+##########
+
+class UrlChecker(object):
+    """Probes urls & caches their status.
+
+    Args:
+        max_connections (int, optional): open connections. Defaults to constants.URL_CHECK_CONNECTIONS.
+        per_host (int, optional): open connections per host. Defaults to constants.URL_CHECK_PER_HOST.
+        timeout (float, optional): seconds per probe. Defaults to constants.URL_CHECK_TIMEOUT.
+        ttl (float, optional): seconds a result is cached. Defaults to constants.URL_CACHE_TTL.
+        filename_cache (str, optional): cache file. Defaults to constants.FILENAME_URL_CACHE.
+    """
+
+    ##########
+    # Constants
+    ##########
+    version = 1
+    dead_statuses = frozenset((404, 410))
+    head_not_allowed = frozenset((405, 501))
+
+    ERROR_DNS = 'dns'
+    ERROR_REFUSED = 'refused'
+    ERROR_TIMEOUT = 'timeout'
+    ERROR_SSL = 'ssl'
+    ERROR_PROTOCOL = 'protocol'
+    ERROR_SCHEME = 'scheme'
+    dead_errors = frozenset((ERROR_DNS, ERROR_REFUSED))
+
+
+    def __init__(
+        self,
+        max_connections: int = None,
+        per_host: int = None,
+        timeout: float = None,
+        ttl: float = None,
+        filename_cache: str = None,
+        ):
+        self.max_connections = max_connections or constants.URL_CHECK_CONNECTIONS
+        self.per_host = per_host or constants.URL_CHECK_PER_HOST
+        self.timeout = timeout or constants.URL_CHECK_TIMEOUT
+        self.ttl = constants.URL_CACHE_TTL if ttl is None else ttl
+        self.filename_cache = filename_cache or constants.FILENAME_URL_CACHE
+        self.cache: Union[Dict[str, UrlStatus], None] = None      # loaded on first use
+        return None
+
+
+    ##########
+    # Cache
+    ##########
+    def get_cache(self) -> Dict[str, UrlStatus]:
+        """Returns cached statuses, loading the cache file on first use."""
+        if self.cache is None:
+            import pickle
+            self.cache = {}
+            try:
+                with open(self.filename_cache, 'rb') as f:
+                    version, cache = pickle.load(f)
+                if version == UrlChecker.version:
+                    self.cache = cache
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+                pass
+        return self.cache
+
+
+    def save_cache(self) -> None:
+        """Saves statuses to the cache file, dropping expired ones."""
+        import pickle
+        now = time.time()
+        cache = {url: status for url, status in self.get_cache().items() if now - status.checked_at < self.ttl}
+        filename_tmp = self.filename_cache + '.tmp'
+        try:
+            with open(filename_tmp, 'wb') as f:
+                pickle.dump((UrlChecker.version, cache), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(filename_tmp, self.filename_cache)
+        except OSError as e:
+            print(f"- Could not save url cache ({e})")
+        return
+
+
+    def get_cached(self, url: str) -> Union[UrlStatus, None]:
+        """Returns status of url if checked within the TTL, else None."""
+        status = self.get_cache().get(url)
+        if status is None or time.time() - status.checked_at >= self.ttl:
+            return None
+        return status
+
+
+    def is_dead(self, urls: List[str]) -> bool:
+        """Returns True if every url is known to be dead. Urls without a cached status aren't."""
+        if not urls:
+            return False
+        for url in urls:
+            status = self.get_cached(url)
+            if status is None or not status.dead:
+                return False
+        return True
+
+
+    ##########
+    # Check
+    ##########
+    def check(self, urls: Iterable[str], use_cache: bool = True) -> CheckReport:
+        """Probes urls without a cached status, & saves their results to the cache.
+        Results aren't cached if no url responded, as the network is likely down.
+
+        Args:
+            urls (Iterable[str]): urls to check. Repeated urls are probed once.
+            use_cache (bool, optional): skip urls checked within the TTL. Defaults to True.
+
+        Returns:
+            CheckReport: status of every url, in the order given
+        """
+        urls = list(dict.fromkeys(urls))
+        to_probe = [url for url in urls if not use_cache or self.get_cached(url) is None]
+
+        start = time.perf_counter()
+        probed = {status.url: status for status in asyncio.run(self.probe_all(to_probe))} if to_probe else {}
+        wall_time = time.perf_counter() - start
+
+        if any(status.status is not None for status in probed.values()):
+            self.get_cache().update(probed)
+            self.save_cache()
+        elif probed:        # offline: every host would look dead
+            print("- No url responded, url statuses weren't cached")
+        statuses = [probed[url] if url in probed else self.get_cache()[url] for url in urls]
+        return CheckReport(statuses, len(to_probe), wall_time)
+
+
+    async def probe_all(self, urls: List[str]) -> List[UrlStatus]:
+        """Returns status of each url, probed concurrently."""
+        return await gather_by_host(urls, self.probe, self.max_connections, self.per_host)
+
+
+    async def probe(self, url: str, pool: ConnectionPool) -> UrlStatus:
+        """Returns status of url: HEAD, then GET if HEAD isn't allowed."""
+        checked_at = time.time()
+        try:
+            key, netloc, target = get_key(url)
+        except ValueError:
+            return UrlStatus(url, checked_at, error= UrlChecker.ERROR_SCHEME)
+
+        try:
+            status, location = await asyncio.wait_for(self.request(pool, key, netloc, target), self.timeout)
+        except REQUEST_ERRORS as e:
+            return UrlStatus(url, checked_at, error= get_error_kind(e))
+        return UrlStatus(url, checked_at, status= status, location= location)
+
+
+    async def request(self, pool: ConnectionPool, key: Tuple[str, str, int], netloc: str, target: str) -> Tuple[int, Union[str, None]]:
+        """Returns (status, redirect location) of HEAD target, or of GET if HEAD isn't allowed."""
+        status, headers, _ = await send_request(pool, key, 'HEAD', netloc, target)
+        if status in UrlChecker.head_not_allowed:
+            status, headers, _ = await send_request(pool, key, 'GET', netloc, target)
+        return status, headers.get('location')
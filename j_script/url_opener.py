@@ -0,0 +1,176 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 18:02:17
+ * @modify date 2026-10-18 22:02:10
+ * @desc [
+    Opens urls on a bounded thread pool.
+
+    webbrowser.open() can block while it starts a browser process, so urls
+    are handed to worker threads instead of being opened one after another.
+    Each url gets a launch slot when it's submitted, at least `spacing`
+    seconds after the previous one, so tabs open in queue order & the
+    browser isn't flooded while it starts.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from . import constants
+from .script_objects import Any, List, Union
+
+
+##########
+# Report
+##########
+
+@dataclass
+class OpenResult(object):
+    """Timing of one url.
+
+    Args:
+        url (str): url opened
+        submitted (float): perf_counter() when submitted
+        started (float): perf_counter() when the opener was called
+        finished (float): perf_counter() when the opener returned
+        error (Union[str, None]): exception, or "not opened" if the opener returned False
+    """
+    url: str
+    submitted: float
+    started: float = 0.0
+    finished: float = 0.0
+    error: Union[str, None] = None
+
+    @property
+    def latency(self) -> float:
+        """Seconds the opener took."""
+        return self.finished - self.started
+
+
+@dataclass
+class OpenReport(object):
+    """Timing report of the urls opened by a UrlOpener."""
+    results: List[OpenResult] = field(default_factory= list)
+    wall_time: float = 0.0
+
+    @property
+    def errors(self) -> List[OpenResult]:
+        return [result for result in self.results if result.error is not None]
+
+    def __str__(self) -> str:
+        if not self.results:
+            return "Opened 0 urls"
+        latencies = [result.latency for result in self.results]
+        text = (
+            f"Opened {len(self.results) - len(self.errors)}/{len(self.results)} urls in {self.wall_time:.2f}s"
+            f" (launch: mean {sum(latencies) / len(latencies):.2f}s, max {max(latencies):.2f}s)"
+        )
+        for result in self.errors:
+            text += f"\n\t- {result.url}: {result.error}"
+        return text
+
+
+##########
+# Url Opener
+##########
+
+class UrlOpener(object):
+    """Opens urls on a thread pool, spacing their launches.
+
+    Args:
+        max_workers (int, optional): threads opening urls. Defaults to constants.OPEN_WORKERS.
+        spacing (float, optional): minimum seconds between launches. Defaults to constants.OPEN_SPACING.
+        open_url (Callable[[str], Any], optional): opens a url; returning False counts as a
+            failure. Defaults to webbrowser.open.
+    """
+
+    def __init__(self, max_workers: int = None, spacing: float = None, open_url: Callable[[str], Any] = None):
+        self.max_workers = max(1, max_workers or constants.OPEN_WORKERS)
+        self.spacing = constants.OPEN_SPACING if spacing is None else max(0.0, spacing)
+        self.open_url = open_url
+        self.executor = None
+        self.futures = []
+        self.report = OpenReport()
+        self.start_time = None
+        self.next_launch = 0.0
+        self.lock = threading.Lock()
+        return None
+
+
+    def __enter__(self) -> 'UrlOpener':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.wait()
+        return None
+
+
+    ##########
+    # Open
+    ##########
+    def submit(self, url: str) -> None:
+        """Schedules url to be opened in its launch slot."""
+        now = time.perf_counter()
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers= self.max_workers, thread_name_prefix= 'url_opener')
+            self.start_time = now
+            self.next_launch = now
+
+        with self.lock:
+            launch = max(now, self.next_launch)
+            self.next_launch = launch + self.spacing
+
+        result = OpenResult(url, submitted= now)
+        self.report.results.append(result)
+        self.futures.append(self.executor.submit(self.open, result, launch))
+        return None
+
+
+    def submit_jobboard(self, name: str, urls: List[str], description: str = None) -> None:
+        """Schedules urls of a jobboard to be opened. name & description are for openers that show them."""
+        for url in urls:
+            self.submit(url)
+        return None
+
+
+    def open(self, result: OpenResult, launch: float) -> None:
+        """Waits for the launch slot, then opens the url. Runs on a worker thread."""
+        delay = launch - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        result.started = time.perf_counter()
+        try:
+            if self.open_url is None:
+                import webbrowser
+                opened = webbrowser.open(result.url)
+            else:
+                opened = self.open_url(result.url)
+            if opened is False:
+                result.error = "not opened"
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.finished = time.perf_counter()
+        return None
+
+
+    def wait(self) -> OpenReport:
+        """Waits for submitted urls to open & returns the timing report."""
+        if self.executor is not None:
+            for future in self.futures:
+                future.result()
+            self.executor.shutdown()
+            self.report.wall_time = time.perf_counter() - self.start_time
+            self.executor = None
+            self.futures = []
+        return self.report
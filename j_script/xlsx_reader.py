@@ -0,0 +1,240 @@
+"""/**
+ * @author [Jai Miles]
+ * @email [jaimiles23@gmail.com]
+ * @create date 2026-10-18 10:41:05
+ * @modify date 2026-10-18 10:41:05
+ * @desc [
+    Pandas-free xlsx reader. Streams sheet rows with zipfile & iterparse.
+
+    Only supports what jobboard_info.xlsx uses: shared & inline strings,
+    numbers, and booleans. Anything else raises XlsxFormatError so the
+    caller can fall back to pandas.
+ ]
+ */
+"""
+
+##########
+# Imports
+##########
+
+import posixpath
+import zipfile
+from xml.etree.ElementTree import ParseError, iterparse
+
+from . import custom_errors
+from .script_objects import Any, Dict, Iterator, List, Union
+
+
+##########
+# Namespaces
+##########
+
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+TAG_ROW = NS_MAIN + 'row'
+TAG_CELL = NS_MAIN + 'c'
+TAG_VALUE = NS_MAIN + 'v'
+TAG_INLINE = NS_MAIN + 'is'
+TAG_TEXT = NS_MAIN + 't'
+TAG_SHARED_ITEM = NS_MAIN + 'si'
+TAG_SHEET = NS_MAIN + 'sheet'
+
+
+##########
+# Missing values
+##########
+
+## Strings read as missing, as pandas' read_excel does by default.
+NA_STRINGS = frozenset((
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+))
+
+
+##########
+# Reader
+##########
+
+class XlsxReader(object):
+    """Opens an xlsx workbook once and streams rows from its sheets."""
+
+    def __init__(self, filename: str):
+        """Opens the workbook & reads its sheet paths.
+
+        Args:
+            filename (str): xlsx workbook to read.
+        """
+        try:
+            self.zip = zipfile.ZipFile(filename)
+        except zipfile.BadZipFile as e:
+            raise custom_errors.XlsxFormatError(filename, e)
+        self.filename = filename
+        self.sheet_paths = self._read_sheet_paths()
+        self._shared_strings = None
+        return None
+
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the workbook."""
+        self.zip.close()
+
+
+    ##########
+    # Workbook parts
+    ##########
+    def _read_sheet_paths(self) -> Dict[str, str]:
+        """Returns {sheet name: path of sheet xml in the zip}."""
+        rel_targets = {}
+        with self.zip.open('xl/_rels/workbook.xml.rels') as f:
+            for _, elem in iterparse(f):
+                if elem.tag == NS_PKG_REL + 'Relationship':
+                    target = elem.get('Target')
+                    if target.startswith('/'):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join('xl', target))
+                    rel_targets[elem.get('Id')] = target
+
+        sheet_paths = {}
+        with self.zip.open('xl/workbook.xml') as f:
+            for _, elem in iterparse(f):
+                if elem.tag == TAG_SHEET:
+                    sheet_paths[elem.get('name')] = rel_targets[elem.get(NS_REL + 'id')]
+        return sheet_paths
+
+
+    @property
+    def shared_strings(self) -> List[str]:
+        """Shared strings table. Parsed once, on first use."""
+        if self._shared_strings is not None:
+            return self._shared_strings
+
+        self._shared_strings = []
+        if 'xl/sharedStrings.xml' not in self.zip.namelist():
+            return self._shared_strings
+
+        with self.zip.open('xl/sharedStrings.xml') as f:
+            for _, elem in iterparse(f):
+                if elem.tag == TAG_SHARED_ITEM:
+                    self._shared_strings.append(get_text(elem))
+                    elem.clear()
+        return self._shared_strings
+
+
+    ##########
+    # Rows
+    ##########
+    def iter_rows(self, sheetname: str) -> Iterator[List[Any]]:
+        """Yields the rows of a sheet as lists of cell values.
+
+        Args:
+            sheetname (str): sheet to read
+
+        Yields:
+            List[Any]: cell values; missing & empty cells are None.
+        """
+        if sheetname not in self.sheet_paths:
+            raise custom_errors.XlsxFormatError(self.filename, f"no sheet named {sheetname}")
+
+        shared_strings = self.shared_strings
+        try:
+            with self.zip.open(self.sheet_paths[sheetname]) as f:
+                for _, elem in iterparse(f):
+                    if elem.tag != TAG_ROW:
+                        continue
+
+                    row = []
+                    for cell in elem.iter(TAG_CELL):
+                        col = get_col_index(cell.get('r'), len(row))
+                        if col > len(row):
+                            row.extend([None] * (col - len(row)))
+                        row.append(get_cell_value(cell, shared_strings))
+                    elem.clear()
+                    yield row
+        except (ParseError, KeyError, ValueError, IndexError) as e:
+            raise custom_errors.XlsxFormatError(self.filename, e)
+
+
+    def read_columns(self, sheetname: str) -> Dict[str, List[Any]]:
+        """Returns the sheet as {header: column values}. First row is the header.
+
+        Args:
+            sheetname (str): sheet to read
+
+        Returns:
+            Dict[str, List[Any]]: column values for each header.
+        """
+        rows = self.iter_rows(sheetname)
+        header = next(rows, [])
+        columns = {h: [] for h in header if h is not None}
+        indices = [(i, h) for i, h in enumerate(header) if h is not None]
+
+        for row in rows:
+            if not any(val is not None for val in row):
+                continue
+            for i, h in indices:
+                columns[h].append(row[i] if i < len(row) else None)
+        return columns
+
+
+##########
+# Cells
+##########
+
+def get_text(elem) -> str:
+    """Returns text of an <si> or <is> element, joining rich text runs."""
+    return ''.join(t.text or '' for t in elem.iter(TAG_TEXT))
+
+
+def get_str(text: str) -> Union[str, None]:
+    """Returns text, or None if text is a missing value."""
+    return None if text in NA_STRINGS else text
+
+
+def get_col_index(ref: Union[str, None], default: int) -> int:
+    """Returns 0-based column index from a cell reference, e.g., 'C12' -> 2."""
+    if not ref:
+        return default
+
+    col = 0
+    for char in ref:
+        if not char.isalpha():
+            break
+        col = col * 26 + (ord(char.upper()) - 64)
+    return col - 1
+
+
+def get_cell_value(cell, shared_strings: List[str]) -> Any:
+    """Returns python value of a <c> element. Missing strings (NA_STRINGS) are None."""
+    cell_type = cell.get('t', 'n')
+
+    if cell_type == 'inlineStr':
+        inline = cell.find(TAG_INLINE)
+        return get_str(get_text(inline)) if inline is not None else None
+
+    v = cell.find(TAG_VALUE)
+    if v is None or v.text is None:
+        return None
+    text = v.text
+
+    if cell_type == 's':
+        return get_str(shared_strings[int(text)])
+    elif cell_type == 'str':
+        return get_str(text)
+    elif cell_type == 'e':
+        return None
+    elif cell_type == 'b':
+        return text == '1'
+    elif cell_type == 'n':
+        num = float(text)
+        return int(num) if num.is_integer() else num
+
+    raise ValueError(f"unsupported cell type: {cell_type}")
@@ -4,7 +4,7 @@
  * @author [Jai Miles]
  * @email [jaimiles23@gmail.com]
  * @create date 2020-09-29 16:00:33
- * @modify date 2020-10-03 17:32:30
+ * @modify date 2026-10-18 23:14:05
  * @desc [
     Contains data for job websites of interest.
  ]
@@ -15,15 +15,20 @@
 # Imports
 ##########
 
+import os
 import sys
-import pandas as pd
 
-from j_script import (constants, custom_errors, df_methods,
-                         jobboard_list, locations)
+from j_script import (constants, custom_errors, jobboard_list,
+                         record_methods)
 from j_script.queue_methods import QueueMethods
 from j_script.class_jobboard import JobBoard
+from j_script.geo_index import GeoIndex
+from j_script.launchpad import Launchpad
+from j_script.markdown_table import MarkdownTable
+from j_script.scheduler import SCHEDULERS, Scheduler, WindowScheduler
 from j_script.tableinfo import TableInfo
-from j_script.script_objects import Tuple
+from j_script.url_opener import UrlOpener
+from j_script.script_objects import Dict, List, Tuple, Union
 from j_script import constants
 
 
@@ -37,11 +42,18 @@ def main():
     Opens jobsite URLS.
         1. Manage jobboard attr options
 		2. Load and clean jobsite jobsite data frame
-		3. Creates jobsite instances from dataframe
-        4. Sort queue to match jobboards.
+		3. Clean queue to match jobsite ids
+		4. Creates jobsite instances in queue order, lazily unless all are needed
         5. Opens jobsites
         6. Save new job queue
 	"""
+    ##### Import profile
+    if "--import-profile" in sys.argv:
+        from j_script import import_profile
+        import_profile.print_import_profile(cwd= os.path.dirname(os.path.abspath(__file__)))
+        return
+
+
     ##### System Arguments
     """
     Allows users to pass options through the Run Dialog box (win + r).
@@ -67,13 +79,22 @@ def main():
         options = {key: True for key in available_options}
     for k, v in options.items():
         setattr(JobBoard, k, v)
+
+    ## Only open boards in regions, e.g., --region=California or --region="United States/New York"
+    regions = [a.split('=', 1)[1] for a in sys.argv if a.startswith("--region=")]
+    flag_locations = len(regions) > 0
+
+    ## Catalog & queue in the SQLite store
+    if "sqlite" in sys.argv:
+        main_sqlite(options, regions)
+        return
     
     
     ##### Steps conducted
     steps = {
         1   :   "Load & Clean Jobboard Dataframe",
-        2   :   "Create Jobboard Instances from Dataframe",
-        3   :   "Clean QueueMethods",
+        2   :   "Clean QueueMethods",
+        3   :   "Create Jobboard Instances from Dataframe",
         4   :   "Sort Jobboards to Match Queue",
         5   :   "Open Jobboards in Queue",
         6   :   "Print results & write to table.",
@@ -83,67 +104,308 @@ def main():
     header = '>' * 3
 
 
+    ##### Load queue
+    try:
+        JobBoard.job_queue = QueueMethods.load_queue()
+    except custom_errors.QueueFileError as e:
+        print(f"- {e}")
+        return
+
     ##### 1
-    print(header, steps[1])
-    df_jobsites = df_methods.get_df_jobboards()
+    ## Built-in xlsx reader, pandas as fallback. Option "pandas" skips the built-in reader.
+    columns_jobsites = None
+    geo_index = None    # loaded with the columns, else built for --region
+    delta = None        # boards changed since the previous run, None if unknown
+    snapshot = None     # saved last, so a run interrupted before the MarkDown file & queue are saved is redone
+    if "pandas" not in sys.argv:
+        try:
+            print(header, steps[1])
+            columns_jobsites, location_table, geo_index, delta, snapshot = record_methods.load_columns_jobboards(
+                flag_locations= flag_locations)
+            if delta:
+                print(f"- {delta}")
+        except custom_errors.XlsxFormatError as e:
+            print(f"- {e}")
+            print("- Falling back to pandas")
+
+    if columns_jobsites is None:
+        from j_script import df_methods
+
+        print(header, steps[1])
+        df_jobsites, location_table = df_methods.get_df_jobboards(flag_locations= flag_locations)
+        columns_jobsites = jobboard_list.get_columns(df_jobsites)
+    jobboard_ids = columns_jobsites[constants.COL_ID]
+
+    ## Region filter
+    if regions:
+        if geo_index is None:
+            geo_index = GeoIndex(location_table, zip(jobboard_ids, columns_jobsites[constants.COL_LOCATIONS]))
+        JobBoard.region_boards = set()
+        for region in regions:
+            region_boards = geo_index.boards_in(region)
+            print(f"- {len(region_boards)} jobboards in {region}")
+            JobBoard.region_boards.update(region_boards)
 
     ##### 2
     print(header, steps[2])
-    all_jobboards = jobboard_list.create_jobboard_instances(df_jobsites)
+    JobBoard.job_queue = QueueMethods.clean_queue_ids(JobBoard.job_queue, jobboard_ids, delta)
+
+    ##### 3 & 4
+    ## Boards are created as the open loop or the --scheduler policy reaches them, unless --knapsack,
+    ## or select_boards() for a large filtered catalog, needs every board
+    scheduler = get_scheduler(option_jobboardattr)
+    knapsack_objective = get_knapsack_objective()
+    flag_select_arrays = scheduler is None and (knapsack_objective is not None or (
+        JobBoard.is_queue_filtered(option_jobboardattr) and len(jobboard_ids) >= get_select_arrays_min_boards()))
+    flag_stream = scheduler is None and not flag_select_arrays
 
-    ##### 3
     print(header, steps[3])
-    JobBoard.job_queue = QueueMethods.clean_queue(JobBoard.job_queue, all_jobboards)
+    if flag_stream:
+        all_jobboards = jobboard_list.iter_jobboards_in_queue(columns_jobsites, JobBoard.job_queue)
+    elif scheduler is not None:
+        all_jobboards = jobboard_list.JobBoardRows(columns_jobsites)      # created as the scheduler pops them
+    else:
+        all_jobboards = jobboard_list.create_jobboard_instances_from_columns(columns_jobsites)
 
-    ##### 4
-    print(header, steps[4])
-    all_jobboards = sorted(all_jobboards, key = lambda x: JobBoard.job_queue.index(x.ident))
+        print(header, steps[4])
+        QueueMethods.set_Q_indices(JobBoard.job_queue, all_jobboards)
+        all_jobboards = sorted(all_jobboards, key = lambda x: x.Q_index)
 
 
     ##### 5
     print(header, steps[5])
 
     ## Check if provided numbers of sites to open.
-    num_to_open = constants.MAX_SITES_TO_OPEN
-    for a in sys.argv:
-        try:
-            num_to_open = int(a)
-        except:
-            pass
-    JobBoard.MAX_SITES_TO_OPEN = num_to_open
+    JobBoard.MAX_SITES_TO_OPEN = get_num_to_open()
+
+
+    ## Skip boards whose urls are all dead in the url cache. Option "check-urls" probes urls not checked within URL_CACHE_TTL.
+    ## UrlChecker loads asyncio & ssl, so it is only imported if there is a cache or "check-urls" is passed.
+    if "check-urls" in sys.argv or os.path.exists(constants.FILENAME_URL_CACHE):
+        from j_script.url_checker import UrlChecker
+        JobBoard.url_checker = UrlChecker()
+    if "check-urls" in sys.argv:
+        check_report = JobBoard.url_checker.check(url for urls in columns_jobsites[constants.COL_URLS] for url in urls)
+        print(f"- {check_report}")
 
+    ## Option "changed": only open organizations whose pages changed since they were last opened
+    if "changed" in sys.argv:
+        from j_script.page_watcher import PageWatcher
+        JobBoard.page_watcher = PageWatcher()
+        fetch_report = JobBoard.page_watcher.fetch(
+            url for urls, organization in zip(columns_jobsites[constants.COL_URLS], columns_jobsites[constants.COL_ORG])
+            if organization for url in urls)
+        print(f"- {fetch_report}")
 
     ## Create Table objects to store attr info
     tbl_print = TableInfo( JobBoard.attrs_to_print)
     
-    ## Open sites
-    for jobboard in all_jobboards:
-        jobboard.open_websites(option_jobboardattr)
-        tbl_print.add_entry(jobboard, user_object=True)
-    
+    ## Open sites on the opener pool, chosen by open_websites(), select_boards() for large filtered catalogs, --knapsack,
+    ## or the --scheduler policy
+    JobBoard.url_opener = get_url_opener()
+    if flag_select_arrays:
+        from j_script.selection import BoardArrays, select_boards, select_boards_knapsack
+        select_kwargs = dict(
+            excluded= tuple(i_attr for c_attr, i_attr in option_jobboardattr if getattr(JobBoard, c_attr) == False),
+            region_boards= JobBoard.region_boards,
+            full_queue= JobBoard.is_queue_filtered(option_jobboardattr),
+            is_allowed= lambda row: all_jobboards[row].is_allowed(option_jobboardattr),
+        )
+        if knapsack_objective is not None:
+            select_kwargs['objective'] = knapsack_objective
+        selection = (select_boards if knapsack_objective is None else select_boards_knapsack)(
+            BoardArrays.from_jobboards(all_jobboards),
+            JobBoard.MAX_SITES_TO_OPEN,
+            len(JobBoard.job_queue),
+            **select_kwargs
+        )
+        for row in selection.opened.tolist():
+            all_jobboards[row].open()
+        for jobboard, flag_opened in zip(all_jobboards, selection.flags.tolist()):
+            jobboard.flag_opened = flag_opened
+            tbl_print.add_entry(jobboard, user_object=True)
+        JobBoard.sites_opened = selection.sites_opened
+    elif flag_stream:
+        for jobboard in all_jobboards:
+            jobboard.open_websites(option_jobboardattr)
+            tbl_print.add_entry(jobboard, user_object=True)
+            if JobBoard.sites_opened == JobBoard.MAX_SITES_TO_OPEN:
+                break       # no board after it can open, so the rest aren't created
+    else:
+        scheduler.update(JobBoard.job_queue, all_jobboards, delta)
+        for jobboard in scheduler.select(JobBoard.MAX_SITES_TO_OPEN, lambda jobboard: jobboard.is_allowed(option_jobboardattr)):
+            jobboard.flag_opened = True
+            JobBoard.sites_opened += len(jobboard.urls)
+            jobboard.open()
+            tbl_print.add_entry(jobboard, user_object=True)
+        scheduler.save()
+    open_report = JobBoard.url_opener.wait()
+    if JobBoard.page_watcher is not None:
+        JobBoard.page_watcher.save()
+
 
     ##### 6
     print(header, steps[6])
 
     tbl_print.print_info(show_records_col= False)
     JobBoard.print_num_opened_sites()
+    print(f"\t- {open_report}")
 
     ##### 7
     print(header, steps[7])
-    tbl_md = TableInfo( JobBoard.attrs_for_md)
-
-    all_jobboards = sorted(all_jobboards, key = lambda x: x.name)
-    for jobboard in all_jobboards:
-        tbl_md.add_entry(jobboard, user_object=True)
-
-    tbl_md.print_info(
-        markdown= True,
-        md_filename= constants.FILENAME_MD
-    )
+    if delta is None or delta or not os.path.exists(constants.FILENAME_MD):
+        md_table = MarkdownTable.load(JobBoard.attrs_for_md, constants.FILENAME_MD)
+        if not flag_select_arrays:
+            all_jobboards = jobboard_list.iter_jobboards_in_queue(columns_jobsites, JobBoard.job_queue)
+        md_table.update(
+            (jobboard.ident, tuple(getattr(jobboard, attr) for attr in JobBoard.attrs_for_md))
+            for jobboard in all_jobboards
+        )
+        print(f"- MarkDown file {md_table.write()}")
+    else:
+        print("- No jobboards changed, MarkDown file is up to date")
 
     ##### 8
     print(header, steps[8])
     QueueMethods.save_queue( JobBoard.job_queue, JobBoard.used_jobsites)
+    record_methods.save_snapshot(snapshot)
+
+
+def main_sqlite(options: Dict[str, bool], regions: List[str]) -> None:
+    """
+    Opens jobsite URLS from the SQLite store.
+        1. Import workbook to store, if it changed
+        2. Select jobboards in queue order
+        3. Open jobsites & move them to the back of the queue
+        4. Save to MarkDown file, if the workbook changed
+
+    Args:
+        options (Dict[str, bool]): boards/orgs options
+        regions (List[str]): --region filters
+    """
+    from j_script.snapshot_cache import SnapshotCache
+    from j_script.sqlite_store import SQLiteStore
+    header = '>' * 3
+
+    with SQLiteStore(constants.FILENAME_DB) as store:
+        ##### 1
+        print(header, "Update SQLite Store")
+        flag_changed = False
+        workbook_key = SnapshotCache.get_key(constants.FILENAME_JOBBOARDS)
+        if not store.is_current(workbook_key):
+            try:
+                columns_jobsites, location_table, _ = record_methods.get_columns_jobboards(constants.FILENAME_JOBBOARDS)
+            except custom_errors.XlsxFormatError as e:
+                print(f"- {e}")
+                print("- Falling back to pandas")
+                from j_script import df_methods
+                df_jobsites, location_table = df_methods.get_df_jobboards(constants.FILENAME_JOBBOARDS)
+                columns_jobsites = jobboard_list.get_columns(df_jobsites)
+
+            saved_queue = QueueMethods.load_queue() if store.count_queue() == 0 else ()
+            added, changed, removed = store.import_columns(columns_jobsites, location_table, workbook_key, saved_queue)
+            print(f"- {added} jobboards added, {changed} changed, {removed} removed")
+            flag_changed = bool(added or changed or removed)
+
+        ##### 2
+        print(header, "Select Jobboards in Queue")
+        region_boards = None
+        if regions:
+            region_boards = set()
+            for region in regions:
+                boards = store.get_region_boards(region)
+                print(f"- {len(boards)} jobboards in {region}")
+                region_boards.update(boards)
+        selected = store.select_boards_to_open(get_num_to_open(), options, region_boards)
+
+        ##### 3
+        print(header, "Open Jobboards in Queue")
+        tbl_print = TableInfo(('ident', 'name', 'Q_index'))
+        with get_url_opener() as url_opener:
+            for ident, name, Q_index, urls in selected:
+                url_opener.submit_jobboard(name, urls)
+                tbl_print.add_entry((ident, name, Q_index))
+        store.move_to_back([ident for ident, *_ in selected])
+
+        tbl_print.print_info(show_records_col= False)
+        print(f"\t- Opened {sum(len(urls) for *_, urls in selected)} sites")
+        print(f"\t- {url_opener.report}")
+
+        ##### 4
+        if flag_changed:
+            print(header, "Save to MarkDown file.")
+            tbl_md = TableInfo( JobBoard.attrs_for_md)
+            for name, urls, description in store.iter_markdown_rows():
+                tbl_md.add_entry((name, JobBoard.get_url_nums(urls), description))
+            tbl_md.print_info(
+                markdown= True,
+                md_filename= constants.FILENAME_MD
+            )
+    return
+
+
+def get_num_to_open() -> int:
+    """Returns number of sites to open, passed as an argument, or MAX_SITES_TO_OPEN."""
+    num_to_open = constants.MAX_SITES_TO_OPEN
+    for a in sys.argv:
+        try:
+            num_to_open = int(a)
+        except:
+            pass
+    return num_to_open
+
+
+def get_scheduler(option_jobboardattr: Tuple[ Tuple[ str, str]]) -> Union[Scheduler, None]:
+    """Returns scheduling policy passed as --scheduler=window|stride|due, or None to use JobBoard.open_websites()."""
+    for a in sys.argv:
+        if not a.startswith("--scheduler="):
+            continue
+        name = a.split('=', 1)[1]
+        if name == WindowScheduler.name:
+            return WindowScheduler(full_queue= JobBoard.is_queue_filtered(option_jobboardattr))
+        elif name in SCHEDULERS:
+            return SCHEDULERS[name].load()
+        print(f"- Ignored {a}, schedulers are {', '.join(SCHEDULERS)}")
+    return None
+
+
+def get_knapsack_objective() -> Union[str, None]:
+    """Returns objective passed as --knapsack (overdue) or --knapsack=overdue|priority, or None to fill the url budget first-fit."""
+    for a in sys.argv:
+        if a != "--knapsack" and not a.startswith("--knapsack="):
+            continue
+        from j_script.selection import OBJECTIVE_OVERDUE, OBJECTIVES
+        objective = a.split('=', 1)[1] if '=' in a else OBJECTIVE_OVERDUE
+        if objective in OBJECTIVES:
+            return objective
+        print(f"- Ignored {a}, objectives are {', '.join(OBJECTIVES)}")
+    return None
+
+
+def get_select_arrays_min_boards() -> int:
+    """Returns number of boards from which select_boards() is faster than open_websites() on every board."""
+    if "numpy" in sys.modules:
+        return constants.SELECT_ARRAYS_MIN_BOARDS_NUMPY
+    return constants.SELECT_ARRAYS_MIN_BOARDS
+
+
+def get_url_opener() -> UrlOpener:
+    """Returns url opener, with --workers=N & --spacing=SECONDS if passed as arguments.
+    Option "launchpad" returns a Launchpad instead, which opens every tab on load with --auto-open.
+    """
+    if "launchpad" in sys.argv:
+        return Launchpad(auto_open= "--auto-open" in sys.argv)
+
+    max_workers, spacing = None, None
+    for a in sys.argv:
+        try:
+            if a.startswith("--workers="):
+                max_workers = int(a.split('=', 1)[1])
+            elif a.startswith("--spacing="):
+                spacing = float(a.split('=', 1)[1])
+        except ValueError:
+            print(f"- Ignored {a}")
+    return UrlOpener(max_workers= max_workers, spacing= spacing)
 
 
 ## Main